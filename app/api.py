@@ -0,0 +1,57 @@
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.data import export, metrics
+from app.data.repository import MAINTENANCE_FIELDS, TENANT_FIELDS, UNIT_FIELDS
+
+UNIT_FILTERS = ("All", "Paid", "Overdue", "Vacant", "Archived")
+MAINTENANCE_FILTERS = ("All", "Open", "In Progress", "Completed")
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+}
+EXPORTS = {
+    "units": (export.unit_rows, UNIT_FIELDS, UNIT_FILTERS),
+    "tenants": (lambda status: export.tenant_rows(), TENANT_FIELDS, ("All",)),
+    "maintenance": (export.maintenance_rows, MAINTENANCE_FIELDS, MAINTENANCE_FILTERS),
+}
+
+
+async def export_endpoint(request: Request) -> Response:
+    kind = request.path_params["kind"]
+    fmt = request.path_params["fmt"]
+    if fmt not in EXPORT_FORMATS:
+        return PlainTextResponse(f"Unsupported format: {fmt}", status_code=404)
+    if kind not in EXPORTS:
+        return PlainTextResponse(f"Unknown export: {kind}", status_code=404)
+    rows_for, fields, filters = EXPORTS[kind]
+    status = request.query_params.get("status", "All")
+    if status not in filters:
+        return PlainTextResponse(f"Unknown {kind} filter: {status}", status_code=400)
+    rows = rows_for(status)
+    body = export.to_csv(rows, fields) if fmt == "csv" else export.to_json_lines(rows)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{kind}.{fmt}"'},
+    )
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    if not metrics.METRICS_ENABLED:
+        return PlainTextResponse(
+            "Metrics are disabled; set PROPMANAGE_METRICS=1", status_code=404
+        )
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+api = Starlette(
+    routes=[
+        Route("/api/export/{kind}.{fmt}", export_endpoint),
+        Route("/metrics", metrics_endpoint),
+    ]
+)
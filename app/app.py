@@ -1,31 +1,49 @@
 import reflex as rx
-from app.states.state import PropertyManagementState
-from app.components.sidebar import sidebar
+
+from app.api import api
 from app.components.dashboard import dashboard_content
-from app.components.units import units_content
-from app.components.tenants import tenants_content
 from app.components.maintenance import maintenance_content
+from app.components.metrics import metrics_content
+from app.components.sidebar import section_events, sidebar
+from app.components.tenants import tenants_content
+from app.components.units import units_content
+from app.data import metrics
+from app.states.metrics import MetricsMiddleware, MetricsState
 
 
-def index() -> rx.Component:
+def layout(content: rx.Component) -> rx.Component:
     return rx.el.div(
         sidebar(),
         rx.el.main(
-            rx.match(
-                PropertyManagementState.active_section,
-                ("dashboard", dashboard_content()),
-                ("units", units_content()),
-                ("tenants", tenants_content()),
-                ("maintenance", maintenance_content()),
-                rx.el.div("Select a section"),
-            ),
+            content,
             class_name="flex-1 h-screen overflow-y-auto bg-gray-50",
         ),
         class_name="flex font-['Lato'] bg-white text-gray-800",
     )
 
 
+def index() -> rx.Component:
+    return layout(dashboard_content())
+
+
+def units_page() -> rx.Component:
+    return layout(units_content())
+
+
+def tenants_page() -> rx.Component:
+    return layout(tenants_content())
+
+
+def maintenance_page() -> rx.Component:
+    return layout(maintenance_content())
+
+
+def metrics_page() -> rx.Component:
+    return layout(metrics_content())
+
+
 app = rx.App(
+    api_transformer=api,
     theme=rx.theme(appearance="light"),
     head_components=[
         rx.el.link(rel="preconnect", href="https://fonts.googleapis.com"),
@@ -36,4 +54,12 @@ app = rx.App(
         ),
     ],
 )
-app.add_page(index)
\ No newline at end of file
+app.add_page(index, on_load=section_events("dashboard"))
+app.add_page(units_page, route="/units", on_load=section_events("units"))
+app.add_page(tenants_page, route="/tenants", on_load=section_events("tenants"))
+app.add_page(
+    maintenance_page, route="/maintenance", on_load=section_events("maintenance")
+)
+if metrics.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware())
+    app.add_page(metrics_page, route="/admin/metrics", on_load=MetricsState.refresh)
@@ -1,8 +1,20 @@
 import reflex as rx
-from app.states.state import PropertyManagementState, Property
 
+from app.data.lease_expiry import EXPIRY_WINDOWS
+from app.states.dashboard import (
+    AgingBucket,
+    DashboardState,
+    LeaseRenewal,
+    LeaseWindow,
+    Property,
+    RenewalPipelineRow,
+    RentRollRow,
+)
 
-def metric_card(icon: str, title: str, value: rx.Var, color: str) -> rx.Component:
+
+def metric_card(
+    icon: str, title: str, value: rx.Var, color: str, detail: rx.Var | None = None
+) -> rx.Component:
     return rx.el.div(
         rx.el.div(
             rx.icon(icon, size=24, class_name=f"text-{color}-500"),
@@ -11,13 +23,15 @@ def metric_card(icon: str, title: str, value: rx.Var, color: str) -> rx.Componen
         rx.el.div(
             rx.el.p(title, class_name="text-sm font-medium text-gray-500"),
             rx.el.h4(value, class_name="text-2xl font-bold"),
+            rx.el.p(detail, class_name="text-xs text-gray-500") if detail else None,
             class_name="flex flex-col",
         ),
         class_name="flex items-center gap-4 p-4 bg-white border border-gray-200 rounded-xl shadow-sm",
     )
 
 
-def property_status_badge(status: rx.Var) -> rx.Component:
+@rx.memo
+def property_status_badge(status: rx.Var[str]) -> rx.Component:
     return rx.match(
         status,
         (
@@ -45,7 +59,8 @@ def property_status_badge(status: rx.Var) -> rx.Component:
     )
 
 
-def property_card(property: Property) -> rx.Component:
+@rx.memo
+def property_card(property: rx.Var[Property]) -> rx.Component:
     return rx.el.div(
         rx.image(
             src=property["image_url"],
@@ -56,14 +71,14 @@ def property_card(property: Property) -> rx.Component:
         rx.el.div(
             rx.el.div(
                 rx.el.h3(property["name"], class_name="font-semibold text-lg"),
-                property_status_badge(property["status"]),
+                property_status_badge(status=property["status"]),
                 class_name="flex justify-between items-start",
             ),
             rx.el.p(property["address"], class_name="text-sm text-gray-500"),
             rx.el.div(
                 rx.icon("users", size=14, class_name="text-gray-500"),
                 rx.el.p(
-                    f"{property['occupancy'][0]}/{property['occupancy'][1]} Units Occupied",
+                    f"{property['occupied_units']}/{property['total_units']} Units Occupied",
                     class_name="text-sm text-gray-600",
                 ),
                 class_name="flex items-center gap-2 mt-2",
@@ -74,6 +89,186 @@ def property_card(property: Property) -> rx.Component:
     )
 
 
+def rent_roll_row(row: RentRollRow) -> rx.Component:
+    return rx.el.tr(
+        rx.el.td(row["property_name"], class_name="px-4 py-2 font-medium"),
+        rx.el.td(
+            f"${row['collected'].to_string()}", class_name="px-4 py-2 text-green-700"
+        ),
+        rx.el.td(f"${row['overdue'].to_string()}", class_name="px-4 py-2 text-red-700"),
+        rx.el.td(f"${row['vacant'].to_string()}", class_name="px-4 py-2 text-gray-500"),
+        class_name="border-t border-gray-100",
+    )
+
+
+def rent_roll_table() -> rx.Component:
+    return rx.el.div(
+        rx.el.table(
+            rx.el.thead(
+                rx.el.tr(
+                    rx.el.th("Property", class_name="px-4 py-2 text-left"),
+                    rx.el.th("Collected", class_name="px-4 py-2 text-left"),
+                    rx.el.th("Overdue", class_name="px-4 py-2 text-left"),
+                    rx.el.th("Vacant (potential)", class_name="px-4 py-2 text-left"),
+                    class_name="text-xs font-medium text-gray-500 uppercase",
+                )
+            ),
+            rx.el.tbody(rx.foreach(DashboardState.rent_roll, rent_roll_row)),
+            class_name="w-full text-sm",
+        ),
+        class_name="bg-white border border-gray-200 rounded-xl shadow-sm overflow-x-auto mb-8",
+    )
+
+
+def lease_window_card(window: LeaseWindow) -> rx.Component:
+    return rx.el.div(
+        rx.el.p(
+            f"Expiring in {window['days']} days",
+            class_name="text-sm font-medium text-gray-500",
+        ),
+        rx.el.h4(window["units"], class_name="text-2xl font-bold"),
+        class_name="p-4 bg-white border border-gray-200 rounded-xl shadow-sm",
+    )
+
+
+def renewal_pipeline_row(row: RenewalPipelineRow) -> rx.Component:
+    return rx.el.tr(
+        rx.el.td(row["property_name"], class_name="px-4 py-2 font-medium"),
+        rx.foreach(
+            row["counts"], lambda count: rx.el.td(count, class_name="px-4 py-2")
+        ),
+        class_name="border-t border-gray-100",
+    )
+
+
+def upcoming_renewal_row(renewal: LeaseRenewal) -> rx.Component:
+    return rx.el.tr(
+        rx.el.td(
+            f"{renewal['property_name']} {renewal['unit_number']}",
+            class_name="px-4 py-2 font-medium",
+        ),
+        rx.el.td(renewal["tenant_name"].to_string(), class_name="px-4 py-2"),
+        rx.el.td(renewal["lease_end"], class_name="px-4 py-2"),
+        rx.el.td(f"{renewal['days_left']} days", class_name="px-4 py-2 text-gray-500"),
+        class_name="border-t border-gray-100",
+    )
+
+
+def lease_renewals() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.foreach(DashboardState.lease_windows, lease_window_card),
+            class_name="grid grid-cols-1 md:grid-cols-3 gap-6 mb-6",
+        ),
+        rx.el.div(
+            rx.el.div(
+                rx.el.table(
+                    rx.el.thead(
+                        rx.el.tr(
+                            rx.el.th("Property", class_name="px-4 py-2 text-left"),
+                            *[
+                                rx.el.th(
+                                    f"≤ {days} days", class_name="px-4 py-2 text-left"
+                                )
+                                for days in EXPIRY_WINDOWS
+                            ],
+                            class_name="text-xs font-medium text-gray-500 uppercase",
+                        )
+                    ),
+                    rx.el.tbody(
+                        rx.foreach(
+                            DashboardState.renewal_pipeline, renewal_pipeline_row
+                        )
+                    ),
+                    class_name="w-full text-sm",
+                ),
+                class_name="bg-white border border-gray-200 rounded-xl shadow-sm overflow-x-auto",
+            ),
+            rx.el.div(
+                rx.el.table(
+                    rx.el.thead(
+                        rx.el.tr(
+                            rx.el.th("Unit", class_name="px-4 py-2 text-left"),
+                            rx.el.th("Tenant", class_name="px-4 py-2 text-left"),
+                            rx.el.th("Lease End", class_name="px-4 py-2 text-left"),
+                            rx.el.th("Remaining", class_name="px-4 py-2 text-left"),
+                            class_name="text-xs font-medium text-gray-500 uppercase",
+                        )
+                    ),
+                    rx.el.tbody(
+                        rx.foreach(
+                            DashboardState.upcoming_renewals, upcoming_renewal_row
+                        )
+                    ),
+                    class_name="w-full text-sm",
+                ),
+                class_name="bg-white border border-gray-200 rounded-xl shadow-sm overflow-x-auto",
+            ),
+            class_name="grid grid-cols-1 xl:grid-cols-2 gap-6",
+        ),
+        class_name="mb-8",
+    )
+
+
+def aging_bucket_card(bucket: AgingBucket) -> rx.Component:
+    return rx.el.div(
+        rx.el.p(
+            f"{bucket['label']} days overdue",
+            class_name="text-sm font-medium text-gray-500",
+        ),
+        rx.el.h4(f"${bucket['amount'].to_string()}", class_name="text-2xl font-bold"),
+        rx.el.p(f"{bucket['units']} units", class_name="text-xs text-gray-500"),
+        class_name="p-4 bg-white border border-gray-200 rounded-xl shadow-sm",
+    )
+
+
+def billing_progress() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.el.p(
+                f"Billing {DashboardState.billing_period}...",
+                class_name="text-sm font-medium",
+            ),
+            rx.el.button(
+                "Cancel",
+                on_click=DashboardState.cancel_billing,
+                class_name="text-sm text-red-600 hover:underline",
+            ),
+            class_name="flex justify-between items-center",
+        ),
+        rx.el.div(
+            rx.el.div(
+                class_name="h-2 bg-purple-600 rounded-full transition-all",
+                style={"width": f"{DashboardState.billing_progress}%"},
+            ),
+            class_name="mt-2 h-2 bg-gray-200 rounded-full overflow-hidden",
+        ),
+        class_name="mb-4 p-3 rounded-lg bg-gray-50 border border-gray-200",
+    )
+
+
+def rent_aging() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.el.h2("Rent Aging", class_name="text-2xl font-bold"),
+            rx.el.button(
+                rx.icon("receipt", size=16, class_name="mr-2"),
+                f"Run Billing for {DashboardState.billing_period}",
+                on_click=DashboardState.run_billing,
+                disabled=DashboardState.billing_running,
+                class_name="flex items-center px-4 py-2 bg-purple-600 text-white rounded-lg text-sm font-medium hover:bg-purple-700 disabled:opacity-50",
+            ),
+            class_name="flex justify-between items-center mb-4",
+        ),
+        rx.cond(DashboardState.billing_running, billing_progress()),
+        rx.el.div(
+            rx.foreach(DashboardState.rent_aging, aging_bucket_card),
+            class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6",
+        ),
+        class_name="mb-8",
+    )
+
+
 def dashboard_content() -> rx.Component:
     return rx.el.div(
         rx.el.h1("Dashboard", class_name="text-3xl font-bold mb-6"),
@@ -81,27 +276,42 @@ def dashboard_content() -> rx.Component:
             metric_card(
                 "building",
                 "Occupancy Rate",
-                f"{PropertyManagementState.occupancy_rate.to_string()}%",
+                f"{DashboardState.occupancy_rate.to_string()}%",
                 "purple",
             ),
             metric_card(
                 "dollar-sign",
                 "Monthly Income",
-                f"${PropertyManagementState.monthly_income.to_string()}",
+                f"${DashboardState.monthly_income.to_string()}",
                 "green",
+                f"${DashboardState.collected_income.to_string()} collected, ${DashboardState.overdue_income.to_string()} overdue",
             ),
             metric_card(
                 "wrench",
                 "Upcoming Maintenance",
-                PropertyManagementState.upcoming_maintenance,
+                DashboardState.upcoming_maintenance,
                 "orange",
             ),
-            class_name="grid grid-cols-1 md:grid-cols-3 gap-6 mb-8",
+            metric_card(
+                "badge_alert",
+                "Overdue Rent",
+                DashboardState.overdue_units,
+                "red",
+            ),
+            class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8",
         ),
+        rx.el.h2("Rent Roll", class_name="text-2xl font-bold mb-4"),
+        rent_roll_table(),
+        rent_aging(),
+        rx.el.h2("Lease Renewals", class_name="text-2xl font-bold mb-4"),
+        lease_renewals(),
         rx.el.h2("Properties Overview", class_name="text-2xl font-bold mb-4"),
         rx.el.div(
-            rx.foreach(PropertyManagementState.properties, property_card),
+            rx.foreach(
+                DashboardState.properties,
+                lambda property: property_card(property=property),
+            ),
             class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6",
         ),
         class_name="p-6",
-    )
\ No newline at end of file
+    )
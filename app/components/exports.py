@@ -0,0 +1,19 @@
+import reflex as rx
+
+
+def export_links(kind: str, status: rx.Var[str] | str = "All") -> rx.Component:
+    base = f"{rx.config.get_config().api_url}/api/export/{kind}"
+    return rx.el.div(
+        rx.icon("download", size=16, class_name="text-gray-400"),
+        rx.el.a(
+            "CSV",
+            href=f"{base}.csv?status={status}",
+            class_name="text-sm font-medium text-purple-600 hover:text-purple-800",
+        ),
+        rx.el.a(
+            "JSONL",
+            href=f"{base}.jsonl?status={status}",
+            class_name="text-sm font-medium text-purple-600 hover:text-purple-800",
+        ),
+        class_name="flex items-center gap-2 px-2",
+    )
@@ -0,0 +1,127 @@
+import reflex as rx
+
+from app.states.imports import ImportRowError, ImportState
+
+
+def import_error_row(error: ImportRowError) -> rx.Component:
+    return rx.el.li(
+        rx.el.span(f"Line {error['line']}", class_name="font-medium text-gray-700"),
+        rx.el.span(error["message"], class_name="text-gray-500"),
+        class_name="flex gap-2 text-sm",
+    )
+
+
+def import_progress() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.el.p(
+                f"Importing... {ImportState.imported_rows} imported,"
+                f" {ImportState.failed_rows} failed",
+                class_name="text-sm font-medium",
+            ),
+            rx.el.button(
+                "Cancel",
+                on_click=ImportState.cancel_import,
+                class_name="text-sm text-red-600 hover:underline",
+            ),
+            class_name="flex justify-between items-center",
+        ),
+        rx.el.div(
+            rx.el.div(
+                class_name="h-2 bg-purple-600 rounded-full transition-all",
+                style={"width": f"{ImportState.import_progress}%"},
+            ),
+            class_name="mt-2 h-2 bg-gray-200 rounded-full overflow-hidden",
+        ),
+        class_name="mt-4 p-3 rounded-lg bg-gray-50 border border-gray-200",
+    )
+
+
+def import_report() -> rx.Component:
+    return rx.cond(
+        ImportState.import_running,
+        import_progress(),
+        rx.cond(
+            ImportState.import_finished,
+            rx.el.div(
+                rx.el.p(
+                    f"{ImportState.imported_rows} imported, {ImportState.failed_rows} failed",
+                    class_name="font-medium",
+                ),
+                rx.el.ul(
+                    rx.foreach(ImportState.import_errors, import_error_row),
+                    class_name="mt-2 max-h-48 overflow-y-auto flex flex-col gap-1",
+                ),
+                rx.cond(
+                    ImportState.more_import_errors > 0,
+                    rx.el.p(
+                        f"... and {ImportState.more_import_errors} more errors",
+                        class_name="text-sm text-gray-500 mt-1",
+                    ),
+                ),
+                class_name="mt-4 p-3 rounded-lg bg-gray-50 border border-gray-200",
+            ),
+        ),
+    )
+
+
+def import_dialog(
+    title: str, upload_id: str, columns: str, handler: rx.event.EventHandler
+) -> rx.Component:
+    return rx.radix.primitives.dialog.root(
+        rx.radix.primitives.dialog.trigger(
+            rx.el.button(
+                rx.icon("upload", size=16, class_name="mr-2"),
+                "Import",
+                on_click=ImportState.reset_import,
+                class_name="flex items-center bg-white text-purple-700 border border-purple-200 px-4 py-2 rounded-lg font-medium hover:bg-purple-50 transition-colors",
+            )
+        ),
+        rx.radix.primitives.dialog.content(
+            rx.radix.primitives.dialog.title(title),
+            rx.el.p(
+                f"Upload a CSV file with a header row, or JSON Lines, with columns: {columns}.",
+                class_name="text-sm text-gray-500 mt-1 mb-4",
+            ),
+            rx.upload.root(
+                rx.el.div(
+                    rx.icon("file-up", size=24, class_name="text-gray-400"),
+                    rx.cond(
+                        rx.selected_files(upload_id).length() > 0,
+                        rx.el.p(
+                            rx.selected_files(upload_id)[0],
+                            class_name="text-sm font-medium",
+                        ),
+                        rx.el.p(
+                            "Drop a file here or click to choose",
+                            class_name="text-sm text-gray-500",
+                        ),
+                    ),
+                    class_name="flex flex-col items-center gap-2 p-6 border-2 border-dashed border-gray-300 rounded-lg cursor-pointer",
+                ),
+                id=upload_id,
+                accept={
+                    "text/csv": [".csv"],
+                    "application/x-ndjson": [".jsonl", ".ndjson", ".json"],
+                },
+                max_files=1,
+            ),
+            import_report(),
+            rx.el.div(
+                rx.radix.primitives.dialog.close(
+                    rx.el.button(
+                        "Close",
+                        on_click=rx.clear_selected_files(upload_id),
+                        class_name="bg-gray-100 text-gray-700 px-4 py-2 rounded-lg font-medium hover:bg-gray-200",
+                    )
+                ),
+                rx.el.button(
+                    "Import",
+                    on_click=handler(rx.upload_files(upload_id=upload_id)),
+                    disabled=ImportState.import_running,
+                    class_name="bg-purple-600 text-white px-4 py-2 rounded-lg font-medium hover:bg-purple-700 disabled:opacity-50",
+                ),
+                class_name="flex justify-end gap-3 mt-4",
+            ),
+        ),
+    )
@@ -0,0 +1,44 @@
+import reflex as rx
+from reflex.event import EventChain, EventHandler, no_args_event_spec
+from reflex.vars.base import VarData
+
+APPLY_PATCH = (
+    "((rows, patch) => patch.prepended.concat(rows"
+    ".filter((row) => !patch.removed.includes(row.id))"
+    ".map((row) => patch.updated[row.id] ?? row))"
+    ".concat(patch.appended))"
+)
+
+FOLD_PATCHES = (
+    "((key, rows, patch, resync) => {"
+    " const lists = (globalThis.__listPatches ??= {});"
+    " let shown = lists[key];"
+    " if (!shown || shown.epoch !== patch.epoch)"
+    " shown = {epoch: patch.epoch, seq: 0, rows: rows, resyncing: false};"
+    " if (patch.seq === shown.seq + 1)"
+    f" shown = {{...shown, seq: patch.seq, rows: {APPLY_PATCH}(shown.rows, patch)}};"
+    " else if (patch.seq > shown.seq + 1 && !shown.resyncing)"
+    " { shown = {...shown, resyncing: true}; setTimeout(resync); }"
+    " lists[key] = shown;"
+    " return shown.rows; })"
+)
+
+
+def patched_list(
+    records: rx.Var[list], patch: rx.Var[dict], resync: EventHandler
+) -> rx.Var[list]:
+    resync_chain = rx.Var.create(
+        EventChain.create(resync, args_spec=no_args_event_spec, key="resync")
+    )
+    return rx.Var(
+        _js_expr=(
+            f"{FOLD_PATCHES}({rx.Var.create(str(patch))}, {records}, {patch},"
+            f" {resync_chain})"
+        ),
+        _var_type=records._var_type,
+        _var_data=VarData.merge(
+            records._get_all_var_data(),
+            patch._get_all_var_data(),
+            resync_chain._get_all_var_data(),
+        ),
+    ).guess_type()
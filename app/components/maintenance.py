@@ -1,7 +1,19 @@
 import reflex as rx
-from app.states.state import PropertyManagementState, MaintenanceRequest
 
+from app.components.exports import export_links
+from app.components.list_patch import patched_list
+from app.components.options import option_list
+from app.components.search import search_box
+from app.states.forms import FormState
+from app.states.maintenance import (
+    MAINTENANCE_SORT_LABELS,
+    MaintenanceRequest,
+    MaintenanceState,
+)
+from app.states.state import PropertyManagementState
 
+
+@rx.memo
 def priority_badge(priority: rx.Var[str]) -> rx.Component:
     return rx.match(
         priority,
@@ -30,6 +42,7 @@ def priority_badge(priority: rx.Var[str]) -> rx.Component:
     )
 
 
+@rx.memo
 def status_badge(status: rx.Var[str]) -> rx.Component:
     return rx.match(
         status,
@@ -58,19 +71,33 @@ def status_badge(status: rx.Var[str]) -> rx.Component:
     )
 
 
-def maintenance_card(req: MaintenanceRequest) -> rx.Component:
+@rx.memo
+def maintenance_card(req: rx.Var[MaintenanceRequest]) -> rx.Component:
     return rx.el.div(
         rx.el.div(
             rx.el.div(
-                rx.el.h3(req["description"], class_name="font-semibold"),
-                rx.el.p(
-                    f"{req['property_name']}, Unit {req['unit']}",
-                    class_name="text-sm text-gray-500",
+                rx.el.input(
+                    type="checkbox",
+                    checked=MaintenanceState.selected_maintenance_ids.contains(
+                        req["id"]
+                    ),
+                    on_change=lambda _: MaintenanceState.toggle_maintenance_selection(
+                        req["id"]
+                    ),
+                    class_name="mt-1 rounded border-gray-300 text-purple-600",
                 ),
+                rx.el.div(
+                    rx.el.h3(req["description"], class_name="font-semibold"),
+                    rx.el.p(
+                        f"{req['property_name']}, Unit {req['unit']}",
+                        class_name="text-sm text-gray-500",
+                    ),
+                ),
+                class_name="flex items-start gap-3",
             ),
             rx.el.div(
-                priority_badge(req["priority"]),
-                status_badge(req["status"]),
+                priority_badge(priority=req["priority"]),
+                status_badge(status=req["status"]),
                 class_name="flex items-center gap-2",
             ),
             class_name="flex justify-between items-start",
@@ -89,7 +116,7 @@ def maintenance_card(req: MaintenanceRequest) -> rx.Component:
             rx.el.div(
                 rx.el.button(
                     "In Progress",
-                    on_click=lambda: PropertyManagementState.update_maintenance_status(
+                    on_click=lambda: MaintenanceState.update_maintenance_status(
                         req["id"], "In Progress"
                     ),
                     disabled=req["status"] == "In Progress",
@@ -97,7 +124,7 @@ def maintenance_card(req: MaintenanceRequest) -> rx.Component:
                 ),
                 rx.el.button(
                     "Completed",
-                    on_click=lambda: PropertyManagementState.update_maintenance_status(
+                    on_click=lambda: MaintenanceState.update_maintenance_status(
                         req["id"], "Completed"
                     ),
                     disabled=req["status"] == "Completed",
@@ -105,7 +132,7 @@ def maintenance_card(req: MaintenanceRequest) -> rx.Component:
                 ),
                 rx.el.button(
                     "Re-open",
-                    on_click=lambda: PropertyManagementState.update_maintenance_status(
+                    on_click=lambda: MaintenanceState.update_maintenance_status(
                         req["id"], "Open"
                     ),
                     disabled=req["status"] == "Open",
@@ -115,11 +142,8 @@ def maintenance_card(req: MaintenanceRequest) -> rx.Component:
             ),
             rx.el.select(
                 rx.el.option("Assign Vendor", value="", disabled=True),
-                rx.foreach(
-                    PropertyManagementState.available_vendors,
-                    lambda v: rx.el.option(v, value=v),
-                ),
-                on_change=lambda vendor: PropertyManagementState.update_maintenance_vendor(
+                option_list(values=PropertyManagementState.available_vendors),
+                on_change=lambda vendor: MaintenanceState.update_maintenance_vendor(
                     req["id"], vendor
                 ),
                 default_value=req["vendor"].to_string(),
@@ -135,21 +159,130 @@ def maintenance_card(req: MaintenanceRequest) -> rx.Component:
 def filter_button(label: str, status: str) -> rx.Component:
     return rx.el.button(
         label,
-        on_click=lambda: PropertyManagementState.set_maintenance_filter(status),
+        on_click=lambda: MaintenanceState.set_maintenance_filter(status),
         class_name=rx.cond(
-            PropertyManagementState.maintenance_filter == status,
+            MaintenanceState.maintenance_filter == status,
             "px-3 py-1 text-sm font-medium rounded-md bg-purple-100 text-purple-700",
             "px-3 py-1 text-sm font-medium rounded-md text-gray-600 hover:bg-gray-100",
         ),
     )
 
 
+def selection_bar() -> rx.Component:
+    return rx.el.div(
+        rx.el.button(
+            "Select page",
+            on_click=MaintenanceState.select_maintenance_page,
+            class_name="px-3 py-1 text-sm font-medium rounded-md text-gray-600 hover:bg-gray-100 border border-gray-200",
+        ),
+        rx.cond(
+            MaintenanceState.selected_maintenance_ids.length() > 0,
+            rx.el.div(
+                rx.el.span(
+                    f"{MaintenanceState.selected_maintenance_ids.length()} selected",
+                    class_name="text-sm font-medium text-gray-600",
+                ),
+                rx.el.button(
+                    "In Progress",
+                    on_click=MaintenanceState.update_selected_maintenance_status(
+                        "In Progress"
+                    ),
+                    class_name="text-xs font-medium bg-purple-100 text-purple-700 px-2 py-1 rounded-md hover:bg-purple-200",
+                ),
+                rx.el.button(
+                    "Completed",
+                    on_click=MaintenanceState.update_selected_maintenance_status(
+                        "Completed"
+                    ),
+                    class_name="text-xs font-medium bg-green-100 text-green-700 px-2 py-1 rounded-md hover:bg-green-200",
+                ),
+                rx.el.button(
+                    "Re-open",
+                    on_click=MaintenanceState.update_selected_maintenance_status(
+                        "Open"
+                    ),
+                    class_name="text-xs font-medium bg-red-100 text-red-700 px-2 py-1 rounded-md hover:bg-red-200",
+                ),
+                rx.el.select(
+                    rx.el.option("Assign Vendor", value="", disabled=True),
+                    option_list(values=PropertyManagementState.available_vendors),
+                    value="",
+                    on_change=MaintenanceState.assign_selected_maintenance_vendor,
+                    class_name="text-xs rounded-md border-gray-300 shadow-sm focus:border-purple-500 focus:ring-purple-500",
+                ),
+                rx.el.button(
+                    "Clear",
+                    on_click=MaintenanceState.clear_maintenance_selection,
+                    class_name="px-3 py-1 text-sm font-medium rounded-md text-gray-600 hover:bg-gray-100",
+                ),
+                class_name="flex items-center gap-2",
+            ),
+        ),
+        class_name="flex items-center gap-4 mb-4",
+    )
+
+
+def sort_chip(key: str) -> rx.Component:
+    return rx.el.button(
+        MAINTENANCE_SORT_LABELS[key],
+        on_click=lambda: MaintenanceState.toggle_maintenance_sort(key),
+        class_name=rx.cond(
+            MaintenanceState.maintenance_sort.contains(key),
+            "px-2 py-1 text-xs font-medium rounded-full bg-purple-100 text-purple-700",
+            "px-2 py-1 text-xs font-medium rounded-full text-gray-600 hover:bg-gray-100",
+        ),
+    )
+
+
+def sort_controls() -> rx.Component:
+    return rx.el.div(
+        rx.el.span("Sort by", class_name="text-sm text-gray-500"),
+        *[sort_chip(key) for key in MAINTENANCE_SORT_LABELS],
+        rx.el.span(
+            MaintenanceState.maintenance_sort_label,
+            class_name="text-sm font-medium text-gray-600 ml-2",
+        ),
+        class_name="flex items-center gap-2 mb-4",
+    )
+
+
+def pagination_controls() -> rx.Component:
+    return rx.el.div(
+        rx.el.p(
+            f"{MaintenanceState.maintenance_total} tickets",
+            class_name="text-sm text-gray-500",
+        ),
+        rx.el.div(
+            rx.el.button(
+                rx.icon("chevron-left", size=16),
+                on_click=MaintenanceState.prev_maintenance_page,
+                disabled=MaintenanceState.maintenance_page <= 1,
+                class_name="p-2 rounded-md text-gray-600 hover:bg-gray-100 disabled:opacity-50 disabled:cursor-not-allowed",
+            ),
+            rx.el.span(
+                f"Page {MaintenanceState.maintenance_page} of {MaintenanceState.maintenance_page_count}",
+                class_name="text-sm font-medium text-gray-600",
+            ),
+            rx.el.button(
+                rx.icon("chevron-right", size=16),
+                on_click=MaintenanceState.next_maintenance_page,
+                disabled=MaintenanceState.maintenance_page
+                >= MaintenanceState.maintenance_page_count,
+                class_name="p-2 rounded-md text-gray-600 hover:bg-gray-100 disabled:opacity-50 disabled:cursor-not-allowed",
+            ),
+            class_name="flex items-center gap-2",
+        ),
+        class_name="flex justify-between items-center mt-6",
+    )
+
+
 def add_request_dialog() -> rx.Component:
     return rx.radix.primitives.dialog.root(
         rx.radix.primitives.dialog.trigger(
             rx.el.button(
                 rx.icon("plus", size=16, class_name="mr-2"),
                 "New Request",
+                on_click=FormState.load_property_names,
                 class_name="flex items-center bg-purple-600 text-white px-4 py-2 rounded-lg font-medium hover:bg-purple-700 transition-colors",
             )
         ),
@@ -160,13 +293,10 @@ def add_request_dialog() -> rx.Component:
                     rx.el.div(
                         rx.el.label("Property", class_name="text-sm font-medium"),
                         rx.el.select(
-                            rx.foreach(
-                                PropertyManagementState.property_names,
-                                lambda name: rx.el.option(name, value=name),
-                            ),
+                            option_list(values=FormState.property_names),
                             name="property_name",
-                            default_value=PropertyManagementState.new_request_property,
-                            on_change=PropertyManagementState.set_new_request_property,
+                            default_value=FormState.new_request_property,
+                            on_change=FormState.set_new_request_property,
                             class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
                             required=True,
                         ),
@@ -176,7 +306,7 @@ def add_request_dialog() -> rx.Component:
                         rx.el.label("Unit Number", class_name="text-sm font-medium"),
                         rx.el.input(
                             name="unit",
-                            key=PropertyManagementState.new_request_unit,
+                            key=FormState.new_request_unit,
                             class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
                             required=True,
                         ),
@@ -185,7 +315,7 @@ def add_request_dialog() -> rx.Component:
                         rx.el.label("Description", class_name="text-sm font-medium"),
                         rx.el.textarea(
                             name="description",
-                            key=PropertyManagementState.new_request_description,
+                            key=FormState.new_request_description,
                             class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
                             required=True,
                         ),
@@ -199,8 +329,8 @@ def add_request_dialog() -> rx.Component:
                                 rx.el.option("Medium", value="Medium"),
                                 rx.el.option("High", value="High"),
                                 name="priority",
-                                default_value=PropertyManagementState.new_request_priority,
-                                on_change=PropertyManagementState.set_new_request_priority,
+                                default_value=FormState.new_request_priority,
+                                on_change=FormState.set_new_request_priority,
                                 class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
                             ),
                         ),
@@ -210,20 +340,19 @@ def add_request_dialog() -> rx.Component:
                             ),
                             rx.el.select(
                                 rx.el.option("Select a vendor", value=""),
-                                rx.foreach(
-                                    PropertyManagementState.available_vendors,
-                                    lambda v: rx.el.option(v, value=v),
+                                option_list(
+                                    values=PropertyManagementState.available_vendors
                                 ),
                                 name="vendor",
-                                default_value=PropertyManagementState.new_request_vendor,
-                                on_change=PropertyManagementState.set_new_request_vendor,
+                                default_value=FormState.new_request_vendor,
+                                on_change=FormState.set_new_request_vendor,
                                 class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
                             ),
                         ),
                     ),
                     class_name="grid grid-cols-2 gap-4",
                 ),
-                on_submit=PropertyManagementState.add_maintenance_request,
+                on_submit=FormState.add_maintenance_request,
                 id="maintenance_form",
             ),
             rx.el.div(
@@ -251,19 +380,29 @@ def maintenance_content() -> rx.Component:
         rx.el.div(
             rx.el.h1("Maintenance Tracking", class_name="text-3xl font-bold"),
             rx.el.div(
+                search_box("Search tickets", MaintenanceState.search_maintenance),
                 filter_button("All", "All"),
                 filter_button("Open", "Open"),
                 filter_button("In Progress", "In Progress"),
                 filter_button("Completed", "Completed"),
+                export_links("maintenance", MaintenanceState.maintenance_filter),
                 class_name="flex items-center gap-2",
             ),
             class_name="flex justify-between items-center mb-6",
         ),
+        sort_controls(),
+        selection_bar(),
         rx.el.div(
             rx.foreach(
-                PropertyManagementState.filtered_maintenance_requests, maintenance_card
+                patched_list(
+                    MaintenanceState.filtered_maintenance_requests,
+                    MaintenanceState.filtered_maintenance_requests_patch,
+                    MaintenanceState.resync_maintenance_requests,
+                ),
+                lambda req: maintenance_card(req=req),
             ),
             class_name="grid grid-cols-1 md:grid-cols-2 xl:grid-cols-3 gap-6",
         ),
+        pagination_controls(),
         class_name="p-6",
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,85 @@
+import reflex as rx
+
+from app.data.models import HandlerMetric
+from app.states.metrics import MetricsState
+
+HANDLER_COLUMNS = (
+    "Handler",
+    "Calls",
+    "Errors",
+    "Mean ms",
+    "Max ms",
+    "Total ms",
+    "Process ms",
+    "Delta bytes",
+)
+
+
+def handler_row(row: rx.Var[HandlerMetric]) -> rx.Component:
+    return rx.el.tr(
+        rx.el.td(row["handler"], class_name="px-4 py-2 font-medium"),
+        rx.el.td(row["calls"], class_name="px-4 py-2"),
+        rx.el.td(row["errors"], class_name="px-4 py-2 text-red-700"),
+        rx.el.td(row["mean_ms"], class_name="px-4 py-2"),
+        rx.el.td(row["max_ms"], class_name="px-4 py-2"),
+        rx.el.td(row["total_ms"], class_name="px-4 py-2"),
+        rx.el.td(row["process_ms"], class_name="px-4 py-2"),
+        rx.el.td(row["delta_bytes"], class_name="px-4 py-2 text-gray-500"),
+        class_name="border-t border-gray-100",
+    )
+
+
+def recompute_row(row: rx.Var[tuple[str, int]]) -> rx.Component:
+    return rx.el.tr(
+        rx.el.td(row[0], class_name="px-4 py-2 font-medium"),
+        rx.el.td(row[1], class_name="px-4 py-2"),
+        class_name="border-t border-gray-100",
+    )
+
+
+def metrics_table(columns: tuple[str, ...], rows: rx.Component) -> rx.Component:
+    return rx.el.div(
+        rx.el.table(
+            rx.el.thead(
+                rx.el.tr(
+                    *[
+                        rx.el.th(column, class_name="px-4 py-2 text-left")
+                        for column in columns
+                    ],
+                    class_name="text-xs font-medium text-gray-500 uppercase",
+                )
+            ),
+            rx.el.tbody(rows),
+            class_name="w-full text-sm",
+        ),
+        class_name="bg-white border border-gray-200 rounded-xl shadow-sm overflow-x-auto mb-8",
+    )
+
+
+def metrics_content() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.el.div(
+                rx.el.h1("Handler Metrics", class_name="text-3xl font-bold"),
+                rx.el.p(
+                    "Timings for this server worker since it started.",
+                    class_name="text-gray-500 mt-1",
+                ),
+            ),
+            rx.el.button(
+                rx.icon("refresh-cw", size=16, class_name="mr-2"),
+                "Refresh",
+                on_click=MetricsState.refresh,
+                class_name="flex items-center bg-purple-600 text-white px-4 py-2 rounded-lg font-medium hover:bg-purple-700 transition-colors",
+            ),
+            class_name="flex justify-between items-start mb-6",
+        ),
+        metrics_table(
+            HANDLER_COLUMNS, rx.foreach(MetricsState.handler_metrics, handler_row)
+        ),
+        rx.el.h2("Computed Var Recomputes", class_name="text-2xl font-bold mb-4"),
+        metrics_table(
+            ("Var", "Recomputes"), rx.foreach(MetricsState.recomputes, recompute_row)
+        ),
+        class_name="p-6",
+    )
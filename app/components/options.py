@@ -0,0 +1,8 @@
+import reflex as rx
+
+
+@rx.memo
+def option_list(values: rx.Var[list[str]]) -> rx.Component:
+    return rx.fragment(
+        rx.foreach(values, lambda value: rx.el.option(value, value=value))
+    )
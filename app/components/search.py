@@ -0,0 +1,20 @@
+import reflex as rx
+
+SEARCH_DEBOUNCE_MS = 250
+
+
+def search_box(placeholder: str, on_search: rx.event.EventHandler) -> rx.Component:
+    return rx.el.div(
+        rx.icon(
+            "search",
+            size=16,
+            class_name="absolute left-3 top-1/2 -translate-y-1/2 text-gray-400",
+        ),
+        rx.el.input(
+            type="search",
+            placeholder=placeholder,
+            on_change=on_search.debounce(SEARCH_DEBOUNCE_MS),
+            class_name="pl-9 pr-3 py-1.5 w-56 text-sm rounded-md border border-gray-200 focus:border-purple-500 focus:ring-purple-500",
+        ),
+        class_name="relative",
+    )
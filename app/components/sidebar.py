@@ -1,19 +1,66 @@
 import reflex as rx
+
+from app.states.dashboard import DashboardState
+from app.states.live import LiveUpdatesState
+from app.states.maintenance import MaintenanceState
 from app.states.state import PropertyManagementState
+from app.states.tenants import TenantsState
+from app.states.units import UnitsState
 
 NAV_ITEMS = [
-    {"label": "Dashboard", "icon": "layout-grid", "section": "dashboard"},
-    {"label": "Units", "icon": "building", "section": "units"},
-    {"label": "Tenants", "icon": "users", "section": "tenants"},
-    {"label": "Maintenance", "icon": "wrench", "section": "maintenance"},
+    {
+        "label": "Dashboard",
+        "icon": "layout-grid",
+        "section": "dashboard",
+        "route": "/",
+    },
+    {
+        "label": "Units",
+        "icon": "building",
+        "section": "units",
+        "route": "/units",
+    },
+    {
+        "label": "Tenants",
+        "icon": "users",
+        "section": "tenants",
+        "route": "/tenants",
+    },
+    {
+        "label": "Maintenance",
+        "icon": "wrench",
+        "section": "maintenance",
+        "route": "/maintenance",
+    },
 ]
+SECTION_LOADERS = {
+    "dashboard": DashboardState.load,
+    "units": UnitsState.load,
+    "tenants": TenantsState.load,
+    "maintenance": MaintenanceState.load,
+}
+SECTION_UNLOADERS = {
+    "dashboard": DashboardState.unload,
+    "units": UnitsState.unload,
+    "tenants": TenantsState.unload,
+    "maintenance": MaintenanceState.unload,
+}
+
+
+def section_events(section: str) -> list[rx.event.EventSpec]:
+    return [
+        PropertyManagementState.set_active_section(section),
+        *[unload() for other, unload in SECTION_UNLOADERS.items() if other != section],
+        SECTION_LOADERS[section](),
+        LiveUpdatesState.watch_changes(),
+    ]
 
 
 def nav_item(item: dict) -> rx.Component:
     return rx.el.a(
         rx.icon(item["icon"], size=20),
         rx.el.span(item["label"], class_name="font-medium"),
-        on_click=lambda: PropertyManagementState.set_active_section(item["section"]),
+        on_click=rx.redirect(item["route"]),
         class_name=rx.cond(
             PropertyManagementState.active_section == item["section"],
             "flex items-center gap-3 rounded-lg bg-gray-100 px-3 py-2 text-purple-600 transition-all hover:text-purple-700 cursor-pointer",
@@ -34,10 +81,10 @@ def sidebar() -> rx.Component:
                 class_name="flex h-16 items-center border-b px-6",
             ),
             rx.el.nav(
-                rx.foreach(NAV_ITEMS, nav_item),
+                *[nav_item(item) for item in NAV_ITEMS],
                 class_name="flex-1 flex flex-col gap-1 p-4 text-sm font-medium",
             ),
             class_name="flex-1 overflow-auto",
         ),
         class_name="h-screen w-64 border-r bg-white flex flex-col",
-    )
\ No newline at end of file
+    )
@@ -1,8 +1,14 @@
 import reflex as rx
-from app.states.state import PropertyManagementState, Tenant
 
+from app.components.exports import export_links
+from app.components.imports import import_dialog
+from app.components.search import search_box
+from app.states.imports import ImportState
+from app.states.tenants import Tenant, TenantsState
 
-def tenant_card(tenant: Tenant) -> rx.Component:
+
+@rx.memo
+def tenant_card(tenant: rx.Var[Tenant]) -> rx.Component:
     return rx.el.div(
         rx.el.div(
             rx.el.div(
@@ -13,7 +19,11 @@ def tenant_card(tenant: Tenant) -> rx.Component:
                 rx.el.div(
                     rx.el.h3(tenant["name"], class_name="font-semibold text-lg"),
                     rx.el.p(
-                        f"{tenant['property_name']}, Unit {tenant['unit_number']}",
+                        rx.cond(
+                            tenant["unit_id"],
+                            f"{tenant['property_name']}, Unit {tenant['unit_number']}",
+                            "No unit on record",
+                        ),
                         class_name="text-sm text-gray-500",
                     ),
                 ),
@@ -44,19 +54,62 @@ def tenant_card(tenant: Tenant) -> rx.Component:
     )
 
 
+def pagination_controls() -> rx.Component:
+    return rx.el.div(
+        rx.el.p(
+            f"{TenantsState.tenant_total} tenants",
+            class_name="text-sm text-gray-500",
+        ),
+        rx.el.div(
+            rx.el.button(
+                rx.icon("chevron-left", size=16),
+                on_click=TenantsState.prev_tenant_page,
+                disabled=TenantsState.tenant_page <= 1,
+                class_name="p-2 rounded-md text-gray-600 hover:bg-gray-100 disabled:opacity-50 disabled:cursor-not-allowed",
+            ),
+            rx.el.span(
+                f"Page {TenantsState.tenant_page} of {TenantsState.tenant_page_count}",
+                class_name="text-sm font-medium text-gray-600",
+            ),
+            rx.el.button(
+                rx.icon("chevron-right", size=16),
+                on_click=TenantsState.next_tenant_page,
+                disabled=~TenantsState.tenant_has_next_page,
+                class_name="p-2 rounded-md text-gray-600 hover:bg-gray-100 disabled:opacity-50 disabled:cursor-not-allowed",
+            ),
+            class_name="flex items-center gap-2",
+        ),
+        class_name="flex justify-between items-center mt-6",
+    )
+
+
 def tenants_content() -> rx.Component:
     return rx.el.div(
         rx.el.div(
-            rx.el.h1("Tenant Portal", class_name="text-3xl font-bold"),
-            rx.el.p(
-                "Read-only view of current tenants and their information.",
-                class_name="text-gray-500 mt-1",
+            rx.el.div(
+                rx.el.h1("Tenant Portal", class_name="text-3xl font-bold"),
+                rx.el.p(
+                    "Read-only view of current tenants and their information.",
+                    class_name="text-gray-500 mt-1",
+                ),
             ),
-            class_name="mb-6",
+            rx.el.div(
+                search_box("Search tenants", TenantsState.search_tenants),
+                export_links("tenants"),
+                import_dialog(
+                    "Import Tenants",
+                    "tenants_import",
+                    "name, email, phone, property_name, unit_number, lease_document_url",
+                    ImportState.import_tenants,
+                ),
+                class_name="flex items-center gap-2",
+            ),
+            class_name="flex justify-between items-start mb-6",
         ),
         rx.el.div(
-            rx.foreach(PropertyManagementState.tenants, tenant_card),
+            rx.foreach(TenantsState.tenants, lambda tenant: tenant_card(tenant=tenant)),
             class_name="grid grid-cols-1 lg:grid-cols-2 gap-6",
         ),
+        pagination_controls(),
         class_name="p-6",
-    )
\ No newline at end of file
+    )
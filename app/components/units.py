@@ -1,7 +1,17 @@
 import reflex as rx
-from app.states.state import PropertyManagementState, Unit
 
+from app.components.exports import export_links
+from app.components.imports import import_dialog
+from app.components.list_patch import patched_list
+from app.components.options import option_list
+from app.components.search import search_box
+from app.components.viewport import viewport_sentinel
+from app.states.forms import FormState
+from app.states.imports import ImportState
+from app.states.units import Unit, UnitsState
 
+
+@rx.memo
 def rent_status_badge(status: rx.Var[str]) -> rx.Component:
     return rx.match(
         status,
@@ -41,17 +51,27 @@ def archived_badge() -> rx.Component:
     )
 
 
-def unit_card(unit: Unit) -> rx.Component:
+@rx.memo
+def unit_card(unit: rx.Var[Unit]) -> rx.Component:
     return rx.el.div(
         rx.el.div(
             rx.el.div(
-                rx.el.h3(f"Unit {unit['unit_number']}", class_name="font-semibold"),
-                rx.el.p(unit["property_name"], class_name="text-sm text-gray-500"),
+                rx.el.input(
+                    type="checkbox",
+                    checked=UnitsState.selected_unit_ids.contains(unit["id"]),
+                    on_change=lambda _: UnitsState.toggle_unit_selection(unit["id"]),
+                    class_name="mt-1 rounded border-gray-300 text-purple-600",
+                ),
+                rx.el.div(
+                    rx.el.h3(f"Unit {unit['unit_number']}", class_name="font-semibold"),
+                    rx.el.p(unit["property_name"], class_name="text-sm text-gray-500"),
+                ),
+                class_name="flex items-start gap-3",
             ),
             rx.cond(
                 unit["archived"],
                 archived_badge(),
-                rent_status_badge(unit["rent_status"]),
+                rent_status_badge(status=unit["rent_status"]),
             ),
             class_name="flex justify-between items-start mb-4",
         ),
@@ -79,110 +99,209 @@ def unit_card(unit: Unit) -> rx.Component:
             rx.el.button(
                 rx.icon("pencil", size=14, class_name="mr-1.5"),
                 "Edit",
-                on_click=lambda: PropertyManagementState.open_edit_unit_form(
-                    unit["id"]
-                ),
+                on_click=lambda: FormState.open_edit_unit_form(unit["id"]),
                 class_name="text-xs font-medium text-gray-600 hover:text-black flex items-center",
             ),
             rx.el.button(
                 rx.cond(unit["archived"], "Restore", "Archive"),
-                on_click=lambda: PropertyManagementState.toggle_unit_archive(
-                    unit["id"]
-                ),
+                on_click=lambda: UnitsState.toggle_unit_archive(unit["id"]),
                 class_name="text-xs font-medium text-gray-600 hover:text-black flex items-center",
             ),
+            rx.cond(
+                (unit["rent_status"] == "Overdue") & ~unit["archived"],
+                rx.el.button(
+                    rx.icon("circle-check", size=14, class_name="mr-1.5"),
+                    "Mark Paid",
+                    on_click=lambda: UnitsState.settle_unit_rent(unit["id"]),
+                    class_name="text-xs font-medium text-gray-600 hover:text-black flex items-center",
+                ),
+            ),
             class_name="flex items-center gap-4 mt-4 pt-4 border-t border-gray-100",
         ),
         class_name="p-4 bg-white border border-gray-200 rounded-xl shadow-sm",
     )
 
 
+def selection_bar() -> rx.Component:
+    return rx.el.div(
+        rx.el.button(
+            "Select page",
+            on_click=UnitsState.select_unit_page,
+            class_name="px-3 py-1 text-sm font-medium rounded-md text-gray-600 hover:bg-gray-100 border border-gray-200",
+        ),
+        rx.cond(
+            UnitsState.selected_unit_ids.length() > 0,
+            rx.el.div(
+                rx.el.span(
+                    f"{UnitsState.selected_unit_ids.length()} selected",
+                    class_name="text-sm font-medium text-gray-600",
+                ),
+                rx.el.button(
+                    rx.icon("archive", size=14, class_name="mr-1.5"),
+                    "Archive",
+                    on_click=UnitsState.archive_selected_units(True),
+                    class_name="flex items-center px-3 py-1 text-sm font-medium rounded-md bg-purple-100 text-purple-700 hover:bg-purple-200",
+                ),
+                rx.el.button(
+                    "Restore",
+                    on_click=UnitsState.archive_selected_units(False),
+                    class_name="px-3 py-1 text-sm font-medium rounded-md bg-purple-100 text-purple-700 hover:bg-purple-200",
+                ),
+                rx.el.button(
+                    "Clear",
+                    on_click=UnitsState.clear_unit_selection,
+                    class_name="px-3 py-1 text-sm font-medium rounded-md text-gray-600 hover:bg-gray-100",
+                ),
+                class_name="flex items-center gap-2",
+            ),
+        ),
+        class_name="flex items-center gap-4 mb-4",
+    )
+
+
 def filter_button(label: str, status: str) -> rx.Component:
     return rx.el.button(
         label,
-        on_click=lambda: PropertyManagementState.set_unit_filter(status),
+        on_click=lambda: UnitsState.set_unit_filter(status),
         class_name=rx.cond(
-            PropertyManagementState.unit_filter == status,
+            UnitsState.unit_filter == status,
             "px-3 py-1 text-sm font-medium rounded-md bg-purple-100 text-purple-700",
             "px-3 py-1 text-sm font-medium rounded-md text-gray-600 hover:bg-gray-100",
         ),
     )
 
 
-def _unit_form(state: rx.State, handler: rx.event.EventHandler) -> rx.Component:
-    return rx.el.form(
-        rx.el.div(
+def pagination_controls() -> rx.Component:
+    return rx.el.div(
+        rx.el.p(
+            UnitsState.unit_page_label,
+            class_name="text-sm text-gray-500",
+        ),
+        rx.cond(
+            ~UnitsState.unit_infinite_scroll,
             rx.el.div(
-                rx.el.label("Property", class_name="text-sm font-medium"),
-                rx.el.select(
-                    rx.foreach(
-                        state.property_names,
-                        lambda name: rx.el.option(name, value=name),
-                    ),
-                    name="property_name",
-                    default_value=state.new_unit_property.to_string(),
-                    on_change=state.set_new_unit_property,
-                    class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                    required=True,
+                rx.el.button(
+                    rx.icon("chevron-left", size=16),
+                    on_click=UnitsState.prev_unit_page,
+                    disabled=UnitsState.unit_page <= 1,
+                    class_name="p-2 rounded-md text-gray-600 hover:bg-gray-100 disabled:opacity-50 disabled:cursor-not-allowed",
                 ),
-                class_name="col-span-2",
-            ),
-            rx.el.div(
-                rx.el.label("Unit Number", class_name="text-sm font-medium"),
-                rx.el.input(
-                    name="unit_number",
-                    default_value=state.new_unit_number,
-                    key=state.new_unit_number,
-                    class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                    required=True,
+                rx.el.span(
+                    f"Page {UnitsState.unit_page} of {UnitsState.unit_page_count}",
+                    class_name="text-sm font-medium text-gray-600",
                 ),
-            ),
-            rx.el.div(
-                rx.el.label("Rent Amount ($)", class_name="text-sm font-medium"),
-                rx.el.input(
-                    type="number",
-                    name="rent_amount",
-                    default_value=state.new_unit_rent_amount,
-                    key=state.new_unit_rent_amount,
-                    class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                    required=True,
+                rx.el.button(
+                    rx.icon("chevron-right", size=16),
+                    on_click=UnitsState.next_unit_page,
+                    disabled=~UnitsState.unit_has_next_page,
+                    class_name="p-2 rounded-md text-gray-600 hover:bg-gray-100 disabled:opacity-50 disabled:cursor-not-allowed",
                 ),
+                class_name="flex items-center gap-2",
             ),
-            rx.el.div(
-                rx.el.label("Tenant Name", class_name="text-sm font-medium"),
-                rx.el.input(
-                    name="tenant_name",
-                    default_value=state.new_unit_tenant_name,
-                    key=state.new_unit_tenant_name,
-                    class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                ),
+        ),
+        class_name="flex justify-between items-center mt-6",
+    )
+
+
+@rx.memo
+def unit_form_fields(
+    property_names: rx.Var[list[str]],
+    property_name: rx.Var[str],
+    unit_number: rx.Var[str],
+    rent_amount: rx.Var[str],
+    tenant_name: rx.Var[str],
+    rent_status: rx.Var[str],
+    lease_end: rx.Var[str],
+    on_property_change: rx.EventHandler[rx.event.passthrough_event_spec(str)],
+    on_rent_status_change: rx.EventHandler[rx.event.passthrough_event_spec(str)],
+) -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.el.label("Property", class_name="text-sm font-medium"),
+            rx.el.select(
+                option_list(values=property_names),
+                name="property_name",
+                default_value=property_name,
+                on_change=on_property_change,
+                class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
+                required=True,
             ),
-            rx.el.div(
-                rx.el.label("Rent Status", class_name="text-sm font-medium"),
-                rx.el.select(
-                    rx.el.option("Paid", value="Paid"),
-                    rx.el.option("Overdue", value="Overdue"),
-                    rx.el.option("Vacant", value="Vacant"),
-                    name="rent_status",
-                    default_value=state.new_unit_rent_status,
-                    on_change=state.set_new_unit_rent_status,
-                    class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                ),
+            class_name="col-span-2",
+        ),
+        rx.el.div(
+            rx.el.label("Unit Number", class_name="text-sm font-medium"),
+            rx.el.input(
+                name="unit_number",
+                default_value=unit_number,
+                key=unit_number,
+                class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
+                required=True,
             ),
-            rx.el.div(
-                rx.el.label("Lease End Date", class_name="text-sm font-medium"),
-                rx.el.input(
-                    type="date",
-                    name="lease_end",
-                    default_value=state.new_unit_lease_end,
-                    key=state.new_unit_lease_end,
-                    class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                ),
-                class_name="col-span-2",
+        ),
+        rx.el.div(
+            rx.el.label("Rent Amount ($)", class_name="text-sm font-medium"),
+            rx.el.input(
+                type="number",
+                name="rent_amount",
+                default_value=rent_amount,
+                key=rent_amount,
+                class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
+                required=True,
             ),
-            class_name="grid grid-cols-2 gap-4",
+        ),
+        rx.el.div(
+            rx.el.label("Tenant Name", class_name="text-sm font-medium"),
+            rx.el.input(
+                name="tenant_name",
+                default_value=tenant_name,
+                key=tenant_name,
+                class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
+            ),
+        ),
+        rx.el.div(
+            rx.el.label("Rent Status", class_name="text-sm font-medium"),
+            rx.el.select(
+                rx.el.option("Paid", value="Paid"),
+                rx.el.option("Overdue", value="Overdue"),
+                rx.el.option("Vacant", value="Vacant"),
+                name="rent_status",
+                default_value=rent_status,
+                on_change=on_rent_status_change,
+                class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
+            ),
+        ),
+        rx.el.div(
+            rx.el.label("Lease End Date", class_name="text-sm font-medium"),
+            rx.el.input(
+                type="date",
+                name="lease_end",
+                default_value=lease_end,
+                key=lease_end,
+                class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
+            ),
+            class_name="col-span-2",
+        ),
+        class_name="grid grid-cols-2 gap-4",
+    )
+
+
+def _unit_form(
+    form_id: str, prefix: str, handler: rx.event.EventHandler
+) -> rx.Component:
+    return rx.el.form(
+        unit_form_fields(
+            property_names=FormState.property_names,
+            property_name=getattr(FormState, f"{prefix}_property"),
+            unit_number=getattr(FormState, f"{prefix}_number"),
+            rent_amount=getattr(FormState, f"{prefix}_rent_amount"),
+            tenant_name=getattr(FormState, f"{prefix}_tenant_name"),
+            rent_status=getattr(FormState, f"{prefix}_rent_status"),
+            lease_end=getattr(FormState, f"{prefix}_lease_end"),
+            on_property_change=getattr(FormState, f"set_{prefix}_property"),
+            on_rent_status_change=getattr(FormState, f"set_{prefix}_rent_status"),
         ),
         on_submit=handler,
+        id=form_id,
     )
 
 
@@ -192,32 +311,31 @@ def add_unit_dialog() -> rx.Component:
             rx.el.button(
                 rx.icon("plus", size=16, class_name="mr-2"),
                 "Add Unit",
-                on_click=PropertyManagementState.open_add_unit_form,
+                on_click=FormState.open_add_unit_form,
                 class_name="flex items-center bg-purple-600 text-white px-4 py-2 rounded-lg font-medium hover:bg-purple-700 transition-colors",
             )
         ),
         rx.radix.primitives.dialog.content(
             rx.radix.primitives.dialog.title("Add New Unit"),
-            _unit_form(PropertyManagementState, PropertyManagementState.add_unit),
+            _unit_form("add_unit_form", "new_unit", FormState.add_unit),
             rx.el.div(
                 rx.radix.primitives.dialog.close(
                     rx.el.button(
                         "Cancel",
-                        on_click=PropertyManagementState.close_add_unit_form,
+                        on_click=FormState.close_add_unit_form,
                         class_name="bg-gray-100 text-gray-700 px-4 py-2 rounded-lg font-medium hover:bg-gray-200",
                     )
                 ),
                 rx.el.button(
                     "Save Unit",
                     type_="submit",
-                    form="_unit_form",
+                    form="add_unit_form",
                     class_name="bg-purple-600 text-white px-4 py-2 rounded-lg font-medium hover:bg-purple-700",
                 ),
                 class_name="flex justify-end gap-3 mt-4",
             ),
-            id="_unit_form",
         ),
-        open=PropertyManagementState.add_unit_form_open,
+        open=FormState.add_unit_form_open,
     )
 
 
@@ -225,88 +343,12 @@ def edit_unit_dialog() -> rx.Component:
     return rx.radix.primitives.dialog.root(
         rx.radix.primitives.dialog.content(
             rx.radix.primitives.dialog.title("Edit Unit"),
-            rx.el.form(
-                rx.el.div(
-                    rx.el.div(
-                        rx.el.label("Property", class_name="text-sm font-medium"),
-                        rx.el.select(
-                            rx.foreach(
-                                PropertyManagementState.property_names,
-                                lambda name: rx.el.option(name, value=name),
-                            ),
-                            name="property_name",
-                            default_value=PropertyManagementState.edit_unit_property,
-                            on_change=PropertyManagementState.set_edit_unit_property,
-                            class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                            required=True,
-                        ),
-                        class_name="col-span-2",
-                    ),
-                    rx.el.div(
-                        rx.el.label("Unit Number", class_name="text-sm font-medium"),
-                        rx.el.input(
-                            name="unit_number",
-                            default_value=PropertyManagementState.edit_unit_number,
-                            key=PropertyManagementState.edit_unit_number,
-                            class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                            required=True,
-                        ),
-                    ),
-                    rx.el.div(
-                        rx.el.label(
-                            "Rent Amount ($)", class_name="text-sm font-medium"
-                        ),
-                        rx.el.input(
-                            type="number",
-                            name="rent_amount",
-                            default_value=PropertyManagementState.edit_unit_rent_amount,
-                            key=PropertyManagementState.edit_unit_rent_amount,
-                            class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                            required=True,
-                        ),
-                    ),
-                    rx.el.div(
-                        rx.el.label("Tenant Name", class_name="text-sm font-medium"),
-                        rx.el.input(
-                            name="tenant_name",
-                            default_value=PropertyManagementState.edit_unit_tenant_name,
-                            key=PropertyManagementState.edit_unit_tenant_name,
-                            class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                        ),
-                    ),
-                    rx.el.div(
-                        rx.el.label("Rent Status", class_name="text-sm font-medium"),
-                        rx.el.select(
-                            rx.el.option("Paid", value="Paid"),
-                            rx.el.option("Overdue", value="Overdue"),
-                            rx.el.option("Vacant", value="Vacant"),
-                            name="rent_status",
-                            default_value=PropertyManagementState.edit_unit_rent_status,
-                            on_change=PropertyManagementState.set_edit_unit_rent_status,
-                            class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                        ),
-                    ),
-                    rx.el.div(
-                        rx.el.label("Lease End Date", class_name="text-sm font-medium"),
-                        rx.el.input(
-                            type="date",
-                            name="lease_end",
-                            default_value=PropertyManagementState.edit_unit_lease_end,
-                            key=PropertyManagementState.edit_unit_lease_end,
-                            class_name="mt-1 w-full rounded-md border-gray-300 shadow-sm",
-                        ),
-                        class_name="col-span-2",
-                    ),
-                    class_name="grid grid-cols-2 gap-4",
-                ),
-                on_submit=PropertyManagementState.update_unit,
-                id="edit_unit_form",
-            ),
+            _unit_form("edit_unit_form", "edit_unit", FormState.update_unit),
             rx.el.div(
                 rx.radix.primitives.dialog.close(
                     rx.el.button(
                         "Cancel",
-                        on_click=PropertyManagementState.close_edit_unit_form,
+                        on_click=FormState.close_edit_unit_form,
                         class_name="bg-gray-100 text-gray-700 px-4 py-2 rounded-lg font-medium hover:bg-gray-200",
                     )
                 ),
@@ -319,7 +361,7 @@ def edit_unit_dialog() -> rx.Component:
                 class_name="flex justify-end gap-3 mt-4",
             ),
         ),
-        open=PropertyManagementState.edit_unit_form_open,
+        open=FormState.edit_unit_form_open,
     )
 
 
@@ -327,21 +369,60 @@ def units_content() -> rx.Component:
     return rx.el.div(
         add_unit_dialog(),
         edit_unit_dialog(),
+        import_dialog(
+            "Import Units",
+            "units_import",
+            "property_name, unit_number, rent_amount, tenant_name, rent_status,"
+            " lease_end",
+            ImportState.import_units,
+        ),
         rx.el.div(
             rx.el.h1("Unit Management", class_name="text-3xl font-bold"),
             rx.el.div(
+                search_box("Search units", UnitsState.search_units),
                 filter_button("All", "All"),
                 filter_button("Paid", "Paid"),
                 filter_button("Overdue", "Overdue"),
                 filter_button("Vacant", "Vacant"),
                 filter_button("Archived", "Archived"),
+                rx.el.button(
+                    rx.cond(
+                        UnitsState.unit_infinite_scroll,
+                        "Paged view",
+                        "Continuous scroll",
+                    ),
+                    on_click=UnitsState.toggle_unit_infinite_scroll,
+                    class_name="px-3 py-1 text-sm font-medium rounded-md text-gray-600 hover:bg-gray-100 border border-gray-200",
+                ),
+                export_links("units", UnitsState.unit_filter),
                 class_name="flex items-center gap-2",
             ),
             class_name="flex justify-between items-center mb-6",
         ),
+        selection_bar(),
+        rx.cond(
+            UnitsState.unit_infinite_scroll & UnitsState.unit_has_previous_rows,
+            viewport_sentinel(
+                UnitsState.load_previous_units, key=UnitsState.unit_page_label
+            ),
+        ),
         rx.el.div(
-            rx.foreach(PropertyManagementState.filtered_units, unit_card),
+            rx.foreach(
+                patched_list(
+                    UnitsState.filtered_units,
+                    UnitsState.filtered_units_patch,
+                    UnitsState.resync_units,
+                ),
+                lambda unit: unit_card(unit=unit),
+            ),
             class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6",
         ),
+        rx.cond(
+            UnitsState.unit_infinite_scroll & UnitsState.unit_has_next_page,
+            viewport_sentinel(
+                UnitsState.load_more_units, key=UnitsState.unit_page_label
+            ),
+        ),
+        pagination_controls(),
         class_name="p-6",
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,36 @@
+import reflex as rx
+from reflex.event import EventHandler, no_args_event_spec
+
+SENTINEL_MARGIN = "400px"
+
+
+class ViewportSentinel(rx.Component):
+    tag = "ViewportSentinel"
+    on_visible: EventHandler[no_args_event_spec]
+
+    def add_imports(self) -> dict:
+        return {"react": ["useEffect", "useRef"], "@emotion/react": ["jsx"]}
+
+    def add_custom_code(self) -> list[str]:
+        return [
+            f"""export function ViewportSentinel({{onVisible, ...props}}) {{
+  const ref = useRef(null);
+  const callback = useRef(onVisible);
+  callback.current = onVisible;
+  useEffect(() => {{
+    const observer = new IntersectionObserver(
+      (entries) => {{
+        if (entries.some((entry) => entry.isIntersecting)) callback.current?.();
+      }},
+      {{rootMargin: "{SENTINEL_MARGIN}"}},
+    );
+    observer.observe(ref.current);
+    return () => observer.disconnect();
+  }}, []);
+  return jsx("div", {{ref, ...props}});
+}}"""
+        ]
+
+
+def viewport_sentinel(on_visible: EventHandler, key: rx.Var) -> rx.Component:
+    return ViewportSentinel.create(on_visible=on_visible, key=key, class_name="h-px")
@@ -0,0 +1,155 @@
+import sqlite3
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+COUNTERS = (
+    "units_total",
+    "units_occupied",
+    "units_overdue",
+    "maintenance_open",
+)
+OCCUPANCY_COLUMNS = ("total_units", "occupied_units")
+
+
+def unit_contribution(unit: Mapping[str, Any] | None) -> Counter:
+    if unit is None or unit["archived"]:
+        return Counter()
+    return Counter(
+        units_total=1,
+        units_occupied=int(unit["rent_status"] != "Vacant"),
+        units_overdue=int(unit["rent_status"] == "Overdue"),
+    )
+
+
+def occupancy_contribution(unit: Mapping[str, Any] | None) -> Counter:
+    if unit is None or unit["archived"]:
+        return Counter()
+    name = unit["property_name"]
+    return Counter(
+        {
+            (name, "total_units"): 1,
+            (name, "occupied_units"): int(unit["rent_status"] != "Vacant"),
+        }
+    )
+
+
+def maintenance_contribution(request: Mapping[str, Any] | None) -> Counter:
+    if request is None:
+        return Counter()
+    return Counter(maintenance_open=int(request["status"] == "Open"))
+
+
+def _total(
+    contribution: Callable[[Mapping[str, Any] | None], Counter],
+    records: Iterable[Mapping[str, Any]],
+) -> Counter:
+    totals = Counter()
+    for record in records:
+        totals.update(contribution(record))
+    return totals
+
+
+class AggregateEngine:
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def snapshot(self) -> dict[str, int]:
+        values = dict.fromkeys(COUNTERS, 0)
+        values.update(self._connection.execute("SELECT name, value FROM aggregates"))
+        return values
+
+    def apply(self, old: Counter, new: Counter) -> None:
+        deltas = [
+            (new[name] - old[name], name) for name in COUNTERS if new[name] != old[name]
+        ]
+        if deltas:
+            self._connection.executemany(
+                "UPDATE aggregates SET value = value + ? WHERE name = ?", deltas
+            )
+
+    def apply_occupancy(self, old: Counter, new: Counter) -> None:
+        changed = [key for key in old.keys() | new.keys() if new[key] != old[key]]
+        for column in OCCUPANCY_COLUMNS:
+            deltas = [
+                (new[key] - old[key], key[0]) for key in changed if key[1] == column
+            ]
+            if deltas:
+                self._connection.executemany(
+                    f"UPDATE properties SET {column} = {column} + ? WHERE name = ?",
+                    deltas,
+                )
+
+    def revision(self, name: str) -> int:
+        return self._connection.execute(
+            "SELECT value FROM aggregates WHERE name = ?", (name,)
+        ).fetchone()[0]
+
+    def bump_revision(self, name: str) -> int:
+        self._connection.execute(
+            "UPDATE aggregates SET value = value + 1 WHERE name = ?", (name,)
+        )
+        return self.revision(name)
+
+    def unit_revision(self) -> int:
+        return self.revision("unit_revision")
+
+    def apply_unit(
+        self, old: Mapping[str, Any] | None, new: Mapping[str, Any] | None
+    ) -> int:
+        self.apply(unit_contribution(old), unit_contribution(new))
+        self.apply_occupancy(occupancy_contribution(old), occupancy_contribution(new))
+        return self.bump_revision("unit_revision")
+
+    def apply_units(
+        self, old: Iterable[Mapping[str, Any]], new: Iterable[Mapping[str, Any]]
+    ) -> int:
+        old, new = list(old), list(new)
+        self.apply(_total(unit_contribution, old), _total(unit_contribution, new))
+        self.apply_occupancy(
+            _total(occupancy_contribution, old), _total(occupancy_contribution, new)
+        )
+        return self.bump_revision("unit_revision")
+
+    def apply_new_units(self, units: Iterable[Mapping[str, Any]]) -> int:
+        return self.apply_units((), units)
+
+    def apply_maintenance(
+        self, old: Mapping[str, Any] | None, new: Mapping[str, Any] | None
+    ) -> int:
+        self.apply(maintenance_contribution(old), maintenance_contribution(new))
+        return self.bump_revision("maintenance_revision")
+
+    def apply_maintenance_requests(
+        self, old: Iterable[Mapping[str, Any]], new: Iterable[Mapping[str, Any]]
+    ) -> int:
+        self.apply(
+            _total(maintenance_contribution, old),
+            _total(maintenance_contribution, new),
+        )
+        return self.bump_revision("maintenance_revision")
+
+    def recount(self) -> None:
+        totals = Counter(dict.fromkeys(COUNTERS, 0))
+        occupancy = Counter()
+        for unit in self._connection.execute(
+            "SELECT property_name, rent_status, archived FROM units"
+        ):
+            totals.update(unit_contribution(unit))
+            occupancy.update(occupancy_contribution(unit))
+        for request in self._connection.execute(
+            "SELECT status FROM maintenance_requests"
+        ):
+            totals.update(maintenance_contribution(request))
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO aggregates (name, value) VALUES (?, ?)",
+            [(name, totals[name]) for name in COUNTERS],
+        )
+        self._connection.execute(
+            "UPDATE properties SET total_units = 0, occupied_units = 0"
+        )
+        self.apply_occupancy(Counter(), occupancy)
+
+    def rebuild(self) -> None:
+        with self._connection:
+            self.recount()
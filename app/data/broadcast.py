@@ -0,0 +1,147 @@
+import asyncio
+import json
+import os
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any
+
+BROADCAST_URL = os.environ.get("PROPMANAGE_BROADCAST_URL", "")
+BROADCAST_CHANNEL = "propmanage:changes"
+COALESCE_SECONDS = 0.05
+
+Changes = dict[str, dict[int, dict[str, Any]]]
+
+
+def patch(
+    records: Sequence[Mapping[str, Any]],
+    changed: Mapping[int, Mapping[str, Any]],
+    stable_fields: Iterable[str] = (),
+) -> list[Any] | None:
+    positions = {record["id"]: index for index, record in enumerate(records)}
+    if not changed.keys() <= positions.keys():
+        return None
+    patched = list(records)
+    for record_id, record in changed.items():
+        old = patched[positions[record_id]]
+        if any(old[field] != record[field] for field in stable_fields):
+            return None
+        patched[positions[record_id]] = record
+    return patched
+
+
+def patch_shown(
+    records: Sequence[Mapping[str, Any]], changed: Mapping[int, Mapping[str, Any]]
+) -> list[Any] | None:
+    if not any(record["id"] in changed for record in records):
+        return None
+    return [changed.get(record["id"], record) for record in records]
+
+
+class Subscription:
+    def __init__(self):
+        self._queue: asyncio.Queue[tuple[str, list[dict[str, Any]]]] = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+
+    def deliver(self, kind: str, records: list[dict[str, Any]]) -> None:
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (kind, records))
+
+    async def next_batch(self, timeout: float) -> Changes:
+        try:
+            message = await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return {}
+        await asyncio.sleep(COALESCE_SECONDS)
+        batch: Changes = {}
+        while True:
+            kind, records = message
+            changed = batch.setdefault(kind, {})
+            for record in records:
+                changed[record["id"]] = record
+            try:
+                message = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return batch
+
+
+class LocalBroadcaster:
+    def __init__(self):
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    def publish(self, kind: str, records: Sequence[Mapping[str, Any]]) -> None:
+        self._deliver(kind, [dict(record) for record in records])
+
+    def _deliver(self, kind: str, records: list[dict[str, Any]]) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription.deliver(kind, records)
+            except RuntimeError:
+                with self._lock:
+                    self._subscriptions.discard(subscription)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[Subscription]:
+        subscription = Subscription()
+        with self._lock:
+            self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                self._subscriptions.discard(subscription)
+
+
+class RedisBroadcaster(LocalBroadcaster):
+    def __init__(self, url: str):
+        import redis
+
+        super().__init__()
+        self._url = url
+        self._client = redis.Redis.from_url(url)
+        self._listener: asyncio.Task | None = None
+
+    def publish(self, kind: str, records: Sequence[Mapping[str, Any]]) -> None:
+        message = json.dumps((kind, [dict(record) for record in records]))
+        self._client.publish(BROADCAST_CHANNEL, message)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[Subscription]:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+        with super().subscribe() as subscription:
+            yield subscription
+
+    async def _listen(self) -> None:
+        from redis import asyncio as aioredis
+
+        async with aioredis.Redis.from_url(self._url).pubsub() as pubsub:
+            await pubsub.subscribe(BROADCAST_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._deliver(*json.loads(message["data"]))
+
+
+def connect_broadcaster(url: str) -> LocalBroadcaster:
+    if not url or url == "memory://":
+        return LocalBroadcaster()
+    try:
+        return RedisBroadcaster(url)
+    except ImportError as e:
+        raise RuntimeError(
+            "PROPMANAGE_BROADCAST_URL needs the redis package: pip install redis"
+        ) from e
+
+
+_broadcaster = connect_broadcaster(BROADCAST_URL)
+
+
+def publish(kind: str, records: Sequence[Mapping[str, Any]]) -> None:
+    if records:
+        _broadcaster.publish(kind, records)
+
+
+def subscribe() -> AbstractContextManager[Subscription]:
+    return _broadcaster.subscribe()
@@ -0,0 +1,150 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from app.data.aggregates import AggregateEngine
+from app.data.records import RecordColumns
+
+try:
+    from redis import RedisError
+except ImportError:
+    RedisError = OSError
+
+CACHE_URL = os.environ.get("PROPMANAGE_CACHE_URL", "")
+CACHE_PREFIX = "propmanage:view:"
+CACHE_TTL_SECONDS = 600
+COLUMNS_TAG = "__record_columns__"
+STORE_ERRORS = (OSError, RedisError)
+MAX_CACHED_VIEWS = 256
+VIEW_REVISIONS = {
+    "properties": "unit_revision",
+    "units": "unit_revision",
+    "tenants": "tenant_revision",
+    "maintenance": "maintenance_revision",
+}
+
+T = TypeVar("T")
+
+
+def _encode_columns(value: Any) -> dict[str, Any]:
+    if isinstance(value, RecordColumns):
+        return {COLUMNS_TAG: value.to_json()}
+    raise TypeError(f"cannot cache {type(value).__name__} views")
+
+
+def _decode_columns(value: dict[str, Any]) -> Any:
+    if COLUMNS_TAG in value:
+        return RecordColumns.from_json(value[COLUMNS_TAG])
+    return value
+
+
+def encode(value: Any) -> bytes:
+    return json.dumps(value, default=_encode_columns, separators=(",", ":")).encode()
+
+
+def decode(payload: bytes) -> Any:
+    return json.loads(payload, object_hook=_decode_columns)
+
+
+class LocalStore:
+    def __init__(self):
+        self._values: dict[str, tuple[bytes, float | None]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> bytes | None:
+        with self._lock:
+            entry = self._values.get(name)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._values[name]
+                return None
+            return value
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        expires_at = None if ex is None else time.monotonic() + ex
+        with self._lock:
+            self._values[name] = (value, expires_at)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._values.pop(name, None) is not None for name in names)
+
+
+def connect_store(url: str) -> Any:
+    if not url:
+        return None
+    if url == "memory://":
+        return LocalStore()
+    try:
+        import redis
+    except ImportError as e:
+        raise RuntimeError(
+            "PROPMANAGE_CACHE_URL needs the redis package: pip install redis"
+        ) from e
+    return redis.Redis.from_url(url)
+
+
+class ViewCache:
+    def __init__(self, store: Any = None, max_entries: int = MAX_CACHED_VIEWS):
+        self._store = store
+        self._max_entries = max_entries
+        self._views: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.store_errors = 0
+
+    def _fetch(self, key: str) -> bytes | None:
+        if self._store is None:
+            return None
+        try:
+            return self._store.get(key)
+        except STORE_ERRORS:
+            self.store_errors += 1
+            return None
+
+    def _save(self, key: str, value: Any) -> None:
+        if self._store is None:
+            return
+        try:
+            self._store.set(key, encode(value), ex=CACHE_TTL_SECONDS)
+        except STORE_ERRORS:
+            self.store_errors += 1
+
+    def get(self, key: str, load: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._views:
+                self._views.move_to_end(key)
+                self.hits += 1
+                return self._views[key]
+            self.misses += 1
+        payload = self._fetch(key)
+        if payload is not None:
+            value = decode(payload)
+        else:
+            value = load()
+            self._save(key, value)
+        with self._lock:
+            self._views[key] = value
+            self._views.move_to_end(key)
+            while len(self._views) > self._max_entries:
+                self._views.popitem(last=False)
+        return value
+
+
+_views = ViewCache(connect_store(CACHE_URL))
+
+
+def view(
+    connection: sqlite3.Connection, kind: str, key: tuple, load: Callable[[], T]
+) -> T:
+    revision = AggregateEngine(connection).revision(VIEW_REVISIONS[kind])
+    return _views.get(f"{CACHE_PREFIX}{kind}:{revision}:{key!r}", load)
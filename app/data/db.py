@@ -0,0 +1,169 @@
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.data import seed
+from app.data.aggregates import AggregateEngine
+
+DATABASE_PATH = os.environ.get("PROPMANAGE_DB_PATH", "propmanage.db")
+
+TENANTS_TABLE = """
+CREATE TABLE IF NOT EXISTS tenants (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    unit_id INTEGER REFERENCES units (id),
+    lease_document_url TEXT NOT NULL
+)"""
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS properties (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    address TEXT NOT NULL,
+    occupied_units INTEGER NOT NULL DEFAULT 0,
+    total_units INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    image_url TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    property_name TEXT NOT NULL,
+    unit_number TEXT NOT NULL,
+    rent_amount INTEGER NOT NULL,
+    tenant_name TEXT,
+    rent_status TEXT NOT NULL,
+    lease_end TEXT,
+    archived INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_units_archived_status
+    ON units (archived, rent_status, id);
+DROP INDEX IF EXISTS idx_units_property;
+CREATE INDEX IF NOT EXISTS idx_units_location ON units (property_name, unit_number);
+{TENANTS_TABLE};
+CREATE INDEX IF NOT EXISTS idx_tenants_unit ON tenants (unit_id);
+CREATE VIEW IF NOT EXISTS tenant_details AS
+    SELECT tenants.id, tenants.name, tenants.email, tenants.phone, tenants.unit_id,
+        units.property_name, units.unit_number, tenants.lease_document_url
+    FROM tenants LEFT JOIN units ON units.id = tenants.unit_id;
+CREATE TABLE IF NOT EXISTS maintenance_requests (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    property_name TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    description TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    status TEXT NOT NULL,
+    vendor TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_maintenance_status
+    ON maintenance_requests (status, id);
+CREATE INDEX IF NOT EXISTS idx_maintenance_property
+    ON maintenance_requests (property_name);
+CREATE TABLE IF NOT EXISTS ledger_entries (
+    id INTEGER PRIMARY KEY,
+    unit_id INTEGER NOT NULL REFERENCES units (id),
+    period TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    posted_on TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ledger_charges
+    ON ledger_entries (period, unit_id) WHERE kind = 'charge';
+CREATE INDEX IF NOT EXISTS idx_ledger_unit ON ledger_entries (unit_id, id);
+CREATE TABLE IF NOT EXISTS aggregates (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO aggregates (name, value)
+    VALUES ('unit_revision', 0), ('tenant_revision', 0), ('maintenance_revision', 0),
+    ('ledger_revision', 0);
+"""
+
+INSERT_STATEMENTS = {
+    "properties": "INSERT INTO properties (id, name, address, status, image_url)"
+    " VALUES (:id, :name, :address, :status, :image_url)",
+    "units": "INSERT INTO units (id, property_name, unit_number, rent_amount,"
+    " tenant_name, rent_status, lease_end, archived)"
+    " VALUES (:id, :property_name, :unit_number, :rent_amount,"
+    " :tenant_name, :rent_status, :lease_end, :archived)",
+    "tenants": "INSERT INTO tenants (id, name, email, phone, unit_id,"
+    " lease_document_url) VALUES (:id, :name, :email, :phone, :unit_id,"
+    " :lease_document_url)",
+    "maintenance_requests": "INSERT INTO maintenance_requests (id, property_name,"
+    " unit, description, priority, status, vendor) VALUES (:id, :property_name,"
+    " :unit, :description, :priority, :status, :vendor)",
+}
+
+_local = threading.local()
+
+
+def connect(path: str = DATABASE_PATH) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, cached_statements=256)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA foreign_keys=ON")
+    migrated = _link_tenants_to_units(connection)
+    connection.executescript(SCHEMA)
+    _seed_if_empty(connection)
+    if (
+        migrated
+        or not connection.execute(
+            "SELECT 1 FROM aggregates WHERE name = 'units_total'"
+        ).fetchone()
+    ):
+        AggregateEngine(connection).rebuild()
+    return connection
+
+
+def get_connection() -> sqlite3.Connection:
+    connection = getattr(_local, "connection", None)
+    if connection is None:
+        connection = connect()
+        _local.connection = connection
+    return connection
+
+
+@contextmanager
+def transaction(connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.rollback()
+        raise
+    connection.commit()
+
+
+def _link_tenants_to_units(connection: sqlite3.Connection) -> bool:
+    columns = {row["name"] for row in connection.execute("PRAGMA table_info(tenants)")}
+    if "unit_id" in columns or not columns:
+        return False
+    with transaction(connection):
+        connection.execute("ALTER TABLE tenants RENAME TO tenants_unlinked")
+        connection.execute("DROP INDEX IF EXISTS idx_tenants_unit")
+        connection.execute(TENANTS_TABLE)
+        connection.execute(
+            "INSERT INTO tenants (id, name, email, phone, unit_id, lease_document_url)"
+            " SELECT t.id, t.name, t.email, t.phone, (SELECT MIN(u.id) FROM units u"
+            " WHERE u.property_name = t.property_name"
+            " AND u.unit_number = t.unit_number), t.lease_document_url"
+            " FROM tenants_unlinked t"
+        )
+        connection.execute("DROP TABLE tenants_unlinked")
+    return True
+
+
+def _seed_if_empty(connection: sqlite3.Connection) -> None:
+    if connection.execute("SELECT 1 FROM properties LIMIT 1").fetchone():
+        return
+    with connection:
+        connection.executemany(INSERT_STATEMENTS["properties"], seed.PROPERTIES)
+        connection.executemany(INSERT_STATEMENTS["units"], seed.UNITS)
+        connection.executemany(INSERT_STATEMENTS["tenants"], seed.TENANTS)
+        connection.executemany(
+            INSERT_STATEMENTS["maintenance_requests"], seed.MAINTENANCE_REQUESTS
+        )
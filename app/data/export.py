@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any
+
+from app.data import repository
+
+EXPORT_PAGE_SIZE = 1000
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def _keyset(fetch: Callable[[int, int], list[Any]]) -> Iterator[Mapping[str, Any]]:
+    from_id = 0
+    while True:
+        rows = fetch(from_id, EXPORT_PAGE_SIZE)
+        yield from rows
+        if len(rows) < EXPORT_PAGE_SIZE:
+            return
+        from_id = rows[-1]["id"] + 1
+
+
+def unit_rows(unit_filter: str = "All") -> Iterator[Mapping[str, Any]]:
+    query = repository.unit_filter_query(unit_filter)
+    return _keyset(
+        lambda from_id, limit: repository.units().find(
+            **query, from_id=from_id, limit=limit
+        )
+    )
+
+
+def tenant_rows() -> Iterator[Mapping[str, Any]]:
+    return _keyset(
+        lambda from_id, limit: repository.tenants().find(from_id=from_id, limit=limit)
+    )
+
+
+def maintenance_rows(status: str = "All") -> Iterator[Mapping[str, Any]]:
+    return _keyset(
+        lambda from_id, limit: repository.maintenance_requests().find_by_id(
+            None if status == "All" else status, from_id=from_id, limit=limit
+        )
+    )
+
+
+def to_csv(rows: Iterable[Mapping[str, Any]], fields: tuple[str, ...]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(
+        buffer, fieldnames=("id", *fields), extrasaction="ignore", lineterminator="\n"
+    )
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def to_json_lines(rows: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    chunk: list[str] = []
+    size = 0
+    for row in rows:
+        line = json.dumps(row) + "\n"
+        chunk.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_BYTES:
+            yield "".join(chunk)
+            chunk = []
+            size = 0
+    yield "".join(chunk)
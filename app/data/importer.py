@@ -0,0 +1,149 @@
+import csv
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any, BinaryIO
+
+from app.data import repository
+from app.data.models import ImportReport, ImportRowError
+from app.data.validation import tenant_from_form, unit_from_form
+
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson", ".json")
+
+Record = dict[str, Any] | ValueError
+Progress = Callable[[ImportReport], None]
+
+
+def parse_csv(text: io.TextIOBase) -> Iterator[tuple[int, Record]]:
+    reader = csv.DictReader(text)
+    try:
+        for row in reader:
+            row.pop(None, None)
+            yield reader.line_num, {k.strip(): v for k, v in row.items() if k}
+    except csv.Error as e:
+        yield reader.line_num, ValueError(f"Malformed CSV: {e}")
+
+
+def parse_json_lines(text: io.TextIOBase) -> Iterator[tuple[int, Record]]:
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, ValueError(f"Invalid JSON: {e.msg}.")
+            continue
+        if not isinstance(record, dict):
+            yield line_number, ValueError("Each line must be a JSON object.")
+            continue
+        yield line_number, record
+
+
+def parse(stream: BinaryIO, filename: str) -> Iterator[tuple[int, Record]]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if filename.lower().endswith(JSON_LINES_SUFFIXES):
+            yield from parse_json_lines(text)
+        else:
+            yield from parse_csv(text)
+    finally:
+        if not text.closed:
+            text.detach()
+
+
+def validate(
+    records: Iterable[tuple[int, Record]],
+    validator: Callable[[Mapping[str, Any]], dict[str, Any]],
+) -> Iterator[tuple[int, Record]]:
+    for line_number, record in records:
+        if isinstance(record, dict):
+            try:
+                record = validator(record)
+            except ValueError as e:
+                record = e
+        yield line_number, record
+
+
+def load(
+    records: Iterable[tuple[int, Record]],
+    insert: Callable[[list[dict[str, Any]]], Any],
+    batch_size: int = IMPORT_BATCH_SIZE,
+    progress: Progress | None = None,
+) -> ImportReport:
+    report = ImportReport(imported=0, failed=0, errors=[])
+    batch: list[dict[str, Any]] = []
+    for processed, (line_number, record) in enumerate(records, start=1):
+        if isinstance(record, ValueError):
+            report["failed"] += 1
+            if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                report["errors"].append(
+                    ImportRowError(line=line_number, message=str(record))
+                )
+        else:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                insert(batch)
+                report["imported"] += len(batch)
+                batch = []
+        if progress is not None and processed % batch_size == 0:
+            progress(report)
+    if batch:
+        insert(batch)
+        report["imported"] += len(batch)
+    if progress is not None:
+        progress(report)
+    return report
+
+
+def _at_known_property(
+    validator: Callable[[Mapping[str, Any]], dict[str, Any]],
+) -> Callable[[Mapping[str, Any]], dict[str, Any]]:
+    names = {prop["name"] for prop in repository.properties().find()}
+
+    def validate_record(record: Mapping[str, Any]) -> dict[str, Any]:
+        validated = validator(record)
+        if validated["property_name"] not in names:
+            raise ValueError(f"Unknown property: {validated['property_name']}.")
+        return validated
+
+    return validate_record
+
+
+def _at_known_unit(
+    validator: Callable[[Mapping[str, Any]], dict[str, Any]],
+) -> Callable[[Mapping[str, Any]], dict[str, Any]]:
+    units = repository.units()
+
+    def validate_record(record: Mapping[str, Any]) -> dict[str, Any]:
+        validated = validator(record)
+        unit_id = units.locate(validated["property_name"], validated["unit_number"])
+        if unit_id is None:
+            raise ValueError(
+                f"Unknown unit: {validated['unit_number']}"
+                f" at {validated['property_name']}."
+            )
+        return {**validated, "unit_id": unit_id}
+
+    return validate_record
+
+
+def import_units(
+    stream: BinaryIO, filename: str, progress: Progress | None = None
+) -> ImportReport:
+    return load(
+        validate(parse(stream, filename), _at_known_property(unit_from_form)),
+        repository.units().add_many,
+        progress=progress,
+    )
+
+
+def import_tenants(
+    stream: BinaryIO, filename: str, progress: Progress | None = None
+) -> ImportReport:
+    return load(
+        validate(parse(stream, filename), _at_known_unit(tenant_from_form)),
+        repository.tenants().add_many,
+        progress=progress,
+    )
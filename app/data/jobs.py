@@ -0,0 +1,82 @@
+import asyncio
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+JOB_WORKERS = int(os.environ.get("PROPMANAGE_JOB_WORKERS", "2"))
+PROGRESS_INTERVAL = 0.5
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, run: Callable[["Job"], Any]):
+        self.done = 0
+        self.total = 0
+        self.counts: dict[str, int] = {}
+        self._run = run
+        self._cancelled = threading.Event()
+        self.future: asyncio.Future = asyncio.get_running_loop().run_in_executor(
+            _pool, self._execute
+        )
+
+    def _execute(self) -> Any:
+        self.check()
+        return self._run(self)
+
+    def check(self) -> None:
+        if self._cancelled.is_set():
+            raise JobCancelled()
+
+    def advance(self, done: int, total: int | None = None, **counts: int) -> None:
+        self.done = done
+        if total is not None:
+            self.total = total
+        self.counts.update(counts)
+        self.check()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def percent(self) -> int:
+        if not self.total:
+            return 0
+        return min(100, self.done * 100 // self.total)
+
+
+_pool = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="propmanage-job")
+_jobs: dict[str, Job] = {}
+
+
+def start(key: str, run: Callable[[Job], Any]) -> Job | None:
+    current = _jobs.get(key)
+    if current is not None and not current.future.done():
+        return None
+    job = _jobs[key] = Job(run)
+    return job
+
+
+def get(key: str) -> Job | None:
+    return _jobs.get(key)
+
+
+def finish(key: str, job: Job) -> None:
+    if _jobs.get(key) is job:
+        del _jobs[key]
+
+
+def cancel(key: str) -> bool:
+    job = _jobs.get(key)
+    if job is None or job.future.done():
+        return False
+    job.cancel()
+    return True
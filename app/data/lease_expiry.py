@@ -0,0 +1,157 @@
+import bisect
+import datetime
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from app.data.aggregates import AggregateEngine
+from app.data.validation import parse_lease_end
+
+EXPIRY_WINDOWS = (30, 60, 90)
+
+Entry = tuple[int, int]
+
+
+class LeaseExpiryIndex:
+    def __init__(self, revision: int = 0):
+        self.revision = revision
+        self.entries: list[Entry] = []
+        self.by_property: dict[str, list[Entry]] = {}
+        self._leases: dict[int, tuple[str, Entry]] = {}
+
+    @classmethod
+    def load(cls, connection: sqlite3.Connection) -> "LeaseExpiryIndex":
+        connection.execute("BEGIN")
+        try:
+            index = cls(AggregateEngine(connection).unit_revision())
+            rows = connection.execute(
+                "SELECT id, property_name, lease_end FROM units"
+                " WHERE lease_end IS NOT NULL AND NOT archived"
+            ).fetchall()
+        finally:
+            connection.commit()
+        for unit_id, property_name, lease_end in rows:
+            ends = parse_lease_end(lease_end)
+            if ends is not None:
+                entry = (ends.toordinal(), unit_id)
+                index._leases[unit_id] = (property_name, entry)
+                index.by_property.setdefault(property_name, []).append(entry)
+        index.entries = sorted(entry for _, entry in index._leases.values())
+        for entries in index.by_property.values():
+            entries.sort()
+        return index
+
+    def _remove(self, unit_id: int) -> None:
+        lease = self._leases.pop(unit_id, None)
+        if lease is None:
+            return
+        property_name, entry = lease
+        for entries in (self.entries, self.by_property[property_name]):
+            position = bisect.bisect_left(entries, entry)
+            if position < len(entries) and entries[position] == entry:
+                del entries[position]
+
+    def put(self, unit: Mapping[str, Any]) -> None:
+        self._remove(unit["id"])
+        ends = None if unit["archived"] else parse_lease_end(unit["lease_end"])
+        if ends is None:
+            return
+        entry = (ends.toordinal(), unit["id"])
+        self._leases[unit["id"]] = (unit["property_name"], entry)
+        bisect.insort(self.entries, entry)
+        bisect.insort(self.by_property.setdefault(unit["property_name"], []), entry)
+
+    @staticmethod
+    def _span(
+        entries: list[Entry], start: datetime.date, end: datetime.date
+    ) -> tuple[int, int]:
+        return (
+            bisect.bisect_left(entries, (start.toordinal(),)),
+            bisect.bisect_left(entries, (end.toordinal() + 1,)),
+        )
+
+    def expiring(
+        self, start: datetime.date, end: datetime.date, limit: int = -1
+    ) -> list[Entry]:
+        first, last = self._span(self.entries, start, end)
+        if limit >= 0:
+            last = min(last, first + limit)
+        return self.entries[first:last]
+
+    def counts(
+        self,
+        start: datetime.date,
+        windows: Iterable[int],
+        property_name: str | None = None,
+    ) -> list[int]:
+        entries = (
+            self.entries
+            if property_name is None
+            else self.by_property.get(property_name, [])
+        )
+        counts = []
+        for days in windows:
+            first, last = self._span(
+                entries, start, start + datetime.timedelta(days=days)
+            )
+            counts.append(last - first)
+        return counts
+
+
+_cache: LeaseExpiryIndex | None = None
+_lock = threading.Lock()
+
+
+def _index(connection: sqlite3.Connection) -> LeaseExpiryIndex:
+    global _cache
+    revision = AggregateEngine(connection).unit_revision()
+    if _cache is None or _cache.revision != revision:
+        _cache = LeaseExpiryIndex.load(connection)
+    return _cache
+
+
+def expiring(
+    connection: sqlite3.Connection,
+    start: datetime.date,
+    end: datetime.date,
+    limit: int = -1,
+) -> list[Entry]:
+    with _lock:
+        return _index(connection).expiring(start, end, limit)
+
+
+def counts(
+    connection: sqlite3.Connection,
+    start: datetime.date,
+    windows: Iterable[int] = EXPIRY_WINDOWS,
+) -> list[int]:
+    with _lock:
+        return _index(connection).counts(start, windows)
+
+
+def pipeline(
+    connection: sqlite3.Connection,
+    start: datetime.date,
+    windows: Iterable[int] = EXPIRY_WINDOWS,
+) -> list[tuple[str, list[int]]]:
+    windows = tuple(windows)
+    with _lock:
+        index = _index(connection)
+        rows = [
+            (name, index.counts(start, windows, name))
+            for name in sorted(index.by_property)
+        ]
+    return [(name, counts) for name, counts in rows if any(counts)]
+
+
+def record_write(unit: Mapping[str, Any], revision: int) -> None:
+    record_writes([unit], revision)
+
+
+def record_writes(units: Iterable[Mapping[str, Any]], revision: int) -> None:
+    with _lock:
+        if _cache is not None and _cache.revision == revision - 1:
+            for unit in units:
+                _cache.put(unit)
+            _cache.revision = revision
@@ -0,0 +1,196 @@
+import datetime
+import sqlite3
+import threading
+from collections.abc import Iterable
+
+import numpy as np
+
+from app.data.aggregates import AggregateEngine
+
+AGING_BUCKETS = ("0-30", "31-60", "61-90", "90+")
+AGING_LIMITS = (30, 60, 90)
+GRACE_DAYS = 5
+CHARGE = "charge"
+PAYMENT = "payment"
+
+
+def period_of(day: datetime.date) -> str:
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+def due_date(period: str) -> datetime.date:
+    return datetime.date.fromisoformat(f"{period}-01")
+
+
+def previous_period(period: str) -> str:
+    return period_of(due_date(period) - datetime.timedelta(days=1))
+
+
+class RentLedger:
+    def __init__(self, revision: int = 0):
+        self.revision = revision
+        self.unit_ids = np.zeros(0, dtype=np.int64)
+        self.paid = np.zeros(0, dtype=np.int64)
+        self.charges = np.zeros((0, 0), dtype=np.int64)
+        self.periods: list[str] = []
+        self._columns: dict[str, int] = {}
+        self._slots: dict[int, int] = {}
+
+    @classmethod
+    def load(cls, connection: sqlite3.Connection) -> "RentLedger":
+        connection.execute("BEGIN")
+        try:
+            ledger = cls(AggregateEngine(connection).revision("ledger_revision"))
+            charges = connection.execute(
+                "SELECT unit_id, period, SUM(amount) FROM ledger_entries"
+                " WHERE kind = ? GROUP BY unit_id, period",
+                (CHARGE,),
+            ).fetchall()
+            payments = connection.execute(
+                "SELECT unit_id, SUM(amount) FROM ledger_entries"
+                " WHERE kind = ? GROUP BY unit_id",
+                (PAYMENT,),
+            ).fetchall()
+        finally:
+            connection.commit()
+        for period in sorted({row[1] for row in charges}):
+            ledger._column(period)
+        if charges:
+            ledger.charge_many(
+                np.fromiter((row[0] for row in charges), dtype=np.int64),
+                [row[1] for row in charges],
+                np.fromiter((row[2] for row in charges), dtype=np.int64),
+            )
+        if payments:
+            ledger.pay_many(
+                np.fromiter((row[0] for row in payments), dtype=np.int64),
+                np.fromiter((row[1] for row in payments), dtype=np.int64),
+            )
+        return ledger
+
+    def _column(self, period: str) -> int:
+        column = self._columns.get(period)
+        if column is None:
+            column = self._columns[period] = len(self.periods)
+            self.periods.append(period)
+            self.charges = np.pad(self.charges, ((0, 0), (0, 1)))
+        return column
+
+    def _slots_for(self, unit_ids: np.ndarray) -> np.ndarray:
+        slots = np.empty(len(unit_ids), dtype=np.int64)
+        for index, unit_id in enumerate(unit_ids.tolist()):
+            slot = self._slots.get(unit_id)
+            if slot is None:
+                slot = self._slots[unit_id] = len(self._slots)
+            slots[index] = slot
+        size = len(self._slots)
+        if size > len(self.unit_ids):
+            capacity = max(16, 2 * len(self.unit_ids), size)
+            grown = capacity - len(self.unit_ids)
+            self.unit_ids = np.pad(self.unit_ids, (0, grown))
+            self.paid = np.pad(self.paid, (0, grown))
+            self.charges = np.pad(self.charges, ((0, grown), (0, 0)))
+        self.unit_ids[slots] = unit_ids
+        return slots
+
+    def charge_many(
+        self, unit_ids: np.ndarray, periods: str | list[str], amounts: np.ndarray
+    ) -> None:
+        if isinstance(periods, str):
+            columns = self._column(periods)
+        else:
+            columns = np.fromiter(
+                (self._column(period) for period in periods),
+                dtype=np.int64,
+                count=len(periods),
+            )
+        slots = self._slots_for(unit_ids)
+        np.add.at(self.charges, (slots, columns), amounts)
+
+    def pay_many(self, unit_ids: np.ndarray, amounts: np.ndarray) -> None:
+        slots = self._slots_for(unit_ids)
+        np.add.at(self.paid, slots, amounts)
+
+    def unpaid(self, as_of: datetime.date) -> tuple[np.ndarray, np.ndarray]:
+        size = len(self._slots)
+        order = np.argsort(self.periods)[::-1]
+        charges = self.charges[:size, order]
+        balance = charges.sum(axis=1) - self.paid[:size]
+        newer = np.cumsum(charges, axis=1) - charges
+        unpaid = np.clip(balance[:, None] - newer, 0, charges)
+        days = as_of.toordinal() - np.fromiter(
+            (due_date(self.periods[column]).toordinal() for column in order),
+            dtype=np.int64,
+            count=len(order),
+        )
+        return unpaid, days
+
+    def aging(self, as_of: datetime.date) -> np.ndarray:
+        unpaid, days = self.unpaid(as_of)
+        late = days > GRACE_DAYS
+        buckets = np.searchsorted(AGING_LIMITS, days[late])
+        return unpaid[:, late] @ np.eye(len(AGING_BUCKETS), dtype=np.int64)[buckets]
+
+    def overdue(self, as_of: datetime.date) -> np.ndarray:
+        unpaid, days = self.unpaid(as_of)
+        return unpaid[:, days > GRACE_DAYS].sum(axis=1) > 0
+
+    def balance(self, unit_id: int) -> int:
+        slot = self._slots.get(unit_id)
+        if slot is None:
+            return 0
+        return int(self.charges[slot].sum() - self.paid[slot])
+
+
+_cache: RentLedger | None = None
+_lock = threading.Lock()
+
+
+def _ledger(connection: sqlite3.Connection) -> RentLedger:
+    global _cache
+    revision = AggregateEngine(connection).revision("ledger_revision")
+    if _cache is None or _cache.revision != revision:
+        _cache = RentLedger.load(connection)
+    return _cache
+
+
+def aging(
+    connection: sqlite3.Connection, as_of: datetime.date
+) -> tuple[np.ndarray, np.ndarray]:
+    with _lock:
+        ledger = _ledger(connection)
+        return ledger.unit_ids[: len(ledger._slots)].copy(), ledger.aging(as_of)
+
+
+def overdue(
+    connection: sqlite3.Connection, as_of: datetime.date
+) -> tuple[np.ndarray, np.ndarray]:
+    with _lock:
+        ledger = _ledger(connection)
+        return ledger.unit_ids[: len(ledger._slots)].copy(), ledger.overdue(as_of)
+
+
+def balance(connection: sqlite3.Connection, unit_id: int) -> int:
+    with _lock:
+        return _ledger(connection).balance(unit_id)
+
+
+def record_charges(
+    unit_ids: np.ndarray, period: str, amounts: np.ndarray, revision: int
+) -> None:
+    with _lock:
+        if _cache is not None and _cache.revision == revision - 1:
+            _cache.charge_many(unit_ids, period, amounts)
+            _cache.revision = revision
+
+
+def record_payments(
+    unit_ids: Iterable[int], amounts: Iterable[int], revision: int
+) -> None:
+    with _lock:
+        if _cache is not None and _cache.revision == revision - 1:
+            _cache.pay_many(
+                np.fromiter(unit_ids, dtype=np.int64),
+                np.fromiter(amounts, dtype=np.int64),
+            )
+            _cache.revision = revision
@@ -0,0 +1,70 @@
+import secrets
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from app.data.models import ListPatch
+
+
+def new_epoch() -> str:
+    return secrets.token_hex(4)
+
+
+def empty(epoch: str = "") -> ListPatch:
+    return ListPatch(
+        epoch=epoch, seq=0, updated={}, removed=[], prepended=[], appended=[]
+    )
+
+
+def size(patch: ListPatch) -> int:
+    return (
+        len(patch["updated"])
+        + len(patch["removed"])
+        + len(patch["prepended"])
+        + len(patch["appended"])
+    )
+
+
+def carried(patch: ListPatch) -> int:
+    return len(patch["updated"]) + len(patch["prepended"]) + len(patch["appended"])
+
+
+def apply(records: Sequence[Mapping[str, Any]], patch: ListPatch) -> list[Any]:
+    removed = set(patch["removed"])
+    updated = patch["updated"]
+    return (
+        list(patch["prepended"])
+        + [
+            updated.get(str(record["id"]), record)
+            for record in records
+            if record["id"] not in removed
+        ]
+        + list(patch["appended"])
+    )
+
+
+def diff(
+    base: Sequence[Mapping[str, Any]], records: Sequence[Mapping[str, Any]]
+) -> ListPatch | None:
+    ids = {record["id"] for record in records}
+    kept = [record for record in base if record["id"] in ids]
+    start = 0
+    if kept:
+        first = kept[0]["id"]
+        start = next(i for i, record in enumerate(records) if record["id"] == first)
+    end = start + len(kept)
+    if [record["id"] for record in records[start:end]] != [
+        record["id"] for record in kept
+    ]:
+        return None
+    patch = empty()
+    patch["updated"] = {
+        str(record["id"]): dict(record)
+        for old, record in zip(kept, records[start:end])
+        if old != record
+    }
+    patch["removed"] = [record["id"] for record in base if record["id"] not in ids]
+    patch["prepended"] = [dict(record) for record in records[:start]]
+    patch["appended"] = [dict(record) for record in records[end:]]
+    if carried(patch) > len(records) // 2:
+        return None
+    return patch
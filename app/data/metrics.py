@@ -0,0 +1,204 @@
+import functools
+import inspect
+import os
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from app.data.models import HandlerMetric
+
+METRICS_ENABLED = os.environ.get("PROPMANAGE_METRICS", "") not in ("", "0")
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class HandlerStats:
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.updates = 0
+        self.process_seconds = 0.0
+        self.delta_bytes = 0
+
+    def observe(self, seconds: float, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+                break
+
+
+_handlers: dict[str, HandlerStats] = {}
+_recomputes: Counter[str] = Counter()
+
+
+def _stats(handler: str) -> HandlerStats:
+    stats = _handlers.get(handler)
+    if stats is None:
+        stats = _handlers[handler] = HandlerStats()
+    return stats
+
+
+def observe_call(handler: str, seconds: float, failed: bool = False) -> None:
+    _stats(handler).observe(seconds, failed)
+
+
+def observe_update(handler: str, size: int, recomputed: Iterable[str]) -> None:
+    stats = _stats(handler)
+    stats.updates += 1
+    stats.delta_bytes += size
+    _recomputes.update(recomputed)
+
+
+def observe_processed(handler: str, seconds: float) -> None:
+    _stats(handler).process_seconds += seconds
+
+
+def timed(fn: Callable) -> Callable:
+    name = fn.__qualname__
+
+    if inspect.isasyncgenfunction(fn):
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start, failed = time.perf_counter(), True
+            try:
+                async for item in fn(*args, **kwargs):
+                    yield item
+                failed = False
+            finally:
+                observe_call(name, time.perf_counter() - start, failed)
+
+    elif inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start, failed = time.perf_counter(), True
+            try:
+                result = await fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                observe_call(name, time.perf_counter() - start, failed)
+
+    elif inspect.isgeneratorfunction(fn):
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start, failed = time.perf_counter(), True
+            try:
+                result = yield from fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                observe_call(name, time.perf_counter() - start, failed)
+
+    else:
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start, failed = time.perf_counter(), True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                observe_call(name, time.perf_counter() - start, failed)
+
+    return wrapper
+
+
+def handler_metrics() -> list[HandlerMetric]:
+    rows = [
+        HandlerMetric(
+            handler=handler,
+            calls=stats.calls,
+            errors=stats.errors,
+            mean_ms=round(stats.seconds / stats.calls * 1000, 2) if stats.calls else 0,
+            max_ms=round(stats.max_seconds * 1000, 2),
+            total_ms=round(stats.seconds * 1000, 1),
+            process_ms=round(stats.process_seconds * 1000, 1),
+            delta_bytes=stats.delta_bytes,
+        )
+        for handler, stats in _handlers.items()
+    ]
+    return sorted(
+        rows, key=lambda row: max(row["total_ms"], row["process_ms"]), reverse=True
+    )
+
+
+def recompute_counts() -> list[tuple[str, int]]:
+    return _recomputes.most_common()
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _family(name: str, kind: str, help_text: str) -> Iterator[str]:
+    yield f"# HELP {name} {help_text}"
+    yield f"# TYPE {name} {kind}"
+
+
+def _lines() -> Iterator[str]:
+    handlers = sorted(_handlers.items())
+    yield from _family(
+        "propmanage_event_seconds",
+        "histogram",
+        "Wall time spent inside state event handlers.",
+    )
+    for handler, stats in handlers:
+        label = f'handler="{_label(handler)}"'
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+            cumulative += count
+            yield f'propmanage_event_seconds_bucket{{{label},le="{bound}"}} {cumulative}'
+        yield f'propmanage_event_seconds_bucket{{{label},le="+Inf"}} {stats.calls}'
+        yield f"propmanage_event_seconds_sum{{{label}}} {stats.seconds}"
+        yield f"propmanage_event_seconds_count{{{label}}} {stats.calls}"
+    counters: tuple[tuple[str, str, Callable[[HandlerStats], Any]], ...] = (
+        (
+            "propmanage_event_errors_total",
+            "Event handler calls that raised.",
+            lambda s: s.errors,
+        ),
+        (
+            "propmanage_state_updates_total",
+            "State updates emitted by event handlers.",
+            lambda s: s.updates,
+        ),
+        (
+            "propmanage_event_process_seconds_total",
+            (
+                "Time from receiving an event to its final state update,"
+                " including computed var recomputes."
+            ),
+            lambda s: s.process_seconds,
+        ),
+        (
+            "propmanage_delta_bytes_total",
+            "Serialized size of emitted state deltas.",
+            lambda s: s.delta_bytes,
+        ),
+    )
+    for name, help_text, value in counters:
+        yield from _family(name, "counter", help_text)
+        for handler, stats in handlers:
+            yield f'{name}{{handler="{_label(handler)}"}} {value(stats)}'
+    yield from _family(
+        "propmanage_computed_var_recomputes_total",
+        "counter",
+        "Computed var values recomputed and sent in a state delta.",
+    )
+    for var, count in sorted(_recomputes.items()):
+        yield f'propmanage_computed_var_recomputes_total{{var="{_label(var)}"}} {count}'
+
+
+def render() -> str:
+    return "\n".join(_lines()) + "\n"
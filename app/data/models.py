@@ -0,0 +1,113 @@
+from typing import Literal, TypedDict
+
+
+class Property(TypedDict):
+    id: int
+    name: str
+    address: str
+    occupied_units: int
+    total_units: int
+    status: Literal["occupied", "vacant", "maintenance"]
+    image_url: str
+
+
+class Unit(TypedDict):
+    id: int
+    property_name: str
+    unit_number: str
+    rent_amount: int
+    tenant_name: str | None
+    rent_status: Literal["Paid", "Overdue", "Vacant"]
+    lease_end: str | None
+    archived: bool
+
+
+class Tenant(TypedDict):
+    id: int
+    name: str
+    email: str
+    phone: str
+    unit_id: int | None
+    property_name: str | None
+    unit_number: str | None
+    lease_document_url: str
+
+
+class MaintenanceRequest(TypedDict):
+    id: int
+    property_name: str
+    unit: str
+    description: str
+    priority: Literal["Low", "Medium", "High"]
+    status: Literal["Open", "In Progress", "Completed"]
+    vendor: str | None
+
+
+class RentRollRow(TypedDict):
+    property_name: str
+    collected: int
+    overdue: int
+    vacant: int
+
+
+class ImportRowError(TypedDict):
+    line: int
+    message: str
+
+
+class ImportReport(TypedDict):
+    imported: int
+    failed: int
+    errors: list[ImportRowError]
+
+
+class HandlerMetric(TypedDict):
+    handler: str
+    calls: int
+    errors: int
+    mean_ms: float
+    max_ms: float
+    total_ms: float
+    process_ms: float
+    delta_bytes: int
+
+
+class ListPatch(TypedDict):
+    epoch: str
+    seq: int
+    updated: dict[str, dict]
+    removed: list[int]
+    prepended: list[dict]
+    appended: list[dict]
+
+
+class LeaseWindow(TypedDict):
+    days: int
+    units: int
+
+
+class RenewalPipelineRow(TypedDict):
+    property_name: str
+    counts: list[int]
+
+
+class LeaseRenewal(TypedDict):
+    unit_id: int
+    property_name: str
+    unit_number: str
+    tenant_name: str | None
+    lease_end: str
+    days_left: int
+
+
+class AgingBucket(TypedDict):
+    label: str
+    amount: int
+    units: int
+
+
+class BillingReport(TypedDict):
+    period: str
+    charged: int
+    overdue: int
+    paid: int
@@ -0,0 +1,122 @@
+import sys
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+
+from app.data.models import MaintenanceRequest, Unit
+
+INTEGER = "integer"
+FLAG = "flag"
+CATEGORY = "category"
+TEXT = "text"
+DTYPES = {INTEGER: np.int64, FLAG: np.bool_, CATEGORY: np.int32}
+
+UNIT_SCHEMA = {
+    "id": INTEGER,
+    "property_name": CATEGORY,
+    "unit_number": TEXT,
+    "rent_amount": INTEGER,
+    "tenant_name": TEXT,
+    "rent_status": CATEGORY,
+    "lease_end": CATEGORY,
+    "archived": FLAG,
+}
+TICKET_SCHEMA = {
+    "id": INTEGER,
+    "property_name": CATEGORY,
+    "unit": TEXT,
+    "description": TEXT,
+    "priority": CATEGORY,
+    "status": CATEGORY,
+    "vendor": CATEGORY,
+}
+
+
+def intern(value: str | None) -> str | None:
+    return sys.intern(value) if value else value
+
+
+class RecordColumns:
+    def __init__(
+        self, schema: Mapping[str, str], records: Iterable[Mapping[str, Any]] = ()
+    ):
+        self.schema = dict(schema)
+        self.categories: dict[str, list[Any]] = {}
+        self.columns: dict[str, Any] = {}
+        values: dict[str, list[Any]] = {field: [] for field in self.schema}
+        for record in records:
+            for field, column in values.items():
+                column.append(record[field])
+        for field, kind in self.schema.items():
+            if kind == CATEGORY:
+                self.columns[field] = self._encode(field, values[field])
+            elif kind == TEXT:
+                self.columns[field] = values[field]
+            else:
+                self.columns[field] = np.array(values[field], dtype=DTYPES[kind])
+
+    def _encode(self, field: str, values: list[Any]) -> np.ndarray:
+        categories: list[Any] = []
+        codes: dict[Any, int] = {}
+        encoded = np.empty(len(values), dtype=DTYPES[CATEGORY])
+        for position, value in enumerate(values):
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(categories)
+                categories.append(intern(value) if isinstance(value, str) else value)
+            encoded[position] = code
+        self.categories[field] = categories
+        return encoded
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def _decode(self, field: str, start: int, stop: int | None) -> list[Any]:
+        kind = self.schema[field]
+        column = self.columns[field][start:stop]
+        if kind == TEXT:
+            return column
+        if kind == CATEGORY:
+            categories = self.categories[field]
+            return [categories[code] for code in column.tolist()]
+        return column.tolist()
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "schema": self.schema,
+            "categories": self.categories,
+            "columns": {
+                field: column if self.schema[field] == TEXT else column.tolist()
+                for field, column in self.columns.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "RecordColumns":
+        columns = cls(data["schema"])
+        columns.categories = {
+            field: [
+                intern(value) if isinstance(value, str) else value for value in values
+            ]
+            for field, values in data["categories"].items()
+        }
+        for field, values in data["columns"].items():
+            kind = columns.schema[field]
+            columns.columns[field] = (
+                values if kind == TEXT else np.array(values, dtype=DTYPES[kind])
+            )
+        return columns
+
+    def rows(self, start: int = 0, stop: int | None = None) -> list[dict[str, Any]]:
+        fields = list(self.schema)
+        columns = [self._decode(field, start, stop) for field in fields]
+        return [dict(zip(fields, values)) for values in zip(*columns)]
+
+
+def unit_columns(units: Iterable[Unit]) -> RecordColumns:
+    return RecordColumns(UNIT_SCHEMA, units)
+
+
+def ticket_columns(tickets: Iterable[MaintenanceRequest]) -> RecordColumns:
+    return RecordColumns(TICKET_SCHEMA, tickets)
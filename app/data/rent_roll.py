@@ -0,0 +1,116 @@
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+
+from app.data.aggregates import AggregateEngine
+from app.data.models import RentRollRow
+from app.data.validation import RENT_STATUSES
+
+STATUS_CODES = {status: code for code, status in enumerate(RENT_STATUSES)}
+ARCHIVED = len(RENT_STATUSES)
+
+
+class RentRoll:
+    def __init__(self, revision: int = 0):
+        self.revision = revision
+        self.rents = np.zeros(0, dtype=np.int64)
+        self.statuses = np.zeros(0, dtype=np.int8)
+        self.properties = np.zeros(0, dtype=np.int32)
+        self.property_names: list[str] = []
+        self._property_codes: dict[str, int] = {}
+        self._slots: dict[int, int] = {}
+
+    @classmethod
+    def load(cls, connection: sqlite3.Connection) -> "RentRoll":
+        connection.execute("BEGIN")
+        try:
+            roll = cls(AggregateEngine(connection).unit_revision())
+            rows = connection.execute(
+                "SELECT id, rent_amount, rent_status, property_name, archived"
+                " FROM units"
+            ).fetchall()
+        finally:
+            connection.commit()
+        roll._slots = {row[0]: slot for slot, row in enumerate(rows)}
+        roll.rents = np.fromiter((r[1] for r in rows), dtype=np.int64, count=len(rows))
+        roll.statuses = np.fromiter(
+            (ARCHIVED if r[4] else STATUS_CODES[r[2]] for r in rows),
+            dtype=np.int8,
+            count=len(rows),
+        )
+        roll.properties = np.fromiter(
+            (roll._property_code(r[3]) for r in rows), dtype=np.int32, count=len(rows)
+        )
+        return roll
+
+    def _property_code(self, name: str) -> int:
+        code = self._property_codes.get(name)
+        if code is None:
+            code = self._property_codes[name] = len(self.property_names)
+            self.property_names.append(name)
+        return code
+
+    def put(self, unit: Mapping[str, Any]) -> None:
+        slot = self._slots.get(unit["id"])
+        if slot is None:
+            slot = self._slots[unit["id"]] = len(self._slots)
+            if slot >= len(self.rents):
+                capacity = max(16, 2 * len(self.rents))
+                self.rents = np.resize(self.rents, capacity)
+                self.statuses = np.resize(self.statuses, capacity)
+                self.properties = np.resize(self.properties, capacity)
+        self.rents[slot] = unit["rent_amount"]
+        self.statuses[slot] = (
+            ARCHIVED if unit["archived"] else STATUS_CODES[unit["rent_status"]]
+        )
+        self.properties[slot] = self._property_code(unit["property_name"])
+
+    def by_property(self) -> list[RentRollRow]:
+        size = len(self._slots)
+        width = ARCHIVED + 1
+        cells = self.properties[:size].astype(np.int64) * width + self.statuses[:size]
+        length = len(self.property_names) * width
+        grid = np.bincount(cells, weights=self.rents[:size], minlength=length).reshape(
+            -1, width
+        )
+        active = np.bincount(cells, minlength=length).reshape(-1, width)[:, :ARCHIVED]
+        return [
+            RentRollRow(
+                property_name=name,
+                collected=int(grid[code, STATUS_CODES["Paid"]]),
+                overdue=int(grid[code, STATUS_CODES["Overdue"]]),
+                vacant=int(grid[code, STATUS_CODES["Vacant"]]),
+            )
+            for code, name in sorted(
+                enumerate(self.property_names), key=lambda item: item[1]
+            )
+            if active[code].any()
+        ]
+
+
+_cache: RentRoll | None = None
+_lock = threading.Lock()
+
+
+def by_property(connection: sqlite3.Connection) -> list[RentRollRow]:
+    global _cache
+    revision = AggregateEngine(connection).unit_revision()
+    with _lock:
+        if _cache is None or _cache.revision != revision:
+            _cache = RentRoll.load(connection)
+        return _cache.by_property()
+
+
+def record_write(unit: Mapping[str, Any], revision: int) -> None:
+    record_writes([unit], revision)
+
+
+def record_writes(units: Iterable[Mapping[str, Any]], revision: int) -> None:
+    with _lock:
+        if _cache is not None and _cache.revision == revision - 1:
+            for unit in units:
+                _cache.put(unit)
+            _cache.revision = revision
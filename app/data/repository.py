@@ -0,0 +1,953 @@
+import datetime
+import sqlite3
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from app.data import (
+    broadcast,
+    cache,
+    lease_expiry,
+    ledger,
+    records,
+    rent_roll,
+    search,
+    ticket_order,
+)
+from app.data.aggregates import AggregateEngine
+from app.data.db import get_connection, transaction
+from app.data.models import (
+    AgingBucket,
+    BillingReport,
+    LeaseRenewal,
+    LeaseWindow,
+    MaintenanceRequest,
+    Property,
+    RenewalPipelineRow,
+    RentRollRow,
+    Tenant,
+    Unit,
+)
+
+DEFAULT_TICKET_SORT = ("status",)
+SEARCH_CANDIDATES = 1000
+SEARCH_RESULTS = 50
+SEARCH_FETCH_BATCH = 100
+RENEWALS_SHOWN = 10
+BATCH_CHUNK_SIZE = 500
+BILLING_BATCH_SIZE = 5000
+
+BillingProgress = Callable[[int, int], None]
+
+UNIT_FIELDS = (
+    "property_name",
+    "unit_number",
+    "rent_amount",
+    "tenant_name",
+    "rent_status",
+    "lease_end",
+    "archived",
+)
+TENANT_FIELDS = (
+    "name",
+    "email",
+    "phone",
+    "unit_id",
+    "property_name",
+    "unit_number",
+    "lease_document_url",
+)
+MAINTENANCE_FIELDS = (
+    "property_name",
+    "unit",
+    "description",
+    "priority",
+    "status",
+    "vendor",
+)
+
+
+def unit_filter_query(unit_filter: str) -> dict[str, Any]:
+    if unit_filter == "All":
+        return {}
+    if unit_filter == "Archived":
+        return {"archived": True}
+    return {"rent_status": unit_filter}
+
+
+def _row_to_unit(row: sqlite3.Row) -> Unit:
+    return Unit(
+        id=row["id"],
+        property_name=records.intern(row["property_name"]),
+        unit_number=row["unit_number"],
+        rent_amount=row["rent_amount"],
+        tenant_name=row["tenant_name"],
+        rent_status=records.intern(row["rent_status"]),
+        lease_end=records.intern(row["lease_end"]),
+        archived=bool(row["archived"]),
+    )
+
+
+def _row_to_maintenance_request(row: sqlite3.Row) -> MaintenanceRequest:
+    return MaintenanceRequest(
+        id=row["id"],
+        property_name=records.intern(row["property_name"]),
+        unit=row["unit"],
+        description=row["description"],
+        priority=records.intern(row["priority"]),
+        status=records.intern(row["status"]),
+        vendor=records.intern(row["vendor"]),
+    )
+
+
+def _update(
+    connection: sqlite3.Connection,
+    table: str,
+    allowed_fields: tuple[str, ...],
+    record_id: int,
+    changes: Mapping[str, Any],
+) -> None:
+    _update_many(connection, table, allowed_fields, [record_id], changes)
+
+
+def _update_many(
+    connection: sqlite3.Connection,
+    table: str,
+    allowed_fields: tuple[str, ...],
+    record_ids: Sequence[int],
+    changes: Mapping[str, Any],
+) -> None:
+    unknown = set(changes) - set(allowed_fields)
+    if unknown:
+        raise ValueError(f"Unknown {table} fields: {sorted(unknown)}")
+    fields = [f for f in allowed_fields if f in changes]
+    if not fields:
+        return
+    assignments = ", ".join(f"{f} = ?" for f in fields)
+    values = [changes[f] for f in fields]
+    for start in range(0, len(record_ids), BATCH_CHUNK_SIZE):
+        chunk = record_ids[start : start + BATCH_CHUNK_SIZE]
+        placeholders = ", ".join("?" * len(chunk))
+        connection.execute(
+            f"UPDATE {table} SET {assignments} WHERE id IN ({placeholders})",
+            (*values, *chunk),
+        )
+
+
+def _select_many(
+    connection: sqlite3.Connection, table: str, record_ids: Sequence[int]
+) -> list[sqlite3.Row]:
+    rows: list[sqlite3.Row] = []
+    for start in range(0, len(record_ids), BATCH_CHUNK_SIZE):
+        chunk = record_ids[start : start + BATCH_CHUNK_SIZE]
+        placeholders = ", ".join("?" * len(chunk))
+        rows.extend(
+            connection.execute(
+                f"SELECT * FROM {table} WHERE id IN ({placeholders}) ORDER BY id",
+                chunk,
+            )
+        )
+    return rows
+
+
+def _next_id(connection: sqlite3.Connection, table: str) -> int:
+    row = connection.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)
+    ).fetchone()
+    return (row[0] if row else 0) + 1
+
+
+def _in_order(records: list[Any], ids: Sequence[int]) -> list[Any]:
+    by_id = {record["id"]: record for record in records}
+    return [by_id[record_id] for record_id in ids if record_id in by_id]
+
+
+def _location(unit: Mapping[str, Any]) -> tuple[str, str]:
+    return unit["property_name"], unit["unit_number"]
+
+
+def _publish_unit_writes(units: list[Unit], tenants: list[Tenant]) -> None:
+    broadcast.publish("units", units)
+    broadcast.publish("tenants", tenants)
+
+
+def _first_matches(
+    fetch: Callable[[Sequence[int]], list[Any]], ids: Sequence[int], limit: int
+) -> list[Any]:
+    found: list[Any] = []
+    for start in range(0, len(ids), SEARCH_FETCH_BATCH):
+        found.extend(fetch(ids[start : start + SEARCH_FETCH_BATCH]))
+        if len(found) >= limit:
+            break
+    return found[:limit]
+
+
+class PropertyRepository:
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def find(self) -> list[Property]:
+        rows = self._connection.execute(
+            "SELECT id, name, address, occupied_units, total_units, status,"
+            " image_url FROM properties ORDER BY id"
+        )
+        return [
+            Property(
+                id=row["id"],
+                name=row["name"],
+                address=row["address"],
+                occupied_units=row["occupied_units"],
+                total_units=row["total_units"],
+                status=row["status"],
+                image_url=row["image_url"],
+            )
+            for row in rows
+        ]
+
+
+class UnitRepository:
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def get(self, unit_id: int) -> Unit | None:
+        row = self._connection.execute(
+            "SELECT * FROM units WHERE id = ?", (unit_id,)
+        ).fetchone()
+        return _row_to_unit(row) if row else None
+
+    def locate(self, property_name: str, unit_number: str) -> int | None:
+        row = self._connection.execute(
+            "SELECT MIN(id) FROM units WHERE property_name = ? AND unit_number = ?",
+            (property_name, unit_number),
+        ).fetchone()
+        return row[0]
+
+    def get_many(
+        self,
+        unit_ids: Sequence[int],
+        rent_status: str | None = None,
+        archived: bool = False,
+    ) -> list[Unit]:
+        placeholders = ", ".join("?" * len(unit_ids))
+        if rent_status is None:
+            rows = self._connection.execute(
+                f"SELECT * FROM units WHERE +archived = ? AND id IN ({placeholders})",
+                (archived, *unit_ids),
+            )
+        else:
+            rows = self._connection.execute(
+                "SELECT * FROM units WHERE +archived = ? AND +rent_status = ?"
+                f" AND id IN ({placeholders})",
+                (archived, rent_status, *unit_ids),
+            )
+        return _in_order([_row_to_unit(row) for row in rows], unit_ids)
+
+    def find(
+        self,
+        rent_status: str | None = None,
+        archived: bool = False,
+        from_id: int = 0,
+        limit: int = -1,
+    ) -> list[Unit]:
+        if rent_status is None:
+            rows = self._connection.execute(
+                "SELECT * FROM units WHERE archived = ? AND id >= ?"
+                " ORDER BY id LIMIT ?",
+                (archived, from_id, limit),
+            )
+        else:
+            rows = self._connection.execute(
+                "SELECT * FROM units WHERE archived = ? AND rent_status = ?"
+                " AND id >= ? ORDER BY id LIMIT ?",
+                (archived, rent_status, from_id, limit),
+            )
+        return [_row_to_unit(row) for row in rows]
+
+    def list_before(
+        self,
+        before_id: int,
+        limit: int,
+        rent_status: str | None = None,
+        archived: bool = False,
+    ) -> list[Unit]:
+        if rent_status is None:
+            rows = self._connection.execute(
+                "SELECT * FROM units WHERE archived = ? AND id < ?"
+                " ORDER BY id DESC LIMIT ?",
+                (archived, before_id, limit),
+            )
+        else:
+            rows = self._connection.execute(
+                "SELECT * FROM units WHERE archived = ? AND rent_status = ?"
+                " AND id < ? ORDER BY id DESC LIMIT ?",
+                (archived, rent_status, before_id, limit),
+            )
+        return [_row_to_unit(row) for row in reversed(rows.fetchall())]
+
+    def count(self, rent_status: str | None = None, archived: bool = False) -> int:
+        if rent_status is None:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM units WHERE archived = ?", (archived,)
+            ).fetchone()
+        else:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM units WHERE archived = ? AND rent_status = ?",
+                (archived, rent_status),
+            ).fetchone()
+        return row[0]
+
+    def add(self, unit: Mapping[str, Any]) -> Unit:
+        with transaction(self._connection):
+            cursor = self._connection.execute(
+                "INSERT INTO units (property_name, unit_number, rent_amount,"
+                " tenant_name, rent_status, lease_end, archived)"
+                " VALUES (:property_name, :unit_number, :rent_amount, :tenant_name,"
+                " :rent_status, :lease_end, :archived)",
+                unit,
+            )
+            created = Unit(id=cursor.lastrowid, **{f: unit[f] for f in UNIT_FIELDS})
+            revision = AggregateEngine(self._connection).apply_unit(None, created)
+            rent_roll.record_write(created, revision)
+            lease_expiry.record_write(created, revision)
+            search.record_writes("units", [created], revision)
+        broadcast.publish("units", [created])
+        return created
+
+    def update(self, unit_id: int, changes: Mapping[str, Any]) -> Unit | None:
+        with transaction(self._connection):
+            old = self.get(unit_id)
+            if old is None:
+                return None
+            new = Unit(**{**old, **changes})
+            _update(self._connection, "units", UNIT_FIELDS, unit_id, changes)
+            engine = AggregateEngine(self._connection)
+            revision = engine.apply_unit(old, new)
+            rent_roll.record_write(new, revision)
+            lease_expiry.record_write(new, revision)
+            search.record_writes("units", [new], revision)
+            tenants = (
+                self._reindex_tenants(engine, [unit_id])
+                if _location(old) != _location(new)
+                else []
+            )
+        _publish_unit_writes([new], tenants)
+        return new
+
+    def update_many(
+        self, unit_ids: Sequence[int], changes: Mapping[str, Any]
+    ) -> list[Unit]:
+        with transaction(self._connection):
+            old = [
+                _row_to_unit(row)
+                for row in _select_many(self._connection, "units", unit_ids)
+            ]
+            if not old:
+                return []
+            new = [Unit(**{**unit, **changes}) for unit in old]
+            _update_many(
+                self._connection,
+                "units",
+                UNIT_FIELDS,
+                [unit["id"] for unit in old],
+                changes,
+            )
+            engine = AggregateEngine(self._connection)
+            revision = engine.apply_units(old, new)
+            rent_roll.record_writes(new, revision)
+            lease_expiry.record_writes(new, revision)
+            search.record_writes("units", new, revision)
+            tenants = self._reindex_tenants(
+                engine,
+                [b["id"] for a, b in zip(old, new) if _location(a) != _location(b)],
+            )
+        _publish_unit_writes(new, tenants)
+        return new
+
+    def _reindex_tenants(
+        self, engine: AggregateEngine, unit_ids: list[int]
+    ) -> list[Tenant]:
+        tenant_repository = TenantRepository(self._connection)
+        tenants = [
+            tenant
+            for unit_id in unit_ids
+            for tenant in tenant_repository.find_by_unit(unit_id)
+        ]
+        if tenants:
+            revision = engine.bump_revision("tenant_revision")
+            search.record_writes("tenants", tenants, revision)
+        return tenants
+
+    def add_many(self, units: Sequence[Mapping[str, Any]]) -> list[Unit]:
+        with transaction(self._connection):
+            first_id = _next_id(self._connection, "units")
+            created = [
+                Unit(id=first_id + offset, **{f: unit[f] for f in UNIT_FIELDS})
+                for offset, unit in enumerate(units)
+            ]
+            self._connection.executemany(
+                "INSERT INTO units (id, property_name, unit_number, rent_amount,"
+                " tenant_name, rent_status, lease_end, archived)"
+                " VALUES (:id, :property_name, :unit_number, :rent_amount,"
+                " :tenant_name, :rent_status, :lease_end, :archived)",
+                created,
+            )
+            revision = AggregateEngine(self._connection).apply_new_units(created)
+            rent_roll.record_writes(created, revision)
+            lease_expiry.record_writes(created, revision)
+            search.record_writes("units", created, revision)
+        broadcast.publish("units", created)
+        return created
+
+
+class TenantRepository:
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def find(self, from_id: int = 0, limit: int = -1) -> list[Tenant]:
+        rows = self._connection.execute(
+            "SELECT * FROM tenant_details WHERE id >= ? ORDER BY id LIMIT ?",
+            (from_id, limit),
+        )
+        return [Tenant(**row) for row in map(dict, rows)]
+
+    def list_before(self, before_id: int, limit: int) -> list[Tenant]:
+        rows = self._connection.execute(
+            "SELECT * FROM tenant_details WHERE id < ? ORDER BY id DESC LIMIT ?",
+            (before_id, limit),
+        )
+        return [Tenant(**row) for row in reversed(list(map(dict, rows)))]
+
+    def count(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM tenants").fetchone()[0]
+
+    def find_by_unit(self, unit_id: int) -> list[Tenant]:
+        rows = self._connection.execute(
+            "SELECT * FROM tenant_details WHERE unit_id = ? ORDER BY id", (unit_id,)
+        )
+        return [Tenant(**row) for row in map(dict, rows)]
+
+    def get_many(self, tenant_ids: Sequence[int]) -> list[Tenant]:
+        placeholders = ", ".join("?" * len(tenant_ids))
+        rows = self._connection.execute(
+            f"SELECT * FROM tenant_details WHERE id IN ({placeholders})", tenant_ids
+        )
+        return _in_order([Tenant(**row) for row in map(dict, rows)], tenant_ids)
+
+    def add_many(self, tenants: Sequence[Mapping[str, Any]]) -> list[Tenant]:
+        with transaction(self._connection):
+            first_id = _next_id(self._connection, "tenants")
+            created = [
+                Tenant(id=first_id + offset, **{f: tenant[f] for f in TENANT_FIELDS})
+                for offset, tenant in enumerate(tenants)
+            ]
+            self._connection.executemany(
+                "INSERT INTO tenants (id, name, email, phone, unit_id,"
+                " lease_document_url) VALUES (:id, :name, :email, :phone, :unit_id,"
+                " :lease_document_url)",
+                created,
+            )
+            revision = AggregateEngine(self._connection).bump_revision(
+                "tenant_revision"
+            )
+            search.record_writes("tenants", created, revision)
+        broadcast.publish("tenants", created)
+        return created
+
+
+class MaintenanceRepository:
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def get(self, request_id: int) -> MaintenanceRequest | None:
+        row = self._connection.execute(
+            "SELECT * FROM maintenance_requests WHERE id = ?", (request_id,)
+        ).fetchone()
+        return _row_to_maintenance_request(row) if row else None
+
+    def find(
+        self,
+        status: str | None = None,
+        sort: Sequence[str] = DEFAULT_TICKET_SORT,
+        offset: int = 0,
+        limit: int = -1,
+    ) -> list[MaintenanceRequest]:
+        ids = ticket_order.page(self._connection, tuple(sort), status, offset, limit)
+        return self.get_many(ids)
+
+    def count(self, status: str | None = None) -> int:
+        if status is None:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM maintenance_requests"
+            ).fetchone()
+        else:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM maintenance_requests WHERE status = ?", (status,)
+            ).fetchone()
+        return row[0]
+
+    def get_many(
+        self, request_ids: Sequence[int], status: str | None = None
+    ) -> list[MaintenanceRequest]:
+        placeholders = ", ".join("?" * len(request_ids))
+        if status is None:
+            rows = self._connection.execute(
+                f"SELECT * FROM maintenance_requests WHERE id IN ({placeholders})",
+                request_ids,
+            )
+        else:
+            rows = self._connection.execute(
+                "SELECT * FROM maintenance_requests WHERE +status = ?"
+                f" AND id IN ({placeholders})",
+                (status, *request_ids),
+            )
+        return _in_order(
+            [_row_to_maintenance_request(row) for row in rows], request_ids
+        )
+
+    def find_by_id(
+        self, status: str | None = None, from_id: int = 0, limit: int = -1
+    ) -> list[MaintenanceRequest]:
+        if status is None:
+            rows = self._connection.execute(
+                "SELECT * FROM maintenance_requests WHERE id >= ? ORDER BY id LIMIT ?",
+                (from_id, limit),
+            )
+        else:
+            rows = self._connection.execute(
+                "SELECT * FROM maintenance_requests WHERE status = ? AND id >= ?"
+                " ORDER BY id LIMIT ?",
+                (status, from_id, limit),
+            )
+        return [_row_to_maintenance_request(row) for row in rows]
+
+    def add(self, request: Mapping[str, Any]) -> MaintenanceRequest:
+        with transaction(self._connection):
+            cursor = self._connection.execute(
+                "INSERT INTO maintenance_requests (property_name, unit, description,"
+                " priority, status, vendor) VALUES (:property_name, :unit,"
+                " :description, :priority, :status, :vendor)",
+                request,
+            )
+            created = MaintenanceRequest(
+                id=cursor.lastrowid, **{f: request[f] for f in MAINTENANCE_FIELDS}
+            )
+            revision = AggregateEngine(self._connection).apply_maintenance(
+                None, created
+            )
+            search.record_writes("maintenance", [created], revision)
+            ticket_order.record_writes([created], revision)
+        broadcast.publish("maintenance", [created])
+        return created
+
+    def update(
+        self, request_id: int, changes: Mapping[str, Any]
+    ) -> MaintenanceRequest | None:
+        with transaction(self._connection):
+            old = self.get(request_id)
+            if old is None:
+                return None
+            new = MaintenanceRequest(**{**old, **changes})
+            _update(
+                self._connection,
+                "maintenance_requests",
+                MAINTENANCE_FIELDS,
+                request_id,
+                changes,
+            )
+            revision = AggregateEngine(self._connection).apply_maintenance(old, new)
+            search.record_writes("maintenance", [new], revision)
+            ticket_order.record_writes([new], revision)
+        broadcast.publish("maintenance", [new])
+        return new
+
+    def update_many(
+        self, request_ids: Sequence[int], changes: Mapping[str, Any]
+    ) -> list[MaintenanceRequest]:
+        with transaction(self._connection):
+            old = [
+                _row_to_maintenance_request(row)
+                for row in _select_many(
+                    self._connection, "maintenance_requests", request_ids
+                )
+            ]
+            if not old:
+                return []
+            new = [MaintenanceRequest(**{**request, **changes}) for request in old]
+            _update_many(
+                self._connection,
+                "maintenance_requests",
+                MAINTENANCE_FIELDS,
+                [request["id"] for request in old],
+                changes,
+            )
+            revision = AggregateEngine(self._connection).apply_maintenance_requests(
+                old, new
+            )
+            search.record_writes("maintenance", new, revision)
+            ticket_order.record_writes(new, revision)
+        broadcast.publish("maintenance", new)
+        return new
+
+
+class LedgerRepository:
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def bill_month(
+        self,
+        period: str,
+        posted_on: datetime.date,
+        progress: BillingProgress | None = None,
+    ) -> int:
+        total = self._connection.execute(
+            "SELECT COUNT(*) FROM units WHERE NOT archived AND rent_status != 'Vacant'"
+        ).fetchone()[0]
+        charged = done = last_id = 0
+        while True:
+            with transaction(self._connection):
+                rows = self._connection.execute(
+                    "SELECT u.id, u.rent_amount, e.id IS NULL FROM units u"
+                    " LEFT JOIN ledger_entries e ON e.unit_id = u.id"
+                    " AND e.period = ? AND e.kind = 'charge'"
+                    " WHERE u.id > ? AND NOT u.archived AND u.rent_status != 'Vacant'"
+                    " ORDER BY u.id LIMIT ?",
+                    (period, last_id, BILLING_BATCH_SIZE),
+                ).fetchall()
+                due = [(row[0], row[1]) for row in rows if row[2]]
+                if due:
+                    self._connection.executemany(
+                        "INSERT INTO ledger_entries"
+                        " (unit_id, period, kind, amount, posted_on)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        (
+                            (
+                                unit_id,
+                                period,
+                                ledger.CHARGE,
+                                rent,
+                                posted_on.isoformat(),
+                            )
+                            for unit_id, rent in due
+                        ),
+                    )
+                    revision = AggregateEngine(self._connection).bump_revision(
+                        "ledger_revision"
+                    )
+                    ledger.record_charges(
+                        np.fromiter((row[0] for row in due), dtype=np.int64),
+                        period,
+                        np.fromiter((row[1] for row in due), dtype=np.int64),
+                        revision,
+                    )
+            if not rows:
+                return charged
+            charged += len(due)
+            done += len(rows)
+            last_id = rows[-1][0]
+            if progress is not None:
+                progress(done, max(total, done))
+
+    def open_balances(self, period: str, posted_on: datetime.date) -> int:
+        opening = ledger.previous_period(period)
+        with transaction(self._connection):
+            rows = self._connection.execute(
+                "SELECT id, rent_amount FROM units u"
+                " WHERE NOT archived AND rent_status = 'Overdue' AND NOT EXISTS"
+                " (SELECT 1 FROM ledger_entries e WHERE e.unit_id = u.id)"
+            ).fetchall()
+            if not rows:
+                return 0
+            self._connection.executemany(
+                "INSERT INTO ledger_entries (unit_id, period, kind, amount, posted_on)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    (unit_id, opening, ledger.CHARGE, rent, posted_on.isoformat())
+                    for unit_id, rent in rows
+                ),
+            )
+            revision = AggregateEngine(self._connection).bump_revision(
+                "ledger_revision"
+            )
+            ledger.record_charges(
+                np.fromiter((row[0] for row in rows), dtype=np.int64),
+                opening,
+                np.fromiter((row[1] for row in rows), dtype=np.int64),
+                revision,
+            )
+        return len(rows)
+
+    def record_payment(self, unit_id: int, amount: int, posted_on: datetime.date):
+        with transaction(self._connection):
+            self._connection.execute(
+                "INSERT INTO ledger_entries (unit_id, period, kind, amount, posted_on)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    unit_id,
+                    ledger.period_of(posted_on),
+                    ledger.PAYMENT,
+                    amount,
+                    posted_on.isoformat(),
+                ),
+            )
+            revision = AggregateEngine(self._connection).bump_revision(
+                "ledger_revision"
+            )
+            ledger.record_payments([unit_id], [amount], revision)
+        self.sync_statuses(posted_on, [unit_id])
+
+    def balance(self, unit_id: int) -> int:
+        return ledger.balance(self._connection, unit_id)
+
+    def sync_statuses(
+        self, as_of: datetime.date, unit_ids: Sequence[int] | None = None
+    ) -> tuple[int, int]:
+        ids, overdue = ledger.overdue(self._connection, as_of)
+        late = dict(zip(ids.tolist(), overdue.tolist()))
+        if unit_ids is None:
+            rows = self._connection.execute(
+                "SELECT id, rent_status FROM units"
+                " WHERE NOT archived AND rent_status != 'Vacant'"
+            )
+            statuses = {row[0]: row[1] for row in rows if row[0] in late}
+        else:
+            statuses = {
+                unit["id"]: unit["rent_status"]
+                for unit in UnitRepository(self._connection).get_many(unit_ids)
+            }
+        to_overdue = [
+            unit_id
+            for unit_id, status in statuses.items()
+            if status == "Paid" and late.get(unit_id, False)
+        ]
+        to_paid = [
+            unit_id
+            for unit_id, status in statuses.items()
+            if status == "Overdue" and not late.get(unit_id, False)
+        ]
+        units = UnitRepository(self._connection)
+        if to_overdue:
+            units.update_many(to_overdue, {"rent_status": "Overdue"})
+        if to_paid:
+            units.update_many(to_paid, {"rent_status": "Paid"})
+        return len(to_overdue), len(to_paid)
+
+    def run_billing(
+        self,
+        period: str,
+        as_of: datetime.date,
+        progress: BillingProgress | None = None,
+    ) -> BillingReport:
+        self.open_balances(period, as_of)
+        charged = self.bill_month(period, as_of, progress)
+        overdue, paid = self.sync_statuses(as_of)
+        return BillingReport(period=period, charged=charged, overdue=overdue, paid=paid)
+
+    def settle(self, unit_id: int, posted_on: datetime.date) -> int:
+        owed = self.balance(unit_id)
+        if owed <= 0:
+            self.sync_statuses(posted_on, [unit_id])
+            return 0
+        self.record_payment(unit_id, owed, posted_on)
+        return owed
+
+    def aging(self, as_of: datetime.date) -> list[AgingBucket]:
+        _, amounts = ledger.aging(self._connection, as_of)
+        units = np.count_nonzero(amounts > 0, axis=0)
+        return [
+            AgingBucket(label=label, amount=int(amount), units=int(count))
+            for label, amount, count in zip(
+                ledger.AGING_BUCKETS, amounts.sum(axis=0), units
+            )
+        ]
+
+
+def aggregates() -> AggregateEngine:
+    return AggregateEngine(get_connection())
+
+
+def rent_roll_by_property() -> list[RentRollRow]:
+    connection = get_connection()
+    return cache.view(
+        connection, "units", ("rent_roll",), lambda: rent_roll.by_property(connection)
+    )
+
+
+def lease_windows(today: datetime.date | None = None) -> list[LeaseWindow]:
+    today = today or datetime.date.today()
+    counts = lease_expiry.counts(get_connection(), today)
+    return [
+        LeaseWindow(days=days, units=count)
+        for days, count in zip(lease_expiry.EXPIRY_WINDOWS, counts)
+    ]
+
+
+def renewal_pipeline(today: datetime.date | None = None) -> list[RenewalPipelineRow]:
+    today = today or datetime.date.today()
+    return [
+        RenewalPipelineRow(property_name=name, counts=counts)
+        for name, counts in lease_expiry.pipeline(get_connection(), today)
+    ]
+
+
+def upcoming_renewals(
+    days: int = lease_expiry.EXPIRY_WINDOWS[-1],
+    limit: int = RENEWALS_SHOWN,
+    today: datetime.date | None = None,
+) -> list[LeaseRenewal]:
+    connection = get_connection()
+    today = today or datetime.date.today()
+    entries = lease_expiry.expiring(
+        connection, today, today + datetime.timedelta(days=days), limit
+    )
+    if not entries:
+        return []
+    units = {
+        unit["id"]: unit
+        for unit in UnitRepository(connection).get_many([e[1] for e in entries])
+    }
+    return [
+        LeaseRenewal(
+            unit_id=unit_id,
+            property_name=units[unit_id]["property_name"],
+            unit_number=units[unit_id]["unit_number"],
+            tenant_name=units[unit_id]["tenant_name"],
+            lease_end=datetime.date.fromordinal(ends).isoformat(),
+            days_left=ends - today.toordinal(),
+        )
+        for ends, unit_id in entries
+        if unit_id in units
+    ]
+
+
+def list_properties() -> list[Property]:
+    connection = get_connection()
+    return cache.view(
+        connection,
+        "properties",
+        ("find",),
+        lambda: PropertyRepository(connection).find(),
+    )
+
+
+def list_units(unit_filter: str, from_id: int = 0, limit: int = -1) -> list[Unit]:
+    connection = get_connection()
+    query = unit_filter_query(unit_filter)
+    return cache.view(
+        connection,
+        "units",
+        ("find", unit_filter, from_id, limit),
+        lambda: records.unit_columns(
+            UnitRepository(connection).find(**query, from_id=from_id, limit=limit)
+        ),
+    ).rows()
+
+
+def count_units(unit_filter: str) -> int:
+    connection = get_connection()
+    query = unit_filter_query(unit_filter)
+    return cache.view(
+        connection,
+        "units",
+        ("count", unit_filter),
+        lambda: UnitRepository(connection).count(**query),
+    )
+
+
+def list_tenants(from_id: int = 0, limit: int = -1) -> list[Tenant]:
+    connection = get_connection()
+    return cache.view(
+        connection,
+        "tenants",
+        ("find", from_id, limit),
+        lambda: TenantRepository(connection).find(from_id, limit),
+    )
+
+
+def count_tenants() -> int:
+    connection = get_connection()
+    return cache.view(
+        connection,
+        "tenants",
+        ("count",),
+        lambda: TenantRepository(connection).count(),
+    )
+
+
+def list_maintenance_requests(
+    status: str | None,
+    sort: Sequence[str] = DEFAULT_TICKET_SORT,
+    offset: int = 0,
+    limit: int = -1,
+) -> list[MaintenanceRequest]:
+    connection = get_connection()
+    sort = tuple(sort)
+    return cache.view(
+        connection,
+        "maintenance",
+        ("find", status, sort, offset, limit),
+        lambda: records.ticket_columns(
+            MaintenanceRepository(connection).find(status, sort, offset, limit)
+        ),
+    ).rows()
+
+
+def count_maintenance_requests(status: str | None) -> int:
+    connection = get_connection()
+    return cache.view(
+        connection,
+        "maintenance",
+        ("count", status),
+        lambda: MaintenanceRepository(connection).count(status),
+    )
+
+
+def search_units(
+    query: str, unit_filter: str = "All", limit: int = SEARCH_RESULTS
+) -> list[Unit]:
+    connection = get_connection()
+    ids = search.search(connection, "units", query, SEARCH_CANDIDATES)
+    query_filter = unit_filter_query(unit_filter)
+    return _first_matches(
+        lambda batch: UnitRepository(connection).get_many(batch, **query_filter),
+        ids,
+        limit,
+    )
+
+
+def search_tenants(query: str, limit: int = SEARCH_RESULTS) -> list[Tenant]:
+    connection = get_connection()
+    ids = search.search(connection, "tenants", query, limit)
+    return TenantRepository(connection).get_many(ids)
+
+
+def search_maintenance_requests(
+    query: str, status: str | None = None, limit: int = SEARCH_RESULTS
+) -> list[MaintenanceRequest]:
+    connection = get_connection()
+    ids = search.search(connection, "maintenance", query, SEARCH_CANDIDATES)
+    return _first_matches(
+        lambda batch: MaintenanceRepository(connection).get_many(batch, status),
+        ids,
+        limit,
+    )
+
+
+def properties() -> PropertyRepository:
+    return PropertyRepository(get_connection())
+
+
+def units() -> UnitRepository:
+    return UnitRepository(get_connection())
+
+
+def tenants() -> TenantRepository:
+    return TenantRepository(get_connection())
+
+
+def maintenance_requests() -> MaintenanceRepository:
+    return MaintenanceRepository(get_connection())
+
+
+def rent_ledger() -> LedgerRepository:
+    return LedgerRepository(get_connection())
@@ -0,0 +1,211 @@
+import bisect
+import heapq
+import itertools
+import math
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from app.data.aggregates import AggregateEngine
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+NON_DIGITS = re.compile(r"\D")
+DIGIT_RUNS = re.compile(r"\d+")
+SEARCH_FIELDS = {
+    "units": ("unit_number", "tenant_name", "property_name"),
+    "tenants": ("name", "email", "phone", "property_name", "unit_number"),
+    "maintenance": ("description", "property_name", "unit"),
+}
+SEARCH_TABLES = {
+    "units": "units",
+    "tenants": "tenant_details",
+    "maintenance": "maintenance_requests",
+}
+SEARCH_REVISIONS = {
+    "units": "unit_revision",
+    "tenants": "tenant_revision",
+    "maintenance": "maintenance_revision",
+}
+CANDIDATE_SCAN_LIMIT = 2000
+MAX_PREFIX_EXPANSIONS = 1024
+
+
+def tokenize(values: Iterable[Any]) -> set[str]:
+    tokens: set[str] = set()
+    for value in values:
+        if not value:
+            continue
+        text = str(value).lower()
+        tokens.update(TOKEN_PATTERN.findall(text))
+        tokens.update(DIGIT_RUNS.findall(text))
+        digits = NON_DIGITS.sub("", text)
+        if len(digits) >= 3:
+            tokens.add(digits)
+    return tokens
+
+
+class InvertedIndex:
+    def __init__(self, fields: tuple[str, ...], revision: int = 0):
+        self.fields = fields
+        self.revision = revision
+        self._postings: dict[str, set[int]] = {}
+        self._terms: list[str] = []
+        self._documents: dict[int, frozenset[str]] = {}
+
+    @classmethod
+    def load(cls, connection: sqlite3.Connection, kind: str) -> "InvertedIndex":
+        fields = SEARCH_FIELDS[kind]
+        index = cls(fields)
+        connection.execute("BEGIN")
+        try:
+            index.revision = AggregateEngine(connection).revision(
+                SEARCH_REVISIONS[kind]
+            )
+            rows = connection.execute(
+                f"SELECT id, {', '.join(fields)} FROM {SEARCH_TABLES[kind]}"
+            )
+            for row in rows:
+                index._add(row["id"], tokenize(row[field] for field in fields))
+        finally:
+            connection.commit()
+        index._terms = sorted(index._postings)
+        return index
+
+    def _add(self, doc_id: int, tokens: set[str]) -> None:
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+            postings.add(doc_id)
+        self._documents[doc_id] = frozenset(tokens)
+
+    def put(self, record: Mapping[str, Any]) -> None:
+        doc_id = record["id"]
+        tokens = tokenize(record[field] for field in self.fields)
+        old = self._documents.get(doc_id, frozenset())
+        for token in old - tokens:
+            postings = self._postings[token]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[token]
+                del self._terms[bisect.bisect_left(self._terms, token)]
+        for token in tokens - old:
+            if token not in self._postings:
+                bisect.insort(self._terms, token)
+        self._add(doc_id, tokens)
+
+    def _weight(self, token: str, term: str) -> float:
+        idf = math.log(1 + len(self._documents) / len(self._postings[token]))
+        return idf * (2.0 if token == term else 1.0)
+
+    def _expand(self, term: str) -> list[str]:
+        start = bisect.bisect_left(self._terms, term)
+        end = bisect.bisect_left(
+            self._terms,
+            term + "\uffff",
+            lo=start,
+            hi=min(len(self._terms), start + MAX_PREFIX_EXPANSIONS),
+        )
+        return self._terms[start:end]
+
+    def _scan(self, term: str) -> dict[int, float]:
+        scores: dict[int, float] = {}
+        for token in self._expand(term):
+            weight = self._weight(token, term)
+            for doc_id in self._postings[token]:
+                if weight > scores.get(doc_id, 0.0):
+                    scores[doc_id] = weight
+        return scores
+
+    def _narrow(self, scores: dict[int, float], term: str) -> dict[int, float]:
+        narrowed: dict[int, float] = {}
+        for doc_id, score in scores.items():
+            best = max(
+                (
+                    self._weight(token, term)
+                    for token in self._documents[doc_id]
+                    if token.startswith(term)
+                ),
+                default=0.0,
+            )
+            if best:
+                narrowed[doc_id] = score + best
+        return narrowed
+
+    def _intersect(self, scores: dict[int, float], term: str) -> dict[int, float]:
+        candidates = set(scores)
+        matches: dict[int, float] = {}
+        for token in self._expand(term):
+            weight = self._weight(token, term)
+            for doc_id in self._postings[token] & candidates:
+                if weight > matches.get(doc_id, 0.0):
+                    matches[doc_id] = weight
+        return {doc_id: scores[doc_id] + weight for doc_id, weight in matches.items()}
+
+    def _top(self, term: str, limit: int) -> list[int]:
+        weighted = sorted(
+            ((self._weight(token, term), token) for token in self._expand(term)),
+            reverse=True,
+        )
+        results: list[int] = []
+        seen: set[int] = set()
+        for _, group in itertools.groupby(weighted, key=lambda item: item[0]):
+            postings = [self._postings[token] for _, token in group]
+            if len(postings) == 1 and not seen:
+                docs = postings[0]
+            else:
+                docs = set().union(*postings) - seen
+            results.extend(heapq.nsmallest(limit - len(results), docs))
+            if len(results) >= limit:
+                break
+            seen.update(docs)
+        return results
+
+    def _estimate(self, term: str) -> int:
+        return sum(len(self._postings[token]) for token in self._expand(term))
+
+    def search(self, query: str, limit: int) -> list[int]:
+        terms = sorted(set(TOKEN_PATTERN.findall(query.lower())), key=self._estimate)
+        if not terms:
+            return []
+        if len(terms) == 1:
+            return self._top(terms[0], limit)
+        scores = self._scan(terms[0])
+        for term in terms[1:]:
+            if not scores:
+                break
+            if len(scores) <= CANDIDATE_SCAN_LIMIT:
+                scores = self._narrow(scores, term)
+            else:
+                scores = self._intersect(scores, term)
+        return heapq.nlargest(
+            limit, scores, key=lambda doc_id: (scores[doc_id], -doc_id)
+        )
+
+
+_indexes: dict[str, InvertedIndex] = {}
+_lock = threading.Lock()
+
+
+def search(
+    connection: sqlite3.Connection, kind: str, query: str, limit: int
+) -> list[int]:
+    revision = AggregateEngine(connection).revision(SEARCH_REVISIONS[kind])
+    with _lock:
+        index = _indexes.get(kind)
+        if index is None or index.revision != revision:
+            index = _indexes[kind] = InvertedIndex.load(connection, kind)
+        return index.search(query, limit)
+
+
+def record_writes(
+    kind: str, records: Iterable[Mapping[str, Any]], revision: int
+) -> None:
+    with _lock:
+        index = _indexes.get(kind)
+        if index is not None and index.revision == revision - 1:
+            for record in records:
+                index.put(record)
+            index.revision = revision
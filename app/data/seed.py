@@ -0,0 +1,107 @@
+from typing import Any
+
+from app.data.models import MaintenanceRequest, Unit
+
+PROPERTIES: list[dict[str, Any]] = [
+    {
+        "id": 1,
+        "name": "Sunset Apartments",
+        "address": "123 Ocean View, LA",
+        "status": "occupied",
+        "image_url": "/placeholder.svg",
+    },
+    {
+        "id": 2,
+        "name": "Downtown Lofts",
+        "address": "456 Main St, Metropolis",
+        "status": "occupied",
+        "image_url": "/placeholder.svg",
+    },
+    {
+        "id": 3,
+        "name": "Green Valley Homes",
+        "address": "789 Country Rd, Smallville",
+        "status": "vacant",
+        "image_url": "/placeholder.svg",
+    },
+    {
+        "id": 4,
+        "name": "Sunrise Towers",
+        "address": "101 Dawn Ave, Gotham",
+        "status": "maintenance",
+        "image_url": "/placeholder.svg",
+    },
+]
+
+UNITS: list[Unit] = [
+    {
+        "id": 1,
+        "property_name": "Sunset Apartments",
+        "unit_number": "A101",
+        "rent_amount": 1650,
+        "tenant_name": "Alice Johnson",
+        "rent_status": "Paid",
+        "lease_end": "2024-12-31",
+        "archived": False,
+    },
+    {
+        "id": 2,
+        "property_name": "Sunset Apartments",
+        "unit_number": "B203",
+        "rent_amount": 1600,
+        "tenant_name": None,
+        "rent_status": "Vacant",
+        "lease_end": None,
+        "archived": False,
+    },
+    {
+        "id": 3,
+        "property_name": "Downtown Lofts",
+        "unit_number": "5B",
+        "rent_amount": 2100,
+        "tenant_name": "Bob Williams",
+        "rent_status": "Overdue",
+        "lease_end": "2025-06-30",
+        "archived": False,
+    },
+]
+
+TENANTS: list[dict[str, Any]] = [
+    {
+        "id": 1,
+        "name": "Alice Johnson",
+        "email": "alice@example.com",
+        "phone": "555-0101",
+        "unit_id": 1,
+        "lease_document_url": "#",
+    },
+    {
+        "id": 2,
+        "name": "Bob Williams",
+        "email": "bob@example.com",
+        "phone": "555-0102",
+        "unit_id": 3,
+        "lease_document_url": "#",
+    },
+]
+
+MAINTENANCE_REQUESTS: list[MaintenanceRequest] = [
+    {
+        "id": 1,
+        "property_name": "Sunset Apartments",
+        "unit": "#102",
+        "description": "Leaky faucet in kitchen",
+        "priority": "Medium",
+        "status": "Open",
+        "vendor": "QuickFix Plumbing",
+    },
+    {
+        "id": 2,
+        "property_name": "Downtown Lofts",
+        "unit": "#305",
+        "description": "Broken window pane",
+        "priority": "High",
+        "status": "Open",
+        "vendor": None,
+    },
+]
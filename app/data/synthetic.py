@@ -0,0 +1,291 @@
+import itertools
+import json
+import os
+import random
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, NamedTuple
+
+from app.data.aggregates import AggregateEngine, occupancy_contribution
+from app.data.db import INSERT_STATEMENTS, transaction
+from app.data.export import to_json_lines
+from app.data.models import MaintenanceRequest, Property, Tenant, Unit
+
+KINDS = ("properties", "units", "tenants", "maintenance_requests")
+REVISIONS = (
+    "unit_revision",
+    "tenant_revision",
+    "maintenance_revision",
+    "ledger_revision",
+)
+UNITS_PER_PROPERTY = 200
+UNITS_PER_FLOOR = 20
+ARCHIVED_RATE = 0.02
+UNDER_MAINTENANCE_RATE = 0.05
+UNASSIGNED_OPEN_RATE = 0.5
+LOAD_BATCH_SIZE = 10_000
+
+FIRST_NAMES = (
+    "Alice",
+    "Bob",
+    "Carol",
+    "Dan",
+    "Eve",
+    "Frank",
+    "Grace",
+    "Heidi",
+    "Ivan",
+    "Judy",
+    "Mallory",
+    "Niaj",
+    "Olivia",
+    "Peggy",
+    "Rupert",
+    "Sybil",
+    "Trent",
+    "Victor",
+    "Walter",
+    "Yara",
+)
+LAST_NAMES = (
+    "Smith",
+    "Johnson",
+    "Williams",
+    "Brown",
+    "Jones",
+    "Garcia",
+    "Miller",
+    "Davis",
+    "Lee",
+    "Martin",
+    "Clark",
+    "Lewis",
+    "Walker",
+    "Young",
+    "King",
+)
+STREETS = (
+    "Ocean View",
+    "Main St",
+    "Country Rd",
+    "Dawn Ave",
+    "Maple Dr",
+    "Oak Ln",
+    "Cedar Ct",
+    "Harbor Blvd",
+    "Hillside Ter",
+    "Park Pl",
+)
+CITIES = ("LA", "Metropolis", "Smallville", "Gotham", "Springfield", "Riverdale")
+DESCRIPTIONS = (
+    "Leaky faucet in kitchen",
+    "Broken window pane",
+    "HVAC not cooling",
+    "Door lock jammed",
+    "Paint peeling in bathroom",
+    "Clogged drain",
+    "Smoke detector chirping",
+    "Dishwasher not draining",
+    "Light fixture flickering",
+    "Garbage disposal stuck",
+)
+VENDORS = (
+    "General Maintenance Co.",
+    "QuickFix Plumbing",
+    "ACME HVAC Services",
+    "Sparky Electricians",
+    "The Paint Squad",
+)
+RENT_STATUSES = (("Paid", 75), ("Overdue", 10), ("Vacant", 15))
+PRIORITIES = (("Low", 50), ("Medium", 35), ("High", 15))
+TICKET_STATUSES = (("Open", 40), ("In Progress", 25), ("Completed", 35))
+
+
+class Portfolio(NamedTuple):
+    properties: int
+    units: int
+    tickets: int
+    seed: int = 0
+
+    @classmethod
+    def of_size(cls, records: int, seed: int = 0) -> "Portfolio":
+        units = max(1, records * 2 // 5)
+        return cls(
+            properties=max(1, -(-units // UNITS_PER_PROPERTY)),
+            units=units,
+            tickets=max(1, records // 4),
+            seed=seed,
+        )
+
+    def units_at(self, property_id: int) -> int:
+        base, extra = divmod(self.units, self.properties)
+        return base + (property_id <= extra)
+
+
+def _rng(portfolio: Portfolio, kind: str) -> random.Random:
+    return random.Random(f"{portfolio.seed}:{kind}")
+
+
+def _chooser(rng: random.Random, weighted: tuple[tuple[str, int], ...]):
+    values = [value for value, _ in weighted]
+    cumulative = list(itertools.accumulate(weight for _, weight in weighted))
+    return lambda: rng.choices(values, cum_weights=cumulative)[0]
+
+
+def property_name(property_id: int) -> str:
+    return f"Property {property_id}"
+
+
+def unit_number(index: int) -> str:
+    floor, door = divmod(index, UNITS_PER_FLOOR)
+    return f"{floor + 1}{door + 1:02d}"
+
+
+def generate_units(portfolio: Portfolio) -> Iterator[Unit]:
+    rng = _rng(portfolio, "units")
+    rent_status = _chooser(rng, RENT_STATUSES)
+    for unit_id in range(1, portfolio.units + 1):
+        index, offset = divmod(unit_id - 1, portfolio.properties)
+        status = rent_status()
+        vacant = status == "Vacant"
+        yield Unit(
+            id=unit_id,
+            property_name=property_name(offset + 1),
+            unit_number=unit_number(index),
+            rent_amount=rng.randrange(900, 3500, 25),
+            tenant_name=None
+            if vacant
+            else f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            rent_status=status,
+            lease_end=None
+            if vacant
+            else f"{rng.randrange(2025, 2029)}-{rng.randrange(1, 13):02d}-28",
+            archived=rng.random() < ARCHIVED_RATE,
+        )
+
+
+def generate_properties(portfolio: Portfolio) -> Iterator[Property]:
+    occupancy = Counter()
+    for unit in generate_units(portfolio):
+        occupancy.update(occupancy_contribution(unit))
+    rng = _rng(portfolio, "properties")
+    for property_id in range(1, portfolio.properties + 1):
+        name = property_name(property_id)
+        occupied = occupancy[name, "occupied_units"]
+        if rng.random() < UNDER_MAINTENANCE_RATE:
+            status = "maintenance"
+        else:
+            status = "occupied" if occupied else "vacant"
+        yield Property(
+            id=property_id,
+            name=name,
+            address=f"{rng.randrange(1, 10_000)} {rng.choice(STREETS)},"
+            f" {rng.choice(CITIES)}",
+            occupied_units=occupied,
+            total_units=occupancy[name, "total_units"],
+            status=status,
+            image_url="/placeholder.svg",
+        )
+
+
+def generate_tenants(portfolio: Portfolio) -> Iterator[Tenant]:
+    rng = _rng(portfolio, "tenants")
+    tenant_id = 0
+    for unit in generate_units(portfolio):
+        if unit["tenant_name"] is None:
+            continue
+        tenant_id += 1
+        yield Tenant(
+            id=tenant_id,
+            name=unit["tenant_name"],
+            email=f"{unit['tenant_name'].replace(' ', '.').lower()}{tenant_id}"
+            "@example.com",
+            phone=f"555-{rng.randrange(10_000):04d}",
+            unit_id=unit["id"],
+            property_name=unit["property_name"],
+            unit_number=unit["unit_number"],
+            lease_document_url="#",
+        )
+
+
+def generate_maintenance_requests(
+    portfolio: Portfolio,
+) -> Iterator[MaintenanceRequest]:
+    rng = _rng(portfolio, "maintenance_requests")
+    priority = _chooser(rng, PRIORITIES)
+    ticket_status = _chooser(rng, TICKET_STATUSES)
+    for ticket_id in range(1, portfolio.tickets + 1):
+        property_id = rng.randrange(1, portfolio.properties + 1)
+        unit = unit_number(rng.randrange(max(1, portfolio.units_at(property_id))))
+        status = ticket_status()
+        yield MaintenanceRequest(
+            id=ticket_id,
+            property_name=property_name(property_id),
+            unit=f"#{unit}",
+            description=rng.choice(DESCRIPTIONS),
+            priority=priority(),
+            status=status,
+            vendor=None
+            if status == "Open" and rng.random() < UNASSIGNED_OPEN_RATE
+            else rng.choice(VENDORS),
+        )
+
+
+GENERATORS = {
+    "properties": generate_properties,
+    "units": generate_units,
+    "tenants": generate_tenants,
+    "maintenance_requests": generate_maintenance_requests,
+}
+
+
+def generate(portfolio: Portfolio) -> dict[str, Iterator[Mapping[str, Any]]]:
+    return {kind: GENERATORS[kind](portfolio) for kind in KINDS}
+
+
+def write(
+    sources: Mapping[str, Iterable[Mapping[str, Any]]], directory: str
+) -> dict[str, str]:
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for kind, records in sources.items():
+        paths[kind] = os.path.join(directory, f"{kind}.jsonl")
+        with open(paths[kind], "w", encoding="utf-8") as file:
+            file.writelines(to_json_lines(records))
+    return paths
+
+
+def _read_json_lines(path: str) -> Iterator[dict[str, Any]]:
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read(directory: str) -> dict[str, Iterator[dict[str, Any]]]:
+    return {
+        kind: _read_json_lines(os.path.join(directory, f"{kind}.jsonl"))
+        for kind in KINDS
+        if os.path.exists(os.path.join(directory, f"{kind}.jsonl"))
+    }
+
+
+def load(
+    connection: sqlite3.Connection, sources: Mapping[str, Iterable[Mapping[str, Any]]]
+) -> dict[str, int]:
+    counts = dict.fromkeys(sources, 0)
+    engine = AggregateEngine(connection)
+    with transaction(connection):
+        connection.execute("DELETE FROM ledger_entries")
+        for kind in reversed(KINDS):
+            connection.execute(f"DELETE FROM {kind}")
+        for kind in KINDS:
+            records = iter(sources.get(kind, ()))
+            while batch := list(itertools.islice(records, LOAD_BATCH_SIZE)):
+                connection.executemany(INSERT_STATEMENTS[kind], batch)
+                counts[kind] += len(batch)
+        engine.recount()
+        for revision in REVISIONS:
+            engine.bump_revision(revision)
+    return counts
@@ -0,0 +1,146 @@
+import bisect
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, NamedTuple
+
+from app.data.aggregates import AggregateEngine
+
+STATUS_RANKS = {"Open": 0, "In Progress": 1, "Completed": 2}
+PRIORITY_RANKS = {"High": 0, "Medium": 1, "Low": 2}
+MAX_CACHED_ORDERS = 6
+
+
+class SortRecord(NamedTuple):
+    id: int
+    status: str
+    priority: str
+    property_name: str
+    vendor: str | None
+
+
+SORT_KEYS: dict[str, Callable[[SortRecord], Any]] = {
+    "status": lambda t: STATUS_RANKS.get(t.status, len(STATUS_RANKS)),
+    "priority": lambda t: PRIORITY_RANKS.get(t.priority, len(PRIORITY_RANKS)),
+    "property": lambda t: t.property_name.casefold(),
+    "vendor": lambda t: (t.vendor is None, (t.vendor or "").casefold()),
+    "newest": lambda t: -t.id,
+    "oldest": lambda t: t.id,
+}
+
+
+def _sort_record(ticket: Mapping[str, Any]) -> SortRecord:
+    vendor = ticket["vendor"]
+    return SortRecord(
+        ticket["id"],
+        sys.intern(ticket["status"]),
+        sys.intern(ticket["priority"]),
+        sys.intern(ticket["property_name"]),
+        sys.intern(vendor) if vendor else None,
+    )
+
+
+class SortedOrder:
+    def __init__(
+        self,
+        keys: tuple[str, ...],
+        status: str | None,
+        tickets: Iterable[SortRecord],
+    ):
+        self._keys = [SORT_KEYS[key] for key in keys]
+        self._status = status
+        self.entries = sorted(
+            self._entry(ticket) for ticket in tickets if self._matches(ticket)
+        )
+
+    def _entry(self, ticket: SortRecord) -> tuple:
+        return (*(key(ticket) for key in self._keys), ticket.id)
+
+    def _matches(self, ticket: SortRecord) -> bool:
+        return self._status is None or ticket.status == self._status
+
+    def remove(self, ticket: SortRecord) -> None:
+        if self._matches(ticket):
+            entry = self._entry(ticket)
+            position = bisect.bisect_left(self.entries, entry)
+            if position < len(self.entries) and self.entries[position] == entry:
+                del self.entries[position]
+
+    def insert(self, ticket: SortRecord) -> None:
+        if self._matches(ticket):
+            bisect.insort(self.entries, self._entry(ticket))
+
+    def ids(self, offset: int, limit: int) -> list[int]:
+        end = None if limit < 0 else offset + limit
+        return [entry[-1] for entry in self.entries[offset:end]]
+
+
+class TicketOrders:
+    def __init__(self, revision: int = 0):
+        self.revision = revision
+        self._tickets: dict[int, SortRecord] = {}
+        self._orders: OrderedDict[tuple, SortedOrder] = OrderedDict()
+
+    @classmethod
+    def load(cls, connection: sqlite3.Connection) -> "TicketOrders":
+        connection.execute("BEGIN")
+        try:
+            orders = cls(AggregateEngine(connection).revision("maintenance_revision"))
+            rows = connection.execute(
+                "SELECT id, status, priority, property_name, vendor"
+                " FROM maintenance_requests"
+            )
+            orders._tickets = {row["id"]: _sort_record(row) for row in rows}
+        finally:
+            connection.commit()
+        return orders
+
+    def order(self, keys: tuple[str, ...], status: str | None) -> SortedOrder:
+        cache_key = (keys, status)
+        order = self._orders.get(cache_key)
+        if order is None:
+            order = SortedOrder(keys, status, self._tickets.values())
+            self._orders[cache_key] = order
+            if len(self._orders) > MAX_CACHED_ORDERS:
+                self._orders.popitem(last=False)
+        else:
+            self._orders.move_to_end(cache_key)
+        return order
+
+    def put(self, ticket: Mapping[str, Any]) -> None:
+        record = _sort_record(ticket)
+        old = self._tickets.get(record.id)
+        for order in self._orders.values():
+            if old is not None:
+                order.remove(old)
+            order.insert(record)
+        self._tickets[record.id] = record
+
+
+_cache: TicketOrders | None = None
+_lock = threading.Lock()
+
+
+def page(
+    connection: sqlite3.Connection,
+    keys: tuple[str, ...],
+    status: str | None,
+    offset: int,
+    limit: int,
+) -> list[int]:
+    global _cache
+    revision = AggregateEngine(connection).revision("maintenance_revision")
+    with _lock:
+        if _cache is None or _cache.revision != revision:
+            _cache = TicketOrders.load(connection)
+        return _cache.order(keys, status).ids(offset, limit)
+
+
+def record_writes(tickets: Iterable[Mapping[str, Any]], revision: int) -> None:
+    with _lock:
+        if _cache is not None and _cache.revision == revision - 1:
+            for ticket in tickets:
+                _cache.put(ticket)
+            _cache.revision = revision
@@ -0,0 +1,92 @@
+import datetime
+import decimal
+from collections.abc import Mapping
+from typing import Any
+
+RENT_STATUSES = ("Paid", "Overdue", "Vacant")
+LEASE_END_FORMATS = (
+    "%m/%d/%Y",
+    "%m/%d/%y",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+)
+
+
+def parse_lease_end(value: str | None) -> datetime.date | None:
+    text = (value or "").strip()
+    if not text:
+        return None
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in LEASE_END_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def lease_end_from_form(value: str | None) -> str | None:
+    if not (value or "").strip():
+        return None
+    lease_end = parse_lease_end(value)
+    if lease_end is None:
+        raise ValueError("Lease end must be a date such as 2025-06-30.")
+    return lease_end.isoformat()
+
+
+def _is_blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def parse_rent(value: Any) -> int:
+    try:
+        amount = decimal.Decimal(str(value).strip())
+    except decimal.InvalidOperation as e:
+        raise ValueError("Rent amount must be a valid number.") from e
+    if not amount.is_finite():
+        raise ValueError("Rent amount must be a valid number.")
+    if amount != amount.to_integral_value():
+        raise ValueError("Rent amount must be a whole number of dollars.")
+    if amount < 0:
+        raise ValueError("Rent amount cannot be negative.")
+    return int(amount)
+
+
+def unit_from_form(form_data: Mapping[str, Any]) -> dict[str, Any]:
+    property_name = form_data.get("property_name")
+    unit_number = form_data.get("unit_number")
+    rent_amount = form_data.get("rent_amount")
+    if any(_is_blank(value) for value in (property_name, unit_number, rent_amount)):
+        raise ValueError("Property, Unit #, and Rent are required.")
+    rent = parse_rent(rent_amount)
+    rent_status = form_data.get("rent_status") or "Vacant"
+    if rent_status not in RENT_STATUSES:
+        raise ValueError(f"Rent status must be one of {', '.join(RENT_STATUSES)}.")
+    return {
+        "property_name": property_name,
+        "unit_number": unit_number,
+        "rent_amount": rent,
+        "tenant_name": form_data.get("tenant_name") or None,
+        "rent_status": rent_status,
+        "lease_end": lease_end_from_form(form_data.get("lease_end")),
+        "archived": False,
+    }
+
+
+def tenant_from_form(form_data: Mapping[str, Any]) -> dict[str, Any]:
+    required = ("name", "email", "property_name", "unit_number")
+    if not all(form_data.get(field) for field in required):
+        raise ValueError("Name, Email, Property, and Unit # are required.")
+    return {
+        "name": form_data["name"],
+        "email": form_data["email"],
+        "phone": form_data.get("phone") or "",
+        "property_name": form_data["property_name"],
+        "unit_number": form_data["unit_number"],
+        "lease_document_url": form_data.get("lease_document_url") or "#",
+    }
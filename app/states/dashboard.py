@@ -0,0 +1,138 @@
+import asyncio
+import datetime
+import functools
+
+import reflex as rx
+
+from app.data import broadcast, jobs, ledger, repository
+from app.data.models import (
+    AgingBucket,
+    BillingReport,
+    LeaseRenewal,
+    LeaseWindow,
+    Property,
+    RenewalPipelineRow,
+    RentRollRow,
+)
+from app.states.state import PropertyManagementState
+
+BILLING_JOB = "billing"
+
+
+def _run_billing(period: str, as_of: datetime.date, job: jobs.Job) -> BillingReport:
+    return repository.rent_ledger().run_billing(period, as_of, job.advance)
+
+
+class DashboardState(PropertyManagementState):
+    properties: list[Property] = rx.field(default_factory=list)
+    total_units: int = 0
+    occupied_units: int = 0
+    overdue_units: int = 0
+    upcoming_maintenance: int = 0
+    rent_roll: list[RentRollRow] = rx.field(default_factory=list)
+    lease_windows: list[LeaseWindow] = rx.field(default_factory=list)
+    renewal_pipeline: list[RenewalPipelineRow] = rx.field(default_factory=list)
+    upcoming_renewals: list[LeaseRenewal] = rx.field(default_factory=list)
+    rent_aging: list[AgingBucket] = rx.field(default_factory=list)
+    billing_period: str = ""
+    billing_running: bool = False
+    billing_progress: int = 0
+
+    @rx.var
+    def occupancy_rate(self) -> float:
+        if self.total_units == 0:
+            return 0.0
+        return self.occupied_units / self.total_units * 100
+
+    @rx.var
+    def vacant_units(self) -> int:
+        return self.total_units - self.occupied_units
+
+    @rx.var
+    def collected_income(self) -> int:
+        return sum(row["collected"] for row in self.rent_roll)
+
+    @rx.var
+    def overdue_income(self) -> int:
+        return sum(row["overdue"] for row in self.rent_roll)
+
+    @rx.var
+    def monthly_income(self) -> int:
+        return self.collected_income + self.overdue_income
+
+    def _load_dashboard(self):
+        self.properties = repository.list_properties()
+        totals = repository.aggregates().snapshot()
+        self.total_units = totals["units_total"]
+        self.occupied_units = totals["units_occupied"]
+        self.overdue_units = totals["units_overdue"]
+        self.upcoming_maintenance = totals["maintenance_open"]
+        self.rent_roll = repository.rent_roll_by_property()
+        self.lease_windows = repository.lease_windows()
+        self.renewal_pipeline = repository.renewal_pipeline()
+        self.upcoming_renewals = repository.upcoming_renewals()
+        today = datetime.date.today()
+        self.rent_aging = repository.rent_ledger().aging(today)
+        self.billing_period = ledger.period_of(today)
+
+    def _apply_changes(self, batch: broadcast.Changes):
+        if "units" in batch or "maintenance" in batch:
+            self._load_dashboard()
+
+    @rx.event
+    def load(self):
+        self._load_dashboard()
+
+    @rx.event
+    def unload(self):
+        if self.properties or self.rent_roll:
+            self.properties = []
+            self.rent_roll = []
+        if self.renewal_pipeline or self.upcoming_renewals:
+            self.renewal_pipeline = []
+            self.upcoming_renewals = []
+
+    @rx.event
+    async def run_billing(self):
+        today = datetime.date.today()
+        job = jobs.start(
+            BILLING_JOB,
+            functools.partial(_run_billing, ledger.period_of(today), today),
+        )
+        if job is None:
+            return rx.toast.error("A billing run is already in progress.")
+        self.billing_running = True
+        self.billing_progress = 0
+        return DashboardState.watch_billing
+
+    @rx.event
+    def cancel_billing(self):
+        jobs.cancel(BILLING_JOB)
+
+    @rx.event(background=True)
+    async def watch_billing(self):
+        job = jobs.get(BILLING_JOB)
+        if job is None:
+            return
+        report = None
+        try:
+            while not job.future.done():
+                await asyncio.wait([job.future], timeout=jobs.PROGRESS_INTERVAL)
+                async with self:
+                    self.billing_progress = job.percent
+            report = job.future.result()
+        except jobs.JobCancelled:
+            pass
+        finally:
+            jobs.finish(BILLING_JOB, job)
+            async with self:
+                self.billing_running = False
+                self._load_dashboard()
+        if report is None:
+            return rx.toast.info(
+                "Billing cancelled; run it again to bill the remaining units."
+            )
+        return rx.toast.success(
+            f"Billed {report['charged']} units for {report['period']}: "
+            f"{report['overdue']} now overdue, {report['paid']} caught up."
+        )
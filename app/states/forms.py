@@ -0,0 +1,172 @@
+import reflex as rx
+
+from app.data import repository
+from app.data.validation import parse_lease_end, unit_from_form
+from app.states.maintenance import MaintenanceState
+from app.states.state import PropertyManagementState
+from app.states.units import UnitsState
+
+
+class FormState(PropertyManagementState):
+    property_names: list[str] = rx.field(default_factory=list)
+    add_unit_form_open: bool = False
+    edit_unit_form_open: bool = False
+    edit_unit_id: int | None = None
+    new_unit_property: str = ""
+    new_unit_number: str = ""
+    new_unit_rent_amount: str = ""
+    new_unit_tenant_name: str = ""
+    new_unit_rent_status: str = "Vacant"
+    new_unit_lease_end: str = ""
+    edit_unit_property: str = ""
+    edit_unit_number: str = ""
+    edit_unit_rent_amount: str = ""
+    edit_unit_tenant_name: str = ""
+    edit_unit_rent_status: str = ""
+    edit_unit_lease_end: str = ""
+    new_request_property: str = ""
+    new_request_unit: str = ""
+    new_request_description: str = ""
+    new_request_priority: str = "Low"
+    new_request_vendor: str = ""
+
+    def _load_property_names(self):
+        self.property_names = sorted(
+            prop["name"] for prop in repository.list_properties()
+        )
+
+    @rx.event
+    def load_property_names(self):
+        self._load_property_names()
+
+    def _reset_new_unit_form(self):
+        self.new_unit_property = ""
+        self.new_unit_number = ""
+        self.new_unit_rent_amount = ""
+        self.new_unit_tenant_name = ""
+        self.new_unit_rent_status = "Vacant"
+        self.new_unit_lease_end = ""
+
+    @rx.event
+    def open_add_unit_form(self):
+        self._load_property_names()
+        self._reset_new_unit_form()
+        self.add_unit_form_open = True
+
+    @rx.event
+    def close_add_unit_form(self):
+        self.add_unit_form_open = False
+        self._reset_new_unit_form()
+
+    @rx.event
+    def set_new_unit_property(self, value: str):
+        self.new_unit_property = value
+
+    @rx.event
+    def set_new_unit_rent_status(self, value: str):
+        self.new_unit_rent_status = value
+
+    @rx.event
+    async def add_unit(self, form_data: dict):
+        try:
+            new_unit = unit_from_form(form_data)
+        except ValueError as e:
+            return rx.toast.error(str(e))
+        unit = repository.units().add(new_unit)
+        (await self.get_state(UnitsState))._load_units()
+        self.add_unit_form_open = False
+        self._reset_new_unit_form()
+        return rx.toast.success(f"Unit {unit['unit_number']} added successfully!")
+
+    def _reset_new_request_form(self):
+        self.new_request_property = ""
+        self.new_request_unit = ""
+        self.new_request_description = ""
+        self.new_request_priority = "Low"
+        self.new_request_vendor = ""
+
+    @rx.event
+    def set_new_request_property(self, value: str):
+        self.new_request_property = value
+
+    @rx.event
+    def set_new_request_priority(self, value: str):
+        self.new_request_priority = value
+
+    @rx.event
+    def set_new_request_vendor(self, value: str):
+        self.new_request_vendor = value
+
+    @rx.event
+    async def add_maintenance_request(self, form_data: dict):
+        if not all(
+            [
+                form_data.get("property_name"),
+                form_data.get("unit"),
+                form_data.get("description"),
+            ]
+        ):
+            return rx.toast.error("Property, Unit, and Description are required.")
+        repository.maintenance_requests().add(
+            {
+                "property_name": form_data["property_name"],
+                "unit": form_data["unit"],
+                "description": form_data["description"],
+                "priority": form_data.get("priority", "Low"),
+                "status": "Open",
+                "vendor": form_data.get("vendor") or None,
+            }
+        )
+        (await self.get_state(MaintenanceState))._load_maintenance_requests()
+        self._reset_new_request_form()
+        return rx.toast.success("Maintenance request added!")
+
+    @rx.event
+    def open_edit_unit_form(self, unit_id: int):
+        unit = repository.units().get(unit_id)
+        if unit:
+            self._load_property_names()
+            self.edit_unit_id = unit["id"]
+            self.edit_unit_property = unit["property_name"]
+            self.edit_unit_number = unit["unit_number"]
+            self.edit_unit_rent_amount = str(unit["rent_amount"])
+            self.edit_unit_tenant_name = unit["tenant_name"] or ""
+            self.edit_unit_rent_status = unit["rent_status"]
+            lease_end = parse_lease_end(unit["lease_end"])
+            self.edit_unit_lease_end = lease_end.isoformat() if lease_end else ""
+            self.edit_unit_form_open = True
+
+    @rx.event
+    def close_edit_unit_form(self):
+        self.edit_unit_form_open = False
+        self.edit_unit_id = None
+
+    @rx.event
+    def set_edit_unit_property(self, value: str):
+        self.edit_unit_property = value
+
+    @rx.event
+    def set_edit_unit_rent_status(self, value: str):
+        self.edit_unit_rent_status = value
+
+    @rx.event
+    async def update_unit(self, form_data: dict):
+        if self.edit_unit_id is None:
+            return rx.toast.error("No unit selected for editing.")
+        try:
+            changes = unit_from_form(
+                {
+                    **form_data,
+                    "property_name": self.edit_unit_property,
+                    "rent_status": self.edit_unit_rent_status,
+                }
+            )
+        except ValueError as e:
+            return rx.toast.error(str(e))
+        del changes["archived"]
+        updated = repository.units().update(self.edit_unit_id, changes)
+        if not updated:
+            return rx.toast.error("Unit not found.")
+        (await self.get_state(UnitsState))._load_units()
+        self.edit_unit_form_open = False
+        return rx.toast.info(f"Unit {changes['unit_number']} updated successfully!")
@@ -0,0 +1,146 @@
+import asyncio
+import functools
+import io
+from typing import BinaryIO
+
+import reflex as rx
+
+from app.data import importer, jobs
+from app.data.models import ImportReport, ImportRowError
+from app.states.state import PropertyManagementState
+from app.states.tenants import TenantsState
+from app.states.units import UnitsState
+
+IMPORTS = {
+    "units": (importer.import_units, UnitsState),
+    "tenants": (importer.import_tenants, TenantsState),
+}
+
+
+def _import_files(
+    files: list[tuple[BinaryIO, str]], kind: str, job: jobs.Job
+) -> ImportReport:
+    run = IMPORTS[kind][0]
+    sizes = [stream.seek(0, io.SEEK_END) for stream, _ in files]
+    total = ImportReport(imported=0, failed=0, errors=[])
+    offset = 0
+    for (stream, name), size in zip(files, sizes):
+        stream.seek(0)
+
+        def progress(
+            report: ImportReport, stream: BinaryIO = stream, offset: int = offset
+        ) -> None:
+            job.advance(
+                offset + stream.tell(),
+                sum(sizes),
+                imported=total["imported"] + report["imported"],
+                failed=total["failed"] + report["failed"],
+            )
+
+        report = run(stream, name, progress)
+        total["imported"] += report["imported"]
+        total["failed"] += report["failed"]
+        total["errors"].extend(report["errors"])
+        offset += size
+    return total
+
+
+class ImportState(PropertyManagementState):
+    import_finished: bool = False
+    import_running: bool = False
+    import_progress: int = 0
+    imported_rows: int = 0
+    failed_rows: int = 0
+    import_errors: list[ImportRowError] = rx.field(default_factory=list)
+    _import_kind: str = ""
+
+    @rx.var
+    def more_import_errors(self) -> int:
+        return self.failed_rows - len(self.import_errors)
+
+    def _clear_report(self):
+        self.import_finished = False
+        self.import_progress = 0
+        self.imported_rows = 0
+        self.failed_rows = 0
+        self.import_errors = []
+
+    def _start_import(self, files: list[rx.UploadFile], kind: str):
+        if not files:
+            return rx.toast.error("Choose a CSV or JSON Lines file to import.")
+        staged = [(file.file, file.name or "") for file in files]
+        job = jobs.start(
+            self.router.session.client_token,
+            functools.partial(_import_files, staged, kind),
+        )
+        if job is None:
+            return rx.toast.error("An import is already running.")
+        self._clear_report()
+        self.import_running = True
+        self._import_kind = kind
+        return ImportState.watch_import
+
+    def _show_progress(self, job: jobs.Job):
+        self.import_progress = job.percent
+        self.imported_rows = job.counts.get("imported", 0)
+        self.failed_rows = job.counts.get("failed", 0)
+
+    def _toast(self, report: ImportReport, noun: str) -> rx.event.EventSpec:
+        message = f"Imported {report['imported']} {noun}."
+        if report["failed"]:
+            return rx.toast.warning(f"{message} {report['failed']} rows had errors.")
+        return rx.toast.success(message)
+
+    @rx.event
+    def reset_import(self):
+        if not self.import_running:
+            self._clear_report()
+
+    @rx.event
+    async def import_units(self, files: list[rx.UploadFile]):
+        return self._start_import(files, "units")
+
+    @rx.event
+    async def import_tenants(self, files: list[rx.UploadFile]):
+        return self._start_import(files, "tenants")
+
+    @rx.event
+    def cancel_import(self):
+        jobs.cancel(self.router.session.client_token)
+
+    @rx.event(background=True)
+    async def watch_import(self):
+        token = self.router.session.client_token
+        job = jobs.get(token)
+        if job is None:
+            return
+        report = None
+        try:
+            while not job.future.done():
+                await asyncio.wait([job.future], timeout=jobs.PROGRESS_INTERVAL)
+                async with self:
+                    self._show_progress(job)
+            report = job.future.result()
+        except jobs.JobCancelled:
+            pass
+        finally:
+            jobs.finish(token, job)
+            async with self:
+                self.import_running = False
+                self.import_finished = True
+                kind = self._import_kind
+                if report is not None:
+                    self.import_progress = 100
+                    self.imported_rows = report["imported"]
+                    self.failed_rows = report["failed"]
+                    self.import_errors = report["errors"][
+                        : importer.MAX_REPORTED_ERRORS
+                    ]
+                imported = self.imported_rows
+                if imported:
+                    (await self.get_state(IMPORTS[kind][1])).load()
+        if report is None:
+            return rx.toast.info(
+                f"Import cancelled; {imported} {kind} were imported before it stopped."
+            )
+        return self._toast(report, kind)
@@ -0,0 +1,47 @@
+import reflex as rx
+
+from app.data import broadcast
+from app.states.dashboard import DashboardState
+from app.states.maintenance import MaintenanceState
+from app.states.state import PropertyManagementState
+from app.states.tenants import TenantsState
+from app.states.units import UnitsState
+
+IDLE_CHECK_SECONDS = 15
+SECTION_STATES = {
+    "dashboard": DashboardState,
+    "units": UnitsState,
+    "tenants": TenantsState,
+    "maintenance": MaintenanceState,
+}
+
+_watched_tokens: set[str] = set()
+
+
+def _connected(token: str) -> bool:
+    from app.app import app
+
+    namespace = app.event_namespace
+    return namespace is not None and token in namespace.token_to_sid
+
+
+class LiveUpdatesState(PropertyManagementState):
+    @rx.event(background=True)
+    async def watch_changes(self):
+        token = self.router.session.client_token
+        if token in _watched_tokens:
+            return
+        _watched_tokens.add(token)
+        try:
+            with broadcast.subscribe() as subscription:
+                while _connected(token):
+                    batch = await subscription.next_batch(IDLE_CHECK_SECONDS)
+                    if not batch:
+                        continue
+                    async with self:
+                        section = await self.get_state(
+                            SECTION_STATES[self.active_section]
+                        )
+                        section._apply_changes(batch)
+        finally:
+            _watched_tokens.discard(token)
@@ -0,0 +1,207 @@
+import reflex as rx
+
+from app.data import broadcast, list_patch, repository
+from app.data.models import ListPatch, MaintenanceRequest
+from app.states.state import PropertyManagementState
+
+MAINTENANCE_PAGE_SIZE = 50
+MAINTENANCE_SORT_LABELS = {
+    "status": "Status",
+    "priority": "Priority",
+    "property": "Property",
+    "vendor": "Vendor",
+    "newest": "Newest",
+    "oldest": "Oldest",
+}
+MAINTENANCE_SORT_FIELDS = {
+    "status": "status",
+    "priority": "priority",
+    "property": "property_name",
+    "vendor": "vendor",
+}
+
+
+def _page_count(total: int) -> int:
+    return max(1, -(-total // MAINTENANCE_PAGE_SIZE))
+
+
+class MaintenanceState(PropertyManagementState):
+    maintenance_filter: str = "All"
+    maintenance_search: str = ""
+    maintenance_sort: list[str] = rx.field(
+        default_factory=lambda: list(repository.DEFAULT_TICKET_SORT)
+    )
+    maintenance_page: int = 1
+    maintenance_total: int = 0
+    filtered_maintenance_requests: list[MaintenanceRequest] = rx.field(
+        default_factory=list
+    )
+    filtered_maintenance_requests_patch: ListPatch = rx.field(
+        default_factory=list_patch.empty
+    )
+    selected_maintenance_ids: list[int] = rx.field(default_factory=list)
+    _filtered_maintenance_requests_shown: list[MaintenanceRequest] = rx.field(
+        default_factory=list
+    )
+
+    @rx.var
+    def maintenance_page_count(self) -> int:
+        return _page_count(self.maintenance_total)
+
+    @rx.var
+    def maintenance_sort_label(self) -> str:
+        labels = [MAINTENANCE_SORT_LABELS[key] for key in self.maintenance_sort]
+        return " → ".join(labels) or MAINTENANCE_SORT_LABELS["oldest"]
+
+    def _load_maintenance_requests(self):
+        status = None if self.maintenance_filter == "All" else self.maintenance_filter
+        if self.maintenance_search.strip():
+            rows = repository.search_maintenance_requests(
+                self.maintenance_search, status
+            )
+            self._show_records("filtered_maintenance_requests", rows)
+            self.maintenance_total = len(rows)
+            return
+        self.maintenance_total = repository.count_maintenance_requests(status)
+        self.maintenance_page = min(
+            self.maintenance_page, _page_count(self.maintenance_total)
+        )
+        rows = repository.list_maintenance_requests(
+            status,
+            self.maintenance_sort,
+            offset=(self.maintenance_page - 1) * MAINTENANCE_PAGE_SIZE,
+            limit=MAINTENANCE_PAGE_SIZE,
+        )
+        self._show_records("filtered_maintenance_requests", rows)
+
+    def _apply_changes(self, batch: broadcast.Changes):
+        changed = batch.get("maintenance")
+        if not changed:
+            return
+        shown = self._shown_records("filtered_maintenance_requests")
+        if self.maintenance_search.strip():
+            patched = broadcast.patch_shown(shown, changed)
+        else:
+            stable_fields = {"status"} | {
+                MAINTENANCE_SORT_FIELDS[key]
+                for key in self.maintenance_sort
+                if key in MAINTENANCE_SORT_FIELDS
+            }
+            patched = broadcast.patch(shown, changed, stable_fields)
+            if patched is None:
+                self._load_maintenance_requests()
+        if patched is not None:
+            self._show_records("filtered_maintenance_requests", patched)
+
+    @rx.event
+    def load(self):
+        self._load_maintenance_requests()
+
+    @rx.event
+    def resync_maintenance_requests(self):
+        self._send_records(
+            "filtered_maintenance_requests",
+            self._shown_records("filtered_maintenance_requests"),
+        )
+
+    @rx.event
+    def unload(self):
+        self._show_records("filtered_maintenance_requests", [])
+        if self.selected_maintenance_ids:
+            self.selected_maintenance_ids = []
+
+    @rx.event
+    def set_maintenance_filter(self, status: str):
+        self.maintenance_filter = status
+        self.maintenance_page = 1
+        self._load_maintenance_requests()
+
+    @rx.event
+    def search_maintenance(self, query: str):
+        self.maintenance_search = query
+        self.maintenance_page = 1
+        self._load_maintenance_requests()
+
+    @rx.event
+    def toggle_maintenance_sort(self, key: str):
+        if key not in MAINTENANCE_SORT_LABELS:
+            return
+        if key in self.maintenance_sort:
+            self.maintenance_sort.remove(key)
+        else:
+            opposite = {"newest": "oldest", "oldest": "newest"}.get(key)
+            if opposite in self.maintenance_sort:
+                self.maintenance_sort.remove(opposite)
+            self.maintenance_sort.append(key)
+        self.maintenance_page = 1
+        self._load_maintenance_requests()
+
+    @rx.event
+    def next_maintenance_page(self):
+        if self.maintenance_page < _page_count(self.maintenance_total):
+            self.maintenance_page += 1
+            self._load_maintenance_requests()
+
+    @rx.event
+    def prev_maintenance_page(self):
+        if self.maintenance_page > 1:
+            self.maintenance_page -= 1
+            self._load_maintenance_requests()
+
+    @rx.event
+    def update_maintenance_status(self, request_id: int, status: str):
+        if repository.maintenance_requests().update(request_id, {"status": status}):
+            self._load_maintenance_requests()
+            return rx.toast.info(f"Request status updated to {status}.")
+
+    @rx.event
+    def update_maintenance_vendor(self, request_id: int, vendor: str):
+        if repository.maintenance_requests().update(request_id, {"vendor": vendor}):
+            self._load_maintenance_requests()
+            return rx.toast.info(
+                f"Vendor for request #{request_id} updated to {vendor}."
+            )
+
+    @rx.event
+    def toggle_maintenance_selection(self, request_id: int):
+        if request_id in self.selected_maintenance_ids:
+            self.selected_maintenance_ids.remove(request_id)
+        else:
+            self.selected_maintenance_ids.append(request_id)
+
+    @rx.event
+    def select_maintenance_page(self):
+        selected = set(self.selected_maintenance_ids)
+        self.selected_maintenance_ids.extend(
+            req["id"]
+            for req in self._shown_records("filtered_maintenance_requests")
+            if req["id"] not in selected
+        )
+
+    @rx.event
+    def clear_maintenance_selection(self):
+        self.selected_maintenance_ids = []
+
+    def _update_selected_maintenance(self, changes: dict) -> int:
+        updated = repository.maintenance_requests().update_many(
+            self.selected_maintenance_ids, changes
+        )
+        self.selected_maintenance_ids = []
+        self._load_maintenance_requests()
+        return len(updated)
+
+    @rx.event
+    def update_selected_maintenance_status(self, status: str):
+        if not self.selected_maintenance_ids:
+            return
+        count = self._update_selected_maintenance({"status": status})
+        noun = "request" if count == 1 else "requests"
+        return rx.toast.info(f"{count} {noun} updated to {status}.")
+
+    @rx.event
+    def assign_selected_maintenance_vendor(self, vendor: str):
+        if not self.selected_maintenance_ids or not vendor:
+            return
+        count = self._update_selected_maintenance({"vendor": vendor})
+        noun = "request" if count == 1 else "requests"
+        return rx.toast.info(f"{count} {noun} assigned to {vendor}.")
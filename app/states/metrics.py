@@ -0,0 +1,72 @@
+import functools
+import time
+
+import reflex as rx
+from reflex.constants.state import FIELD_MARKER
+from reflex.event import Event
+from reflex.middleware import Middleware
+from reflex.state import BaseState, StateUpdate
+from reflex.utils.format import json_dumps
+
+from app.data import metrics
+from app.data.models import HandlerMetric
+from app.states.state import PropertyManagementState
+
+
+@functools.cache
+def _state_index() -> dict[str, tuple[str, frozenset[str]]]:
+    index, stack = {}, [PropertyManagementState]
+    while stack:
+        state_cls = stack.pop()
+        index[state_cls.get_full_name()] = (
+            state_cls.__name__,
+            frozenset(state_cls.computed_vars),
+        )
+        stack.extend(state_cls.class_subclasses)
+    return index
+
+
+def _recomputed_vars(delta: dict) -> list[str]:
+    index, recomputed = _state_index(), []
+    for state_name, fields in delta.items():
+        if state_name not in index:
+            continue
+        class_name, computed_vars = index[state_name]
+        for field in fields:
+            name = field.removesuffix(FIELD_MARKER)
+            if name in computed_vars:
+                recomputed.append(f"{class_name}.{name}")
+    return recomputed
+
+
+class MetricsMiddleware(Middleware):
+    def __init__(self):
+        self._started: dict[int, float] = {}
+
+    async def preprocess(self, app, state: BaseState, event: Event) -> None:
+        self._started[id(event)] = time.perf_counter()
+
+    async def postprocess(
+        self, app, state: BaseState, event: Event, update: StateUpdate
+    ) -> StateUpdate:
+        state_name, _, name = event.name.rpartition(".")
+        started = None if update.final is False else self._started.pop(id(event), None)
+        if state_name not in _state_index():
+            return update
+        handler = f"{_state_index()[state_name][0]}.{name}"
+        metrics.observe_update(
+            handler, len(json_dumps(update.delta)), _recomputed_vars(update.delta)
+        )
+        if started is not None and update.final:
+            metrics.observe_processed(handler, time.perf_counter() - started)
+        return update
+
+
+class MetricsState(PropertyManagementState):
+    handler_metrics: list[HandlerMetric] = rx.field(default_factory=list)
+    recomputes: list[tuple[str, int]] = rx.field(default_factory=list)
+
+    @rx.event
+    def refresh(self):
+        self.handler_metrics = metrics.handler_metrics()
+        self.recomputes = metrics.recompute_counts()
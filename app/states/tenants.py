@@ -0,0 +1,85 @@
+import reflex as rx
+
+from app.data import broadcast, repository
+from app.data.models import Tenant
+from app.states.state import PropertyManagementState
+
+TENANTS_PAGE_SIZE = 20
+
+
+class TenantsState(PropertyManagementState):
+    tenants: list[Tenant] = rx.field(default_factory=list)
+    tenant_search: str = ""
+    tenant_total: int = 0
+    tenant_page: int = 1
+    tenant_has_next_page: bool = False
+    _tenant_page_start: int = 0
+
+    @rx.var
+    def tenant_page_count(self) -> int:
+        return max(1, -(-self.tenant_total // TENANTS_PAGE_SIZE))
+
+    def _reset_tenant_pages(self):
+        self.tenant_page = 1
+        self._tenant_page_start = 0
+
+    def _load_tenants(self):
+        if self.tenant_search.strip():
+            self.tenants = repository.search_tenants(self.tenant_search)
+            self.tenant_total = len(self.tenants)
+            self.tenant_has_next_page = False
+            return
+        rows = repository.list_tenants(self._tenant_page_start, TENANTS_PAGE_SIZE + 1)
+        if not rows and self._tenant_page_start:
+            self._reset_tenant_pages()
+            rows = repository.list_tenants(limit=TENANTS_PAGE_SIZE + 1)
+        self.tenant_has_next_page = len(rows) > TENANTS_PAGE_SIZE
+        self.tenants = rows[:TENANTS_PAGE_SIZE]
+        self.tenant_total = repository.count_tenants()
+
+    def _apply_changes(self, batch: broadcast.Changes):
+        changed = batch.get("tenants")
+        if not changed:
+            return
+        if self.tenant_search.strip():
+            patched = broadcast.patch_shown(self.tenants, changed)
+        else:
+            patched = broadcast.patch(self.tenants, changed)
+            if patched is None:
+                self._load_tenants()
+        if patched is not None:
+            self.tenants = patched
+
+    @rx.event
+    def load(self):
+        self._load_tenants()
+
+    @rx.event
+    def search_tenants(self, query: str):
+        self.tenant_search = query
+        self._reset_tenant_pages()
+        self._load_tenants()
+
+    @rx.event
+    def next_tenant_page(self):
+        if not self.tenant_has_next_page:
+            return
+        self._tenant_page_start = self.tenants[-1]["id"] + 1
+        self.tenant_page += 1
+        self._load_tenants()
+
+    @rx.event
+    def prev_tenant_page(self):
+        if self.tenant_page <= 1 or not self.tenants:
+            return
+        rows = repository.tenants().list_before(
+            self.tenants[0]["id"], TENANTS_PAGE_SIZE
+        )
+        self._tenant_page_start = rows[0]["id"] if rows else 0
+        self.tenant_page -= 1
+        self._load_tenants()
+
+    @rx.event
+    def unload(self):
+        if self.tenants:
+            self.tenants = []
@@ -0,0 +1,237 @@
+import datetime
+
+import reflex as rx
+
+from app.data import broadcast, list_patch, repository
+from app.data.models import ListPatch, Unit
+from app.states.state import PropertyManagementState
+
+UNITS_PAGE_SIZE = 24
+UNITS_WINDOW_LIMIT = 4 * UNITS_PAGE_SIZE
+
+
+class UnitsState(PropertyManagementState):
+    unit_filter: str = "All"
+    unit_search: str = ""
+    filtered_units: list[Unit] = rx.field(default_factory=list)
+    filtered_units_patch: ListPatch = rx.field(default_factory=list_patch.empty)
+    unit_total: int = 0
+    unit_page: int = 1
+    unit_has_next_page: bool = False
+    unit_infinite_scroll: bool = False
+    unit_window_offset: int = 0
+    unit_has_previous_rows: bool = False
+    selected_unit_ids: list[int] = rx.field(default_factory=list)
+    _filtered_units_shown: list[Unit] = rx.field(default_factory=list)
+    _unit_page_start: int = 0
+    _unit_window: int = UNITS_PAGE_SIZE
+
+    @rx.var
+    def unit_page_count(self) -> int:
+        return max(1, -(-self.unit_total // UNITS_PAGE_SIZE))
+
+    @rx.var
+    def unit_page_label(self) -> str:
+        shown = len(self._filtered_units_shown)
+        if not shown:
+            return "No units"
+        first = (
+            self.unit_window_offset + 1
+            if self.unit_infinite_scroll
+            else (self.unit_page - 1) * UNITS_PAGE_SIZE + 1
+        )
+        last = first + shown - 1
+        return f"Showing {first}-{last} of {self.unit_total}"
+
+    def _unit_query(self) -> dict:
+        return repository.unit_filter_query(self.unit_filter)
+
+    def _reset_unit_pages(self):
+        self.unit_page = 1
+        self._unit_page_start = 0
+        self._unit_window = UNITS_PAGE_SIZE
+        self.unit_window_offset = 0
+        self.unit_has_previous_rows = False
+
+    def _load_units(self):
+        if self.unit_search.strip():
+            rows = repository.search_units(self.unit_search, self.unit_filter)
+            self._show_records("filtered_units", rows)
+            self.unit_total = len(rows)
+            self.unit_has_next_page = False
+            return
+        rows = repository.list_units(
+            self.unit_filter, self._unit_page_start, self._unit_window + 1
+        )
+        if not rows and self._unit_page_start:
+            self._reset_unit_pages()
+            rows = repository.list_units(self.unit_filter, limit=self._unit_window + 1)
+        self.unit_has_next_page = len(rows) > self._unit_window
+        self._show_records("filtered_units", rows[: self._unit_window])
+        self.unit_total = repository.count_units(self.unit_filter)
+
+    def _apply_changes(self, batch: broadcast.Changes):
+        changed = batch.get("units")
+        if not changed:
+            return
+        shown = self._shown_records("filtered_units")
+        if self.unit_search.strip():
+            patched = broadcast.patch_shown(shown, changed)
+        else:
+            patched = broadcast.patch(shown, changed, {"archived", *self._unit_query()})
+            if patched is None:
+                self._load_units()
+        if patched is not None:
+            self._show_records("filtered_units", patched)
+
+    @rx.event
+    def load(self):
+        self._load_units()
+
+    @rx.event
+    def resync_units(self):
+        self._send_records("filtered_units", self._shown_records("filtered_units"))
+
+    @rx.event
+    def unload(self):
+        self._show_records("filtered_units", [])
+        if self.selected_unit_ids:
+            self.selected_unit_ids = []
+
+    @rx.event
+    def set_unit_filter(self, status: str):
+        self.unit_filter = status
+        self._reset_unit_pages()
+        self._load_units()
+
+    @rx.event
+    def search_units(self, query: str):
+        self.unit_search = query
+        self._reset_unit_pages()
+        self._load_units()
+
+    @rx.event
+    def next_unit_page(self):
+        if not self.unit_has_next_page:
+            return
+        self._unit_page_start = self._shown_records("filtered_units")[-1]["id"] + 1
+        self.unit_page += 1
+        self._load_units()
+
+    @rx.event
+    def prev_unit_page(self):
+        shown = self._shown_records("filtered_units")
+        if self.unit_page <= 1 or not shown:
+            return
+        rows = repository.units().list_before(
+            shown[0]["id"], UNITS_PAGE_SIZE, **self._unit_query()
+        )
+        self._unit_page_start = rows[0]["id"] if rows else 0
+        self.unit_page -= 1
+        self._load_units()
+
+    @rx.event
+    def load_more_units(self):
+        if not self.unit_has_next_page:
+            return
+        shown = self._shown_records("filtered_units")
+        rows = repository.list_units(
+            self.unit_filter, shown[-1]["id"] + 1, UNITS_PAGE_SIZE + 1
+        )
+        self.unit_has_next_page = len(rows) > UNITS_PAGE_SIZE
+        shown.extend(rows[:UNITS_PAGE_SIZE])
+        trimmed = max(0, len(shown) - UNITS_WINDOW_LIMIT)
+        if trimmed:
+            shown = shown[trimmed:]
+            self.unit_window_offset += trimmed
+            self.unit_has_previous_rows = True
+        self._show_unit_window(shown)
+
+    @rx.event
+    def load_previous_units(self):
+        shown = self._shown_records("filtered_units")
+        if not self.unit_has_previous_rows or not shown:
+            return
+        rows = repository.units().list_before(
+            shown[0]["id"], UNITS_PAGE_SIZE + 1, **self._unit_query()
+        )
+        self.unit_has_previous_rows = len(rows) > UNITS_PAGE_SIZE
+        rows = rows[-UNITS_PAGE_SIZE:]
+        shown = rows + shown
+        if len(shown) > UNITS_WINDOW_LIMIT:
+            shown = shown[:UNITS_WINDOW_LIMIT]
+            self.unit_has_next_page = True
+        self.unit_window_offset = (
+            max(0, self.unit_window_offset - len(rows))
+            if self.unit_has_previous_rows
+            else 0
+        )
+        self._show_unit_window(shown)
+
+    def _show_unit_window(self, shown: list[Unit]):
+        self._show_records("filtered_units", shown)
+        self._unit_page_start = shown[0]["id"]
+        self._unit_window = len(shown)
+
+    @rx.event
+    def toggle_unit_infinite_scroll(self):
+        self.unit_infinite_scroll = not self.unit_infinite_scroll
+        self._reset_unit_pages()
+        self._load_units()
+
+    @rx.event
+    def toggle_unit_archive(self, unit_id: int):
+        units = repository.units()
+        unit = units.get(unit_id)
+        if unit is None:
+            return
+        units.update(unit_id, {"archived": not unit["archived"]})
+        self._load_units()
+        status = "restored" if unit["archived"] else "archived"
+        return rx.toast.success(f"Unit {unit['unit_number']} {status}.")
+
+    @rx.event
+    def settle_unit_rent(self, unit_id: int):
+        unit = repository.units().get(unit_id)
+        if unit is None:
+            return
+        paid = repository.rent_ledger().settle(unit_id, datetime.date.today())
+        self._load_units()
+        if not paid:
+            return rx.toast.info(f"Unit {unit['unit_number']} has nothing owed.")
+        return rx.toast.success(
+            f"Recorded ${paid} payment for unit {unit['unit_number']}."
+        )
+
+    @rx.event
+    def toggle_unit_selection(self, unit_id: int):
+        if unit_id in self.selected_unit_ids:
+            self.selected_unit_ids.remove(unit_id)
+        else:
+            self.selected_unit_ids.append(unit_id)
+
+    @rx.event
+    def select_unit_page(self):
+        selected = set(self.selected_unit_ids)
+        self.selected_unit_ids.extend(
+            unit["id"]
+            for unit in self._shown_records("filtered_units")
+            if unit["id"] not in selected
+        )
+
+    @rx.event
+    def clear_unit_selection(self):
+        self.selected_unit_ids = []
+
+    @rx.event
+    def archive_selected_units(self, archived: bool):
+        if not self.selected_unit_ids:
+            return
+        updated = repository.units().update_many(
+            self.selected_unit_ids, {"archived": archived}
+        )
+        self.selected_unit_ids = []
+        self._load_units()
+        noun = "unit" if len(updated) == 1 else "units"
+        status = "archived" if archived else "restored"
+        return rx.toast.success(f"{len(updated)} {noun} {status}.")
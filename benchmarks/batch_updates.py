@@ -0,0 +1,151 @@
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+from state_deltas import find_state, process, seed
+
+VENDOR = "QuickFix Plumbing"
+
+
+def handler(name: str) -> str:
+    return f"{find_state(name).get_full_name()}.{name}"
+
+
+async def replay(root, label: str, steps: list[tuple[str, dict]], records: int):
+    start = time.perf_counter()
+    delta_bytes = 0
+    for name, payload in steps:
+        delta_bytes += await process(root, handler(name), payload)
+    elapsed = time.perf_counter() - start
+    return {
+        "case": label,
+        "events": len(steps),
+        "delta_bytes": delta_bytes,
+        "ms": round(elapsed * 1000, 2),
+        "records_per_s": round(records / elapsed),
+    }
+
+
+def repository_case(label: str, fn, records: int) -> dict:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    return {
+        "case": label,
+        "events": None,
+        "delta_bytes": None,
+        "ms": round(elapsed * 1000, 2),
+        "records_per_s": round(records / elapsed),
+    }
+
+
+async def run(records: int) -> list[dict]:
+    importlib.import_module("app.app")
+    from reflex.state import State
+
+    from app.data import repository
+    from app.states.maintenance import MAINTENANCE_PAGE_SIZE, MaintenanceState
+    from app.states.units import UNITS_PAGE_SIZE, UnitsState
+
+    pages = -(-records // MAINTENANCE_PAGE_SIZE)
+    unit_pages = -(-records // UNITS_PAGE_SIZE)
+    root = State(_reflex_internal_init=True)
+    for state in (MaintenanceState, UnitsState):
+        await process(root, f"{state.get_full_name()}.load", {})
+    results = [
+        await replay(
+            root,
+            "tickets: vendor one at a time",
+            [
+                ("update_maintenance_vendor", {"request_id": i, "vendor": VENDOR})
+                for i in range(1, records + 1)
+            ],
+            records,
+        ),
+        await replay(
+            root,
+            "tickets: vendor batch per page",
+            [
+                step
+                for _ in range(pages)
+                for step in (
+                    ("select_maintenance_page", {}),
+                    ("assign_selected_maintenance_vendor", {"vendor": VENDOR}),
+                    ("next_maintenance_page", {}),
+                )
+            ],
+            pages * MAINTENANCE_PAGE_SIZE,
+        ),
+        await replay(
+            root,
+            "units: archive one at a time",
+            [("toggle_unit_archive", {"unit_id": i}) for i in range(1, records + 1)],
+            records,
+        ),
+        await replay(
+            root,
+            "units: archive batch per page",
+            [
+                step
+                for _ in range(unit_pages)
+                for step in (
+                    ("select_unit_page", {}),
+                    ("archive_selected_units", {"archived": True}),
+                )
+            ],
+            unit_pages * UNITS_PAGE_SIZE,
+        ),
+    ]
+    ids = list(range(1, records + 1))
+    tickets = repository.maintenance_requests()
+    results.append(
+        repository_case(
+            "repository: update x N",
+            lambda: [tickets.update(i, {"status": "Open"}) for i in ids],
+            records,
+        )
+    )
+    results.append(
+        repository_case(
+            "repository: update_many(N)",
+            lambda: tickets.update_many(ids, {"status": "Completed"}),
+            records,
+        )
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare one-at-a-time and batch updates for units and tickets."
+    )
+    parser.add_argument("--units", type=int, default=10_000)
+    parser.add_argument("--tickets", type=int, default=10_000)
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--json", action="store_true", help="Emit JSON lines.")
+    args = parser.parse_args()
+
+    os.environ["PROPMANAGE_DB_PATH"] = os.path.join(tempfile.mkdtemp(), "bench.db")
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    seed(args.units, args.tickets)
+    for result in asyncio.run(run(args.records)):
+        if args.json:
+            print(json.dumps(result))
+        else:
+            events = "" if result["events"] is None else result["events"]
+            delta = (
+                "" if result["delta_bytes"] is None else f"{result['delta_bytes']} B"
+            )
+            print(
+                f"{result['case']:<34} {events:>6} {delta:>12}"
+                f" {result['ms']:>10.2f} ms {result['records_per_s']:>8}/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
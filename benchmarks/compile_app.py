@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES = ("app", "assets", "rxconfig.py")
+
+
+def copy_tree(target: Path) -> None:
+    for name in SOURCES:
+        source = ROOT / name
+        if source.is_dir():
+            shutil.copytree(
+                source, target / name, ignore=shutil.ignore_patterns("__pycache__")
+            )
+        elif source.exists():
+            shutil.copy(source, target / name)
+
+
+def bundle_sizes(web: Path) -> dict[str, int]:
+    return {
+        str(path.relative_to(web)): path.stat().st_size
+        for path in sorted(web.rglob("*.jsx"))
+        if "node_modules" not in path.parts
+    }
+
+
+def compile_once() -> dict:
+    from reflex.app import App
+    from reflex.utils import frontend_skeleton
+
+    # Only the generated sources are measured, so skip the npm install and
+    # router config steps that need a node toolchain.
+    App._get_frontend_packages = lambda self, imports: None
+    frontend_skeleton.update_react_router_config = lambda **kwargs: None
+    frontend_skeleton.initialize_web_directory()
+
+    start = time.perf_counter()
+    import app.app as module
+
+    imported = time.perf_counter()
+    module.app._compile(use_rich=False)
+    compiled = time.perf_counter()
+    files = bundle_sizes(Path.cwd() / ".web")
+    return {
+        "import_ms": round((imported - start) * 1000, 2),
+        "compile_ms": round((compiled - imported) * 1000, 2),
+        "bundle_bytes": sum(files.values()),
+        "files": files,
+    }
+
+
+def run(runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as workdir:
+            copy_tree(Path(workdir))
+            env = {
+                **os.environ,
+                "PROPMANAGE_DB_PATH": os.path.join(workdir, "bench.db"),
+                "REFLEX_ENV_MODE": "prod",
+            }
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--once"],
+                cwd=workdir,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        "runs": runs,
+        "import_ms": round(statistics.median(s["import_ms"] for s in samples), 2),
+        "compile_ms": round(statistics.median(s["compile_ms"] for s in samples), 2),
+        "bundle_bytes": samples[-1]["bundle_bytes"],
+        "files": samples[-1]["files"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time app compilation and measure the generated JS sources."
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Emit a JSON object.")
+    parser.add_argument("--once", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.once:
+        sys.path.insert(0, os.getcwd())
+        print(json.dumps(compile_once()))
+        return
+    result = run(args.runs)
+    if args.json:
+        print(json.dumps(result))
+        return
+    for name, size in result["files"].items():
+        print(f"{name:<48} {size:>10} B")
+    print(f"{'total':<48} {result['bundle_bytes']:>10} B")
+    print(f"import  {result['import_ms']:>10.2f} ms (median of {result['runs']})")
+    print(f"compile {result['compile_ms']:>10.2f} ms (median of {result['runs']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+import argparse
+import asyncio
+import importlib
+import importlib.util
+import json
+import os
+import random
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+from state_deltas import find_state
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES = ("app", "assets", "rxconfig.py")
+SESSION_PUSH_TIMEOUT = 2.0
+
+
+def scenario(client: int, rng: random.Random, units: int) -> list[tuple]:
+    unit_id = rng.randrange(1, units + 1)
+    return [
+        ("navigate", "/units"),
+        ("set_unit_filter", {"status": "Paid"}),
+        ("next_unit_page", {}),
+        ("navigate", "/maintenance"),
+        (
+            "add_maintenance_request",
+            {
+                "form_data": {
+                    "property_name": "Property 1",
+                    "unit": "#101",
+                    "description": f"Load test ticket from client {client}",
+                    "priority": rng.choice(("Low", "Medium", "High")),
+                }
+            },
+        ),
+        (
+            "update_maintenance_status",
+            {"request_id": rng.randrange(1, 1000), "status": "In Progress"},
+        ),
+        ("navigate", "/units"),
+        ("open_edit_unit_form", {"unit_id": unit_id}),
+        (
+            "update_unit",
+            {"form_data": {"unit_number": f"L{client}", "rent_amount": "1900"}},
+        ),
+        ("navigate", "/"),
+    ]
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def leaf_rss_kib(pid: int) -> int:
+    children: dict[int, list[int]] = defaultdict(list)
+    for entry in Path("/proc").iterdir():
+        if entry.name.isdigit():
+            try:
+                stat = (entry / "stat").read_text()
+            except OSError:
+                continue
+            children[int(stat.rsplit(")", 1)[1].split()[1])].append(int(entry.name))
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        if children[current]:
+            stack.extend(children[current])
+            continue
+        try:
+            status = Path(f"/proc/{current}/status").read_text()
+        except OSError:
+            continue
+        for line in status.splitlines():
+            if line.startswith("VmRSS:"):
+                total += int(line.split()[1])
+    return total
+
+
+class Client:
+    def __init__(self, url: str, index: int, timeout: float):
+        import socketio
+
+        self.url = url
+        self.index = index
+        self.timeout = timeout
+        self.token = str(uuid.uuid4())
+        self.path = "/"
+        self.samples: list[tuple[str, float, int]] = []
+        self._updates: asyncio.Queue[dict] = asyncio.Queue()
+        self._sio = socketio.AsyncClient(reconnection=False)
+        self._sio.on("event", self._updates.put_nowait, namespace="/_event")
+
+    async def connect(self) -> None:
+        await self._sio.connect(
+            f"{self.url}?token={self.token}",
+            namespaces=["/_event"],
+            socketio_path="/_event",
+            transports=["websocket"],
+        )
+        try:
+            await asyncio.wait_for(self._updates.get(), SESSION_PUSH_TIMEOUT)
+        except TimeoutError:
+            pass
+
+    async def close(self) -> None:
+        await self._sio.disconnect()
+
+    def _router_data(self) -> dict:
+        return {"pathname": self.path, "query": {}, "asPath": self.path}
+
+    async def send(self, name: str, payload: dict, label: str | None = None) -> None:
+        queue = [(name, payload, label)]
+        while queue:
+            name, payload, label = queue.pop(0)
+            label = label or name.rsplit(".", 1)[-1]
+            start = time.perf_counter()
+            await self._sio.emit(
+                "event",
+                {
+                    "token": self.token,
+                    "name": name,
+                    "router_data": self._router_data(),
+                    "payload": payload,
+                },
+                namespace="/_event",
+            )
+            delta_bytes, follow_up = 0, []
+            while True:
+                update = await asyncio.wait_for(self._updates.get(), self.timeout)
+                if update.get("final") is None:
+                    continue
+                delta_bytes += len(json.dumps(update.get("delta", {})))
+                follow_up.extend(update.get("events", []))
+                if update.get("final", True):
+                    break
+            self.samples.append(
+                (label, (time.perf_counter() - start) * 1000, delta_bytes)
+            )
+            queue.extend(
+                (event["name"], event.get("payload", {}), None)
+                for event in follow_up
+                if not event["name"].startswith("_")
+            )
+
+    async def navigate(self, path: str) -> None:
+        from reflex.constants import CompileVars
+
+        first = not self.samples
+        self.path = path
+        if first:
+            from reflex.state import State
+
+            name = f"{State.get_full_name()}.{CompileVars.HYDRATE}"
+        else:
+            name = CompileVars.ON_LOAD_INTERNAL
+        await self.send(name, {}, f"navigate {path}")
+
+
+async def drive(
+    client: Client, rounds: int, think_ms: int, units: int, handlers: dict
+) -> None:
+    rng = random.Random(client.index)
+    await client.navigate("/")
+    for _ in range(rounds):
+        for name, payload in scenario(client.index, rng, units):
+            if think_ms:
+                await asyncio.sleep(rng.uniform(0, think_ms) / 1000)
+            if name == "navigate":
+                await client.navigate(payload)
+            else:
+                await client.send(handlers[name], payload, name)
+
+
+async def run_stage(
+    url: str, sessions: int, args: argparse.Namespace, handlers: dict, pid: int | None
+) -> list[dict]:
+    base_rss = leaf_rss_kib(pid) if pid else None
+    clients = [Client(url, index, args.timeout) for index in range(sessions)]
+    for start in range(0, sessions, args.connect_batch):
+        await asyncio.gather(
+            *(c.connect() for c in clients[start : start + args.connect_batch])
+        )
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(drive(c, args.rounds, args.think, args.units, handlers) for c in clients)
+    )
+    elapsed = time.perf_counter() - started
+    rss = leaf_rss_kib(pid) if pid else None
+    await asyncio.gather(*(c.close() for c in clients))
+
+    by_event: dict[str, list[tuple[float, int]]] = defaultdict(list)
+    for client in clients:
+        for label, ms, delta_bytes in client.samples:
+            by_event[label].append((ms, delta_bytes))
+            by_event["all events"].append((ms, delta_bytes))
+    results = []
+    labels = sorted(by_event.keys() - {"all events"})
+    for label in ["all events", *labels]:
+        samples = by_event[label]
+        latencies = [ms for ms, _ in samples]
+        results.append(
+            {
+                "sessions": sessions,
+                "event": label,
+                "count": len(samples),
+                "p50_ms": round(percentile(latencies, 0.50), 2),
+                "p95_ms": round(percentile(latencies, 0.95), 2),
+                "p99_ms": round(percentile(latencies, 0.99), 2),
+                "mean_delta_bytes": round(statistics.fmean(b for _, b in samples)),
+            }
+        )
+    results[0].update(
+        events_per_s=round(len(by_event["all events"]) / elapsed, 1),
+        worker_rss_kib=rss,
+        rss_per_session_kib=None
+        if rss is None
+        else round((rss - base_rss) / sessions, 1),
+    )
+    return results
+
+
+def wait_for(url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(f"{url}/ping", timeout=1):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.5)
+
+
+def start_server(port: int, records: int) -> tuple[subprocess.Popen, str]:
+    workdir = Path(tempfile.mkdtemp())
+    for name in SOURCES:
+        source = ROOT / name
+        if source.is_dir():
+            shutil.copytree(
+                source, workdir / name, ignore=shutil.ignore_patterns("__pycache__")
+            )
+        elif source.exists():
+            shutil.copy(source, workdir / name)
+    database = str(workdir / "load.db")
+    subprocess.run(
+        [
+            sys.executable,
+            str(ROOT / "benchmarks" / "portfolio.py"),
+            "--records",
+            str(records),
+            "--db",
+            database,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "reflex",
+            "run",
+            "--env",
+            "prod",
+            "--backend-only",
+            "--backend-port",
+            str(port),
+        ],
+        cwd=workdir,
+        env={**os.environ, "PROPMANAGE_DB_PATH": database},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def run(args: argparse.Namespace, url: str, pid: int | None) -> list[dict]:
+    importlib.import_module("app.app")
+
+    handlers = {
+        name: f"{find_state(name).get_full_name()}.{name}"
+        for name, _ in scenario(0, random.Random(0), 1)
+        if name != "navigate"
+    }
+    results = []
+    for sessions in args.sessions:
+        results.extend(await run_stage(url, sessions, args, handlers, pid))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Drive websocket event traffic from many simulated clients."
+    )
+    parser.add_argument(
+        "--sessions",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=[10, 50, 100],
+        help="Comma-separated concurrent session counts, one stage each.",
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Scenarios per client.")
+    parser.add_argument("--think", type=int, default=200, help="Max think time, ms.")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--connect-batch", type=int, default=50)
+    parser.add_argument("--url", help="Target a running backend instead.")
+    parser.add_argument("--pid", type=int, help="Backend pid to sample RSS from.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--json", action="store_true", help="Emit JSON lines.")
+    args = parser.parse_args()
+
+    if not all(importlib.util.find_spec(name) for name in ("aiohttp", "socketio")):
+        raise RuntimeError(
+            "The load test needs a websocket client: pip install aiohttp"
+        )
+
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault(
+        "PROPMANAGE_DB_PATH", os.path.join(tempfile.mkdtemp(), "client.db")
+    )
+    from app.data.synthetic import Portfolio
+
+    args.units = Portfolio.of_size(args.records).units
+
+    server = None
+    url, pid = args.url, args.pid
+    if url is None:
+        server, url = start_server(args.port, args.records)
+        pid = server.pid
+    try:
+        wait_for(url, 120)
+        results = asyncio.run(run(args, url, pid))
+    finally:
+        if server is not None:
+            os.killpg(server.pid, signal.SIGTERM)
+            server.wait()
+    for result in results:
+        if args.json:
+            print(json.dumps(result))
+            continue
+        if "events_per_s" in result:
+            memory = (
+                ""
+                if result["worker_rss_kib"] is None
+                else f", worker RSS {result['worker_rss_kib']} KiB"
+                f" ({result['rss_per_session_kib']} KiB/session)"
+            )
+            print(
+                f"\n{result['sessions']} sessions:"
+                f" {result['events_per_s']} events/s{memory}"
+            )
+        print(
+            f"  {result['event']:<28} {result['count']:>6}"
+            f" p50 {result['p50_ms']:>8.2f} p95 {result['p95_ms']:>8.2f}"
+            f" p99 {result['p99_ms']:>8.2f} ms {result['mean_delta_bytes']:>8} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate a deterministic synthetic portfolio as JSON lines"
+        " or load it into a database."
+    )
+    parser.add_argument(
+        "--records", type=int, default=10_000, help="Approximate total row count."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Directory to write <kind>.jsonl files to.")
+    parser.add_argument("--db", help="SQLite database to replace the data of.")
+    parser.add_argument(
+        "--from", dest="source", help="Load JSON lines from this directory instead."
+    )
+    args = parser.parse_args()
+    if not args.out and not args.db:
+        parser.error("pass --out and/or --db")
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from app.data import synthetic
+    from app.data.db import connect
+
+    portfolio = synthetic.Portfolio.of_size(args.records, args.seed)
+
+    def sources():
+        if args.source:
+            return synthetic.read(args.source)
+        return synthetic.generate(portfolio)
+
+    if args.out:
+        start = time.perf_counter()
+        paths = synthetic.write(sources(), args.out)
+        print(
+            json.dumps(
+                {
+                    "written": {kind: os.path.getsize(p) for kind, p in paths.items()},
+                    "s": round(time.perf_counter() - start, 2),
+                }
+            )
+        )
+    if args.db:
+        start = time.perf_counter()
+        counts = synthetic.load(connect(args.db), sources())
+        print(
+            json.dumps({"loaded": counts, "s": round(time.perf_counter() - start, 2)})
+        )
+
+
+if __name__ == "__main__":
+    main()
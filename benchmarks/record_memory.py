@@ -0,0 +1,113 @@
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+PAGE_SIZE = 24
+TABLES = {
+    "units": "SELECT * FROM units ORDER BY id",
+    "tickets": "SELECT * FROM maintenance_requests ORDER BY id",
+}
+
+
+def representations(kind: str):
+    from app.data import records, repository
+
+    if kind == "units":
+        to_record, to_columns = repository._row_to_unit, records.unit_columns
+    else:
+        to_record, to_columns = (
+            repository._row_to_maintenance_request,
+            records.ticket_columns,
+        )
+    return {
+        "dicts": lambda rows: [
+            {**dict(row), "archived": bool(row["archived"])}
+            if kind == "units"
+            else dict(row)
+            for row in rows
+        ],
+        "interned dicts": lambda rows: [to_record(row) for row in rows],
+        "columns": lambda rows: to_columns(to_record(row) for row in rows),
+    }
+
+
+def page(value):
+    return value.rows(0, PAGE_SIZE) if hasattr(value, "rows") else value[:PAGE_SIZE]
+
+
+def measure(connection, kind: str, name: str, build) -> dict:
+    from app.data import cache
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build(connection.execute(TABLES[kind]))
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    count = len(value)
+
+    start = time.perf_counter()
+    payload = cache.encode(value)
+    cache.decode(payload)
+    roundtrip = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        page(value)
+    page_us = (time.perf_counter() - start) * 1000
+
+    return {
+        "kind": kind,
+        "representation": name,
+        "records": count,
+        "bytes_per_record": round(size / count, 1),
+        "cached_bytes_per_record": round(len(payload) / count, 1),
+        "cache_roundtrip_ms": round(roundtrip * 1000, 1),
+        "page_us": round(page_us, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the memory held per unit and ticket by plain dicts,"
+        " interned dicts and compact columns."
+    )
+    parser.add_argument("--units", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", help="Reuse an already seeded database.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON lines.")
+    args = parser.parse_args()
+
+    database = args.db or os.path.join(tempfile.mkdtemp(), "records.db")
+    os.environ["PROPMANAGE_DB_PATH"] = database
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from app.data import synthetic
+    from app.data.db import connect
+
+    connection = connect(database)
+    if not args.db:
+        portfolio = synthetic.Portfolio.of_size(args.units * 5 // 2, args.seed)
+        synthetic.load(connection, synthetic.generate(portfolio))
+
+    for kind in TABLES:
+        for name, build in representations(kind).items():
+            result = measure(connection, kind, name, build)
+            if args.json:
+                print(json.dumps(result))
+                continue
+            print(
+                f"{kind:<8} {name:<15} {result['records']:>8} records"
+                f" {result['bytes_per_record']:>8} B/record"
+                f" {result['cached_bytes_per_record']:>7} B cached"
+                f" {result['cache_roundtrip_ms']:>8} ms cache round trip"
+                f" {result['page_us']:>7} us/page"
+            )
+
+
+if __name__ == "__main__":
+    main()
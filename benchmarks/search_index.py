@@ -0,0 +1,164 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+FIRST_NAMES = ("Alice", "Bob", "Carol", "Dan", "Eve", "Frank", "Grace", "Heidi")
+LAST_NAMES = ("Smith", "Jones", "Lee", "Brown", "Garcia", "Miller", "Davis")
+DESCRIPTIONS = (
+    "Leaky faucet in kitchen",
+    "Broken window pane",
+    "HVAC not cooling",
+    "Door lock jammed",
+    "Paint peeling in bathroom",
+)
+QUERIES = {
+    "units": ("a", "gr", "grace", "alice smith", "u12", "u12345", "property 7 lee"),
+    "tenants": ("al", "alice", "example", "555", "brown 12"),
+    "maintenance": ("p", "leak", "leaky kitchen", "hvac", "door 12"),
+}
+
+
+def seed(rows: int) -> None:
+    from app.data.aggregates import AggregateEngine
+    from app.data.db import get_connection
+
+    rng = random.Random(0)
+
+    def person() -> str:
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    connection = get_connection()
+    with connection:
+        connection.executemany(
+            "INSERT INTO units (property_name, unit_number, rent_amount, tenant_name,"
+            " rent_status, lease_end, archived) VALUES (?, ?, ?, ?, ?, NULL, 0)",
+            (
+                (
+                    f"Property {i % 40}",
+                    f"U{i}",
+                    rng.randrange(900, 3500, 50),
+                    person(),
+                    rng.choice(("Paid", "Overdue", "Vacant")),
+                )
+                for i in range(rows)
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO tenants (name, email, phone, unit_id, lease_document_url)"
+            " SELECT ?, ?, ?, id, '#' FROM units"
+            " WHERE property_name = ? AND unit_number = ?",
+            (
+                (
+                    person(),
+                    f"tenant{i}@example.com",
+                    f"555-{i:04d}",
+                    f"Property {i % 40}",
+                    f"U{i}",
+                )
+                for i in range(rows)
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO maintenance_requests (property_name, unit, description,"
+            " priority, status, vendor) VALUES (?, ?, ?, 'Low', ?, NULL)",
+            (
+                (
+                    f"Property {i % 40}",
+                    f"#{i}",
+                    rng.choice(DESCRIPTIONS),
+                    rng.choice(("Open", "In Progress", "Completed")),
+                )
+                for i in range(rows)
+            ),
+        )
+    AggregateEngine(connection).rebuild()
+
+
+def timed(fn, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run(repeat: int) -> list[dict]:
+    from app.data import repository, search
+    from app.data.db import get_connection
+
+    connection = get_connection()
+    searches = {
+        "units": repository.search_units,
+        "tenants": repository.search_tenants,
+        "maintenance": repository.search_maintenance_requests,
+    }
+    results = []
+    for kind, queries in QUERIES.items():
+        start = time.perf_counter()
+        search.search(connection, kind, "", 1)
+        results.append(
+            {
+                "case": f"{kind}: build index",
+                "p50_ms": round((time.perf_counter() - start) * 1000, 2),
+                "p95_ms": None,
+                "hits": None,
+            }
+        )
+        for query in queries:
+            samples = timed(
+                lambda kind=kind, query=query: searches[kind](query), repeat
+            )
+            results.append(
+                {
+                    "case": f"{kind}: {query!r}",
+                    "p50_ms": round(statistics.median(samples), 2),
+                    "p95_ms": round(statistics.quantiles(samples, n=20)[-1], 2),
+                    "hits": len(searches[kind](query)),
+                }
+            )
+
+    units = repository.units()
+    unit_ids = iter(range(1, repeat + 1))
+    samples = timed(
+        lambda: units.update(next(unit_ids), {"tenant_name": "Zed Quux"}), repeat
+    )
+    results.append(
+        {
+            "case": "units: update_unit + index patch",
+            "p50_ms": round(statistics.median(samples), 2),
+            "p95_ms": round(statistics.quantiles(samples, n=20)[-1], 2),
+            "hits": len(repository.search_units("quux", limit=repeat)),
+        }
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure search index build time and query latency."
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="Emit JSON lines.")
+    args = parser.parse_args()
+
+    os.environ["PROPMANAGE_DB_PATH"] = os.path.join(tempfile.mkdtemp(), "bench.db")
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    seed(args.rows)
+    for result in run(args.repeat):
+        if args.json:
+            print(json.dumps(result))
+        else:
+            p95 = "" if result["p95_ms"] is None else f"{result['p95_ms']:>9.2f}"
+            hits = "" if result["hits"] is None else f"{result['hits']:>6}"
+            print(f"{result['case']:<40} {result['p50_ms']:>9.2f} {p95:>9} {hits:>6}")
+
+
+if __name__ == "__main__":
+    main()
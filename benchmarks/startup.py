@@ -0,0 +1,245 @@
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from state_deltas import process, seed
+
+HANDLER_PAYLOADS = {
+    "set_active_section": {"section": "units"},
+    "set_unit_filter": {"status": "Paid"},
+    "search_units": {"query": "property 12"},
+    "toggle_unit_archive": {"unit_id": 1},
+    "toggle_unit_selection": {"unit_id": 1},
+    "archive_selected_units": {"archived": False},
+    "set_maintenance_filter": {"status": "Open"},
+    "search_maintenance": {"query": "leaky kitchen"},
+    "toggle_maintenance_sort": {"key": "priority"},
+    "update_maintenance_status": {"request_id": 1, "status": "In Progress"},
+    "update_maintenance_vendor": {"request_id": 1, "vendor": "QuickFix Plumbing"},
+    "toggle_maintenance_selection": {"request_id": 1},
+    "update_selected_maintenance_status": {"status": "Open"},
+    "assign_selected_maintenance_vendor": {"vendor": "QuickFix Plumbing"},
+    "search_tenants": {"query": "grace smith"},
+    "open_edit_unit_form": {"unit_id": 1},
+    "set_edit_unit_property": {"value": "Property 1"},
+    "set_edit_unit_rent_status": {"value": "Paid"},
+    "update_unit": {"form_data": {"unit_number": "101", "rent_amount": "1900"}},
+    "add_unit": {
+        "form_data": {
+            "property_name": "Property 1",
+            "unit_number": "Z-1",
+            "rent_amount": "1800",
+            "rent_status": "Vacant",
+        }
+    },
+    "add_maintenance_request": {
+        "form_data": {
+            "property_name": "Property 1",
+            "unit": "#101",
+            "description": "Leaking radiator",
+            "priority": "High",
+        }
+    },
+}
+
+
+def app_handlers():
+    from app.states.state import PropertyManagementState
+
+    stack = [PropertyManagementState]
+    while stack:
+        state_cls = stack.pop()
+        for name, handler in sorted(state_cls.event_handlers.items()):
+            if name not in state_cls.__dict__ or handler.is_background:
+                continue
+            params = list(inspect.signature(handler.fn).parameters)[1:]
+            yield state_cls, name, params
+        stack.extend(state_cls.class_subclasses)
+
+
+def state_tree_size(state_cls) -> tuple[int, int]:
+    classes, fields = 1, len(state_cls.base_vars) + len(state_cls.computed_vars)
+    for substate in state_cls.class_subclasses:
+        sub_classes, sub_fields = state_tree_size(substate)
+        classes += sub_classes
+        fields += sub_fields
+    return classes, fields
+
+
+async def measure_runtime(repeat: int) -> list[dict]:
+    from reflex.state import State
+    from reflex.utils.format import json_dumps
+
+    import app.app
+
+    def hydrate_bytes(root) -> int:
+        return len(json_dumps(root.dict()))
+
+    results = [
+        {
+            "group": "hydrate",
+            "name": "fresh session",
+            "ms": None,
+            "bytes": hydrate_bytes(State(_reflex_internal_init=True)),
+        }
+    ]
+    for route, events in app.app.app._load_events.items():
+        root = State(_reflex_internal_init=True)
+        start = time.perf_counter()
+        for event in events:
+            handler = getattr(event, "handler", event)
+            if handler.is_background:
+                continue
+            payload = {
+                str(arg): value._var_value for arg, value in getattr(event, "args", ())
+            }
+            await process(
+                root, f"{handler.state_full_name}.{handler.fn.__name__}", payload
+            )
+        results.append(
+            {
+                "group": "hydrate",
+                "name": f"/{route.removeprefix('index')}",
+                "ms": round((time.perf_counter() - start) * 1000, 2),
+                "bytes": hydrate_bytes(root),
+            }
+        )
+
+    root = State(_reflex_internal_init=True)
+    for state_cls, name, params in app_handlers():
+        payload = HANDLER_PAYLOADS.get(name, {})
+        if not set(params) <= payload.keys():
+            continue
+        full_name = f"{state_cls.get_full_name()}.{name}"
+        samples, delta_bytes = [], 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            delta_bytes = await process(root, full_name, payload)
+            samples.append((time.perf_counter() - start) * 1000)
+        results.append(
+            {
+                "group": "handler",
+                "name": f"{state_cls.__name__}.{name}",
+                "ms": round(statistics.median(samples), 3),
+                "bytes": delta_bytes,
+            }
+        )
+    return results
+
+
+def measure_once(repeat: int) -> list[dict]:
+    start = time.perf_counter()
+    importlib.import_module("reflex")
+
+    reflex_loaded = time.perf_counter()
+    import app.states.live
+
+    states_loaded = time.perf_counter()
+    import app.app
+
+    app_loaded = time.perf_counter()
+    from app.states.state import PropertyManagementState
+
+    classes, fields = state_tree_size(PropertyManagementState)
+    results = [
+        {"group": "import", "name": "reflex", "ms": reflex_loaded - start},
+        {"group": "import", "name": "app.states", "ms": states_loaded - reflex_loaded},
+        {"group": "import", "name": "app.app", "ms": app_loaded - states_loaded},
+    ]
+    for page in app.app.app._unevaluated_pages.values():
+        start = time.perf_counter()
+        page.component()
+        results.append(
+            {
+                "group": "build",
+                "name": f"{page.component.__name__}()",
+                "ms": time.perf_counter() - start,
+            }
+        )
+    for result in results:
+        result["ms"] = round(result["ms"] * 1000, 2)
+        result["bytes"] = None
+    results.append(
+        {
+            "group": "state",
+            "name": f"{classes} classes, {fields} vars",
+            "ms": None,
+            "bytes": None,
+        }
+    )
+    return results + asyncio.run(measure_runtime(repeat))
+
+
+def run(runs: int, repeat: int, database: str) -> list[dict]:
+    samples: dict[tuple[str, str], list[dict]] = {}
+    for _ in range(runs):
+        output = subprocess.run(
+            [
+                sys.executable,
+                os.path.abspath(__file__),
+                "--once",
+                "--repeat",
+                str(repeat),
+            ],
+            env={**os.environ, "PROPMANAGE_DB_PATH": database},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for line in output.splitlines():
+            if line.startswith("{"):
+                result = json.loads(line)
+                samples.setdefault((result["group"], result["name"]), []).append(result)
+    return [
+        {
+            **results[-1],
+            "ms": None
+            if results[-1]["ms"] is None
+            else round(statistics.median(r["ms"] for r in results), 3),
+        }
+        for results in samples.values()
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure cold start, page build, hydrate payload and handler"
+        " latency for the app."
+    )
+    parser.add_argument("--units", type=int, default=10_000)
+    parser.add_argument("--tickets", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=3, help="Cold-start processes.")
+    parser.add_argument("--repeat", type=int, default=5, help="Calls per handler.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON lines.")
+    parser.add_argument("--once", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, root)
+    if args.once:
+        for result in measure_once(args.repeat):
+            print(json.dumps(result))
+        return
+    database = os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ["PROPMANAGE_DB_PATH"] = database
+    seed(args.units, args.tickets)
+    for result in run(args.runs, args.repeat, database):
+        if args.json:
+            print(json.dumps({**result, "units": args.units, "tickets": args.tickets}))
+        else:
+            ms = "" if result["ms"] is None else f"{result['ms']:.2f} ms"
+            size = "" if result["bytes"] is None else f"{result['bytes']} B"
+            name = f"{result['group']}: {result['name']}"
+            print(f"{name:<58} {ms:>12} {size:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+EVENTS = [
+    ("set_active_section", {"section": "units"}),
+    ("set_unit_filter", {"status": "Paid"}),
+    ("next_unit_page", {}),
+    ("set_active_section", {"section": "maintenance"}),
+    ("set_new_request_description", {"value": "Leaking radiator"}),
+    (
+        "add_maintenance_request",
+        {
+            "form_data": {
+                "property_name": "Property 1",
+                "unit": "#101",
+                "description": "Leaking radiator",
+                "priority": "High",
+            }
+        },
+    ),
+    ("update_maintenance_status", {"request_id": 1, "status": "Completed"}),
+    ("update_maintenance_vendor", {"request_id": 2, "vendor": "QuickFix Plumbing"}),
+    ("set_active_section", {"section": "units"}),
+    ("open_add_unit_form", {}),
+    ("set_new_unit_number", {"value": "Z-1"}),
+    (
+        "add_unit",
+        {
+            "form_data": {
+                "property_name": "Property 1",
+                "unit_number": "Z-1",
+                "rent_amount": "1800",
+                "rent_status": "Paid",
+            }
+        },
+    ),
+    ("open_edit_unit_form", {"unit_id": 1}),
+    ("update_unit", {"form_data": {"unit_number": "A-1", "rent_amount": "1900"}}),
+    ("toggle_unit_archive", {"unit_id": 2}),
+    ("set_active_section", {"section": "dashboard"}),
+]
+
+
+def seed(units: int, tickets: int) -> None:
+    from app.data import synthetic
+    from app.data.db import get_connection
+
+    portfolio = synthetic.Portfolio(
+        properties=max(1, units // synthetic.UNITS_PER_PROPERTY),
+        units=units,
+        tickets=tickets,
+    )
+    synthetic.load(get_connection(), synthetic.generate(portfolio))
+
+
+def find_state(name: str):
+    import reflex as rx
+
+    stack = list(rx.State.class_subclasses)
+    while stack:
+        state_cls = stack.pop()
+        if state_cls.__module__.startswith("app.") and name in state_cls.event_handlers:
+            return state_cls
+        stack.extend(state_cls.class_subclasses)
+    raise LookupError(f"No app state defines {name}.")
+
+
+async def process(root, name: str, payload: dict) -> int:
+    from reflex.event import Event
+    from reflex.utils.format import json_dumps
+
+    event = Event(token="bench", name=name, payload=payload)
+    size = 0
+    async for update in root._process(event):
+        size += len(json_dumps(update.delta))
+    return size
+
+
+def session_bytes(state) -> int:
+    return len(state._serialize()) + sum(
+        session_bytes(substate) for substate in state.substates.values()
+    )
+
+
+async def run() -> list[dict]:
+    from reflex.state import State
+
+    import app.app
+
+    try:
+        from app.components.sidebar import NAV_ITEMS
+    except ImportError:
+        NAV_ITEMS = []
+    routes = {
+        item["section"]: item["route"].strip("/") or "index"
+        for item in NAV_ITEMS
+        if "route" in item
+    }
+
+    def load_steps(route: str) -> list[tuple[str, dict]]:
+        steps = []
+        for event in app.app.app._load_events[route]:
+            handler = getattr(event, "handler", event)
+            if handler.is_background:
+                continue
+            payload = {
+                str(arg): value._var_value for arg, value in getattr(event, "args", ())
+            }
+            steps.append((f"{handler.state_full_name}.{handler.fn.__name__}", payload))
+        return steps
+
+    root = State(_reflex_internal_init=True)
+    script = [("on_load", load_steps("index"))]
+    for name, payload in EVENTS:
+        if name == "set_active_section" and payload["section"] in routes:
+            script.append((name, load_steps(routes[payload["section"]])))
+        else:
+            script.append(
+                (name, [(f"{find_state(name).get_full_name()}.{name}", payload)])
+            )
+
+    results = []
+    for label, steps in script:
+        start = time.perf_counter()
+        delta_bytes = 0
+        for name, payload in steps:
+            delta_bytes += await process(root, name, payload)
+        results.append(
+            {
+                "event": label,
+                "delta_bytes": delta_bytes,
+                "ms": round((time.perf_counter() - start) * 1000, 2),
+            }
+        )
+    results.append(
+        {"event": "session_state", "delta_bytes": session_bytes(root), "ms": 0}
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure the state delta sent to the browser for each UI event."
+    )
+    parser.add_argument("--units", type=int, default=10_000)
+    parser.add_argument("--tickets", type=int, default=10_000)
+    parser.add_argument("--json", action="store_true", help="Emit JSON lines.")
+    args = parser.parse_args()
+
+    os.environ["PROPMANAGE_DB_PATH"] = os.path.join(tempfile.mkdtemp(), "bench.db")
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    seed(args.units, args.tickets)
+    results = asyncio.run(run())
+    for result in results:
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(
+                f"{result['event']:<28} {result['delta_bytes']:>10} B"
+                f" {result['ms']:>9.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import pytest
+
+from app.data import cache, db, records
+from app.data.aggregates import AggregateEngine
+
+UNITS = [
+    {
+        "id": 1,
+        "property_name": "Sunset Apartments",
+        "unit_number": "A101",
+        "rent_amount": 1650,
+        "tenant_name": "Alice Johnson",
+        "rent_status": "Paid",
+        "lease_end": "2024-12-31",
+        "archived": False,
+    },
+    {
+        "id": 2,
+        "property_name": "Sunset Apartments",
+        "unit_number": "A102",
+        "rent_amount": 1500,
+        "tenant_name": None,
+        "rent_status": "Vacant",
+        "lease_end": None,
+        "archived": True,
+    },
+]
+
+
+class Loader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+@pytest.fixture
+def connection(tmp_path):
+    connection = db.connect(str(tmp_path / "cache.db"))
+    yield connection
+    connection.close()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        7,
+        [{"property_name": "Sunset Apartments", "collected": 1650, "overdue": 0}],
+        records.unit_columns(UNITS),
+    ],
+)
+def test_views_round_trip_through_the_shared_store(value):
+    store = cache.LocalStore()
+    first = cache.ViewCache(store).get("key", Loader(value))
+    loader = Loader(None)
+    second = cache.ViewCache(store).get("key", loader)
+    assert loader.calls == 0
+    if isinstance(value, records.RecordColumns):
+        assert second.rows() == first.rows() == UNITS
+        assert second.rows(1) == UNITS[1:]
+    else:
+        assert second == first
+
+
+def test_store_payloads_are_json():
+    store = cache.LocalStore()
+    cache.ViewCache(store).get("key", Loader(records.unit_columns(UNITS)))
+    payload = store.get("key")
+    assert payload.startswith(b"{")
+    with pytest.raises(TypeError):
+        cache.encode(object())
+
+
+def test_local_store_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    store = cache.LocalStore()
+    store.set("short", b"1", ex=10)
+    store.set("forever", b"2")
+    now[0] += 9
+    assert store.get("short") == b"1"
+    now[0] += 1
+    assert store.get("short") is None
+    assert store.get("forever") == b"2"
+    assert store.delete("short", "forever") == 1
+
+
+def test_expired_store_entries_are_reloaded(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    store = cache.LocalStore()
+    cache.ViewCache(store).get("key", Loader(1))
+    now[0] += cache.CACHE_TTL_SECONDS
+    loader = Loader(2)
+    assert cache.ViewCache(store).get("key", loader) == 2
+    assert loader.calls == 1
+
+
+def test_views_are_keyed_by_revision(monkeypatch, connection):
+    store = cache.LocalStore()
+    monkeypatch.setattr(cache, "_views", cache.ViewCache(store))
+    loader = Loader(["before"])
+    assert cache.view(connection, "units", ("find",), loader) == ["before"]
+    assert cache.view(connection, "units", ("find",), loader) == ["before"]
+    assert cache.view(connection, "tenants", ("find",), Loader([])) == []
+    assert loader.calls == 1
+    with connection:
+        AggregateEngine(connection).bump_revision("unit_revision")
+    loader.value = ["after"]
+    assert cache.view(connection, "units", ("find",), loader) == ["after"]
+    assert loader.calls == 2
+    monkeypatch.setattr(cache, "_views", cache.ViewCache(store))
+    assert cache.view(connection, "units", ("find",), Loader(None)) == ["after"]
+
+
+def test_unavailable_redis_falls_back_to_loading():
+    redis = pytest.importorskip("redis")
+    store = redis.Redis.from_url("redis://127.0.0.1:1/0", socket_connect_timeout=0.1)
+    views = cache.ViewCache(store)
+    loader = Loader(["fresh"])
+    assert views.get("key", loader) == ["fresh"]
+    assert views.get("key", loader) == ["fresh"]
+    assert loader.calls == 1
+    assert views.store_errors == 2
@@ -0,0 +1,82 @@
+import io
+import json
+
+import pytest
+
+from app.data import db, importer, lease_expiry, ledger, rent_roll, search, validation
+
+HEADER = "property_name,unit_number,rent_amount,tenant_name,rent_status,lease_end\n"
+
+
+@pytest.fixture
+def connection(tmp_path, monkeypatch):
+    for module in (ledger, rent_roll, lease_expiry):
+        monkeypatch.setattr(module, "_cache", None)
+    monkeypatch.setattr(search, "_indexes", {})
+    connection = db.connect(str(tmp_path / "import.db"))
+    monkeypatch.setattr(db._local, "connection", connection, raising=False)
+    yield connection
+    connection.close()
+
+
+def imported(connection, unit_number):
+    return connection.execute(
+        "SELECT rent_amount FROM units WHERE unit_number = ?", (unit_number,)
+    ).fetchone()
+
+
+def run(text, filename):
+    return importer.import_units(io.BytesIO(text.encode()), filename)
+
+
+def test_csv_import_reports_bad_rows_by_line(connection):
+    report = run(
+        HEADER
+        + "Sunset Apartments,Z1,1900,Ann,Paid,2026-06-30\n"
+        + "Sunset Apartments,Z2,0,,Vacant,\n"
+        + "Sunset Apartments,Z3,1900.50,Bo,Paid,\n"
+        + "Sunset Apartments,Z4,1900.00,Cy,Overdue,\n"
+        + "Sunset Apartments,Z5,,Di,Paid,\n"
+        + "Nowhere,Z6,1000,Ed,Paid,\n",
+        "units.csv",
+    )
+    assert report["imported"] == 3
+    assert [error["line"] for error in report["errors"]] == [4, 6, 7]
+    assert "whole number" in report["errors"][0]["message"]
+    assert "required" in report["errors"][1]["message"]
+    assert "Unknown property" in report["errors"][2]["message"]
+    assert imported(connection, "Z2")["rent_amount"] == 0
+    assert imported(connection, "Z4")["rent_amount"] == 1900
+    assert imported(connection, "Z3") is None
+
+
+def test_json_lines_import_keeps_zero_rent_and_rejects_fractions(connection):
+    base = {"property_name": "Sunset Apartments", "rent_status": "Vacant"}
+    lines = [
+        {**base, "unit_number": "J1", "rent_amount": 0},
+        {**base, "unit_number": "J2", "rent_amount": 1900.5},
+        {**base, "unit_number": "J3", "rent_amount": 1900.0},
+        {**base, "unit_number": "J4", "rent_amount": "1750"},
+        {**base, "unit_number": "J5", "rent_amount": None},
+        {**base, "unit_number": "J6", "rent_amount": True},
+    ]
+    report = run("\n".join(json.dumps(line) for line in lines), "units.jsonl")
+    assert report["imported"] == 3
+    assert [error["line"] for error in report["errors"]] == [2, 5, 6]
+    assert imported(connection, "J1")["rent_amount"] == 0
+    assert imported(connection, "J3")["rent_amount"] == 1900
+    assert imported(connection, "J4")["rent_amount"] == 1750
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        ("abc", "valid number"),
+        ("NaN", "valid number"),
+        ("-5", "negative"),
+        ("12.25", "whole number"),
+    ],
+)
+def test_rent_must_be_a_whole_non_negative_number(value, message):
+    with pytest.raises(ValueError, match=message):
+        validation.parse_rent(value)
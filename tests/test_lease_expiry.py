@@ -0,0 +1,92 @@
+import datetime
+import random
+
+import pytest
+
+from app.data import db, lease_expiry, ledger, rent_roll, repository, search, synthetic
+from app.data.validation import parse_lease_end
+
+TODAY = datetime.date(2026, 10, 18)
+
+
+@pytest.fixture
+def connection(tmp_path, monkeypatch):
+    for module in (ledger, rent_roll, lease_expiry):
+        monkeypatch.setattr(module, "_cache", None)
+    monkeypatch.setattr(search, "_indexes", {})
+    connection = db.connect(str(tmp_path / "leases.db"))
+    synthetic.load(connection, synthetic.generate(synthetic.Portfolio.of_size(2000)))
+    yield connection
+    connection.close()
+
+
+def rows(connection, query):
+    return [dict(row) for row in connection.execute(query)]
+
+
+def edit_units(connection, rng):
+    units = repository.UnitRepository(connection)
+    ids = [row["id"] for row in rows(connection, "SELECT id FROM units")]
+    for number in range(20):
+        units.add(
+            {
+                "property_name": synthetic.property_name(rng.randrange(1, 4)),
+                "unit_number": f"Q{number}7",
+                "rent_amount": 1200,
+                "tenant_name": f"Quincy Marsh {number}",
+                "rent_status": "Paid",
+                "lease_end": (TODAY + datetime.timedelta(days=3 * number)).isoformat(),
+                "archived": False,
+            }
+        )
+    for unit_id in rng.sample(ids, 40):
+        units.update(
+            unit_id,
+            {
+                "tenant_name": rng.choice([None, "Quincy Adams", "Mara Quill"]),
+                "lease_end": rng.choice(
+                    [
+                        None,
+                        (
+                            TODAY + datetime.timedelta(days=rng.randrange(120))
+                        ).isoformat(),
+                    ]
+                ),
+            },
+        )
+    units.update_many(rng.sample(ids, 60), {"archived": True})
+    units.update_many(rng.sample(ids, 20), {"archived": False})
+
+
+def test_lease_windows_match_a_plain_count_after_writes(connection):
+    rng = random.Random(8)
+    lease_expiry.counts(connection, TODAY)
+    index = lease_expiry._cache
+    edit_units(connection, rng)
+
+    ends = [
+        (unit["property_name"], parse_lease_end(unit["lease_end"]))
+        for unit in rows(
+            connection, "SELECT property_name, lease_end FROM units WHERE NOT archived"
+        )
+    ]
+
+    def plain_counts(property_name=None):
+        return [
+            sum(
+                1
+                for name, end in ends
+                if end is not None
+                and property_name in (None, name)
+                and TODAY <= end <= TODAY + datetime.timedelta(days=days)
+            )
+            for days in lease_expiry.EXPIRY_WINDOWS
+        ]
+
+    assert lease_expiry.counts(connection, TODAY) == plain_counts()
+    names = sorted({name for name, _ in ends})
+    expected = [(name, plain_counts(name)) for name in names]
+    assert lease_expiry.pipeline(connection, TODAY) == [
+        (name, counts) for name, counts in expected if any(counts)
+    ]
+    assert lease_expiry._cache is index
@@ -0,0 +1,186 @@
+import datetime
+import random
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from app.data import db, lease_expiry, ledger, rent_roll, repository, synthetic
+
+AS_OF = datetime.date(2026, 10, 18)
+PERIODS = ("2026-05", "2026-06", "2026-07", "2026-08", "2026-09", "2026-10")
+
+
+def fifo_aging(entries, as_of):
+    charges = defaultdict(list)
+    paid = defaultdict(int)
+    for unit_id, period, kind, amount in entries:
+        if kind == ledger.CHARGE:
+            charges[unit_id].append((period, amount))
+        else:
+            paid[unit_id] += amount
+    amounts = [0] * len(ledger.AGING_BUCKETS)
+    units = [set() for _ in ledger.AGING_BUCKETS]
+    for unit_id, owed in charges.items():
+        credit = paid[unit_id]
+        for period, amount in sorted(owed):
+            settled = min(credit, amount)
+            credit -= settled
+            days = (as_of - ledger.due_date(period)).days
+            if amount > settled and days > ledger.GRACE_DAYS:
+                bucket = sum(days > limit for limit in ledger.AGING_LIMITS)
+                amounts[bucket] += amount - settled
+                units[bucket].add(unit_id)
+    late = set().union(*units)
+    return amounts, [len(ids) for ids in units], late
+
+
+def as_buckets(amounts, units):
+    return [
+        {"label": label, "amount": amount, "units": count}
+        for label, amount, count in zip(ledger.AGING_BUCKETS, amounts, units)
+    ]
+
+
+@pytest.fixture
+def connection(tmp_path, monkeypatch):
+    for module in (ledger, rent_roll, lease_expiry):
+        monkeypatch.setattr(module, "_cache", None)
+    connection = db.connect(str(tmp_path / "ledger.db"))
+    synthetic.load(connection, synthetic.generate(synthetic.Portfolio.of_size(3000)))
+    yield connection
+    connection.close()
+
+
+def entries(connection):
+    return connection.execute(
+        "SELECT unit_id, period, kind, amount FROM ledger_entries"
+    ).fetchall()
+
+
+def statuses(connection):
+    return dict(
+        connection.execute(
+            "SELECT id, rent_status FROM units WHERE NOT archived"
+            " AND rent_status != 'Vacant'"
+        ).fetchall()
+    )
+
+
+def test_aging_matches_fifo_settlement():
+    rng = random.Random(7)
+    book = ledger.RentLedger()
+    rows = []
+    for period in PERIODS:
+        unit_ids = np.array(rng.sample(range(1, 400), 300), dtype=np.int64)
+        rents = np.array([rng.randrange(500, 3000) for _ in unit_ids], dtype=np.int64)
+        book.charge_many(unit_ids, period, rents)
+        rows += [(u, period, ledger.CHARGE, r) for u, r in zip(unit_ids, rents)]
+        payers = np.array(rng.sample(range(1, 400), 200), dtype=np.int64)
+        payments = np.array([rng.randrange(1, 4000) for _ in payers], dtype=np.int64)
+        book.pay_many(payers, payments)
+        rows += [(u, period, ledger.PAYMENT, p) for u, p in zip(payers, payments)]
+    for as_of in (AS_OF, datetime.date(2026, 10, 6), datetime.date(2026, 10, 5)):
+        amounts, _, late = fifo_aging(rows, as_of)
+        unit_ids = book.unit_ids[: len(book._slots)]
+        assert book.aging(as_of).sum(axis=0).tolist() == amounts
+        assert set(unit_ids[book.overdue(as_of)].tolist()) == late
+
+
+def test_charges_inside_the_grace_period_are_not_aged():
+    book = ledger.RentLedger()
+    book.charge_many(np.array([1]), "2026-10", np.array([1000]))
+    due = ledger.due_date("2026-10")
+    inside = due + datetime.timedelta(days=ledger.GRACE_DAYS)
+    assert book.aging(inside).sum() == 0
+    assert not book.overdue(inside).any()
+    after = inside + datetime.timedelta(days=1)
+    assert book.aging(after)[0].tolist() == [1000, 0, 0, 0]
+    assert book.overdue(after).all()
+
+
+def test_billing_runs_keep_aging_and_statuses_in_sync(connection):
+    rng = random.Random(3)
+    ledgers = repository.LedgerRepository(connection)
+    for period in PERIODS:
+        as_of = ledger.due_date(period) + datetime.timedelta(days=9)
+        report = ledgers.run_billing(period, as_of)
+        assert report["charged"] > 0
+        billed = [row[0] for row in entries(connection) if row[1] == period]
+        for unit_id in rng.sample(billed, len(billed) // 3):
+            ledgers.record_payment(unit_id, rng.choice([400, 1500, 6000]), as_of)
+    assert ledgers.run_billing(PERIODS[-1], AS_OF)["charged"] == 0
+
+    amounts, units, late = fifo_aging(entries(connection), AS_OF)
+    assert ledgers.aging(AS_OF) == as_buckets(amounts, units)
+    ledger._cache = None
+    assert ledgers.aging(AS_OF) == as_buckets(amounts, units)
+
+    statuses = dict(
+        connection.execute(
+            "SELECT id, rent_status FROM units WHERE NOT archived"
+            " AND rent_status != 'Vacant'"
+            " AND id IN (SELECT unit_id FROM ledger_entries)"
+        ).fetchall()
+    )
+    assert {u for u, status in statuses.items() if status == "Overdue"} == late & set(
+        statuses
+    )
+
+    unit_id = min(late & set(statuses))
+    owed = ledgers.balance(unit_id)
+    assert ledgers.settle(unit_id, AS_OF) == owed
+    assert ledgers.balance(unit_id) == 0
+    assert repository.UnitRepository(connection).get(unit_id)["rent_status"] == "Paid"
+
+
+def test_cancelled_billing_resumes_without_double_charging(connection, monkeypatch):
+    monkeypatch.setattr(repository, "BILLING_BATCH_SIZE", 100)
+    ledgers = repository.LedgerRepository(connection)
+    calls = []
+
+    class Stop(Exception):
+        pass
+
+    def stop_after_two_batches(done, total):
+        calls.append((done, total))
+        if len(calls) == 2:
+            raise Stop
+
+    with pytest.raises(Stop):
+        ledgers.run_billing("2026-10", AS_OF, stop_after_two_batches)
+    assert calls == [(100, calls[0][1]), (200, calls[0][1])]
+    billed = [row[0] for row in entries(connection) if row[1] == "2026-10"]
+    assert len(billed) == 200
+
+    progress = []
+    report = ledgers.run_billing(
+        "2026-10", AS_OF, lambda done, total: progress.append((done, total))
+    )
+    assert progress[-1][0] == progress[-1][1] == calls[0][1]
+    assert report["charged"] == calls[0][1] - 200
+    charged = [row[0] for row in entries(connection) if row[1] == "2026-10"]
+    assert len(charged) == len(set(charged)) == calls[0][1]
+
+
+def test_first_billing_keeps_existing_arrears(connection):
+    ledgers = repository.LedgerRepository(connection)
+    before = statuses(connection)
+    arrears = {unit_id for unit_id, status in before.items() if status == "Overdue"}
+    assert arrears
+    period = PERIODS[-1]
+    report = ledgers.run_billing(period, ledger.due_date(period))
+    assert report["paid"] == report["overdue"] == 0
+    assert statuses(connection) == before
+    opening = ledger.previous_period(period)
+    assert {row[0] for row in entries(connection) if row[1] == opening} == arrears
+    ledgers.run_billing(period, ledger.due_date(period))
+    assert len([row for row in entries(connection) if row[1] == opening]) == len(
+        arrears
+    )
+
+    unit_id = min(arrears)
+    rent = repository.UnitRepository(connection).get(unit_id)["rent_amount"]
+    assert ledgers.settle(unit_id, ledger.due_date(period)) == 2 * rent
+    assert repository.UnitRepository(connection).get(unit_id)["rent_status"] == "Paid"
+    assert ledgers.settle(unit_id, ledger.due_date(period)) == 0
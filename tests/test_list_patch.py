@@ -0,0 +1,141 @@
+import json
+
+import pytest
+from reflex.state import State
+from reflex.utils import format
+
+from app.data import list_patch
+from app.states.units import UnitsState
+
+ROWS = [
+    {
+        "id": record_id,
+        "property_name": "Sunset Apartments",
+        "unit_number": f"A{100 + record_id}",
+        "rent_amount": 1500 + record_id,
+        "tenant_name": f"Tenant {record_id}",
+        "rent_status": "Paid",
+        "lease_end": "2026-06-30",
+        "archived": False,
+    }
+    for record_id in range(1, 97)
+]
+PAGE = ROWS[:24]
+
+
+def edited(records, position, **changes):
+    records = list(records)
+    records[position] = {**records[position], **changes}
+    return records
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        PAGE,
+        edited(PAGE, 3, rent_status="Overdue"),
+        edited(edited(PAGE, 0, tenant_name=None), 23, rent_amount=1),
+        PAGE[:5] + PAGE[6:],
+        PAGE[1:],
+        PAGE[:10],
+        PAGE + [{**PAGE[0], "id": 99, "unit_number": "Z1"}],
+        [{**PAGE[0], "id": 99}, *PAGE],
+        ROWS[12:36],
+        edited(PAGE[:10] + PAGE[11:], 4, archived=True)
+        + [{**PAGE[0], "id": 99, "unit_number": "Z1"}],
+    ],
+    ids=[
+        "unchanged",
+        "update",
+        "updates",
+        "remove",
+        "remove first",
+        "shrink",
+        "append",
+        "prepend",
+        "slide",
+        "mixed",
+    ],
+)
+def test_diff_round_trips(records):
+    patch = list_patch.diff(PAGE, records)
+    assert patch is not None
+    assert list_patch.apply(PAGE, patch) == records
+    assert list_patch.apply(PAGE, json.loads(json.dumps(patch))) == records
+
+
+def test_unchanged_records_produce_an_empty_patch():
+    assert list_patch.diff(PAGE, list(PAGE)) == list_patch.empty()
+
+
+def test_later_patches_stay_relative_to_the_base():
+    first = edited(PAGE, 2, rent_status="Overdue")
+    second = edited(first, 7, rent_status="Vacant")
+    patch = list_patch.diff(PAGE, second)
+    assert list_patch.size(patch) == 2
+    assert list_patch.apply(PAGE, patch) == second
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        PAGE[::-1],
+        [PAGE[1], PAGE[0], *PAGE[2:]],
+    ],
+    ids=["reversed", "swapped"],
+)
+def test_reordered_records_fall_back_to_the_whole_list(records):
+    assert list_patch.diff(PAGE, records) is None
+
+
+def test_large_changes_fall_back_to_the_whole_list():
+    records = [{**record, "rent_status": "Overdue"} for record in PAGE]
+    assert list_patch.diff(PAGE, records) is None
+    assert list_patch.diff(PAGE, ROWS[24:48]) is None
+
+
+def test_single_record_edit_is_bounded():
+    records = edited(PAGE, 11, rent_status="Overdue")
+    patch = list_patch.diff(PAGE, records)
+    assert list_patch.size(patch) == 1
+    assert patch["removed"] == [] and patch["appended"] == []
+    payload = len(json.dumps(patch))
+    record = len(json.dumps(records[11]))
+    assert payload <= record + 128
+    assert payload * 10 < len(json.dumps(records))
+
+
+def test_shown_lists_send_only_what_the_client_lacks():
+    root = State(_reflex_internal_init=True)
+    state = root.get_substate(UnitsState.get_full_name().split(".")[1:])
+    client = {"rows": [], "seq": 0}
+
+    def show(records):
+        state._show_records("filtered_units", records)
+        delta = root.get_delta()[state.get_full_name()]
+        root._clean()
+        patch = json.loads(format.json_dumps(delta["filtered_units_patch_rx_state_"]))
+        if "filtered_units_rx_state_" in delta:
+            client["rows"] = delta["filtered_units_rx_state_"]
+        else:
+            assert patch["seq"] == client["seq"] + 1
+            client["rows"] = list_patch.apply(client["rows"], patch)
+        client["seq"] = patch["seq"]
+        assert client["rows"] == records
+        return patch, len(format.json_dumps(delta))
+
+    record = max(len(format.json_dumps(row)) for row in ROWS)
+    _, payload = show(PAGE)
+    assert payload > 24 * record
+    shown = list(PAGE)
+    for page in range(1, 4):
+        shown = edited(shown, 2 * page, rent_status="Overdue")
+        patch, payload = show(shown)
+        assert list(patch["updated"]) == [str(shown[2 * page]["id"])]
+        assert list_patch.size(patch) == 1
+        assert payload < record + 256
+        shown = shown + ROWS[24 * page : 24 * (page + 1)]
+        patch, payload = show(shown)
+        assert patch["appended"] == ROWS[24 * page : 24 * (page + 1)]
+        assert list_patch.size(patch) == 24
+        assert payload < 24 * record + 256
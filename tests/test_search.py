@@ -0,0 +1,113 @@
+import datetime
+import itertools
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from app.data import db, lease_expiry, ledger, rent_roll, repository, search, synthetic
+
+TODAY = datetime.date(2026, 10, 18)
+
+
+@pytest.fixture
+def connection(tmp_path, monkeypatch):
+    for module in (ledger, rent_roll, lease_expiry):
+        monkeypatch.setattr(module, "_cache", None)
+    monkeypatch.setattr(search, "_indexes", {})
+    connection = db.connect(str(tmp_path / "search.db"))
+    synthetic.load(connection, synthetic.generate(synthetic.Portfolio.of_size(2000)))
+    yield connection
+    connection.close()
+
+
+def rows(connection, query):
+    return [dict(row) for row in connection.execute(query)]
+
+
+def edit_units(connection, rng):
+    units = repository.UnitRepository(connection)
+    ids = [row["id"] for row in rows(connection, "SELECT id FROM units")]
+    for number in range(20):
+        units.add(
+            {
+                "property_name": synthetic.property_name(rng.randrange(1, 4)),
+                "unit_number": f"Q{number}7",
+                "rent_amount": 1200,
+                "tenant_name": f"Quincy Marsh {number}",
+                "rent_status": "Paid",
+                "lease_end": (TODAY + datetime.timedelta(days=3 * number)).isoformat(),
+                "archived": False,
+            }
+        )
+    for unit_id in rng.sample(ids, 40):
+        units.update(
+            unit_id,
+            {
+                "tenant_name": rng.choice([None, "Quincy Adams", "Mara Quill"]),
+                "lease_end": rng.choice(
+                    [
+                        None,
+                        (
+                            TODAY + datetime.timedelta(days=rng.randrange(120))
+                        ).isoformat(),
+                    ]
+                ),
+            },
+        )
+    units.update_many(rng.sample(ids, 60), {"archived": True})
+    units.update_many(rng.sample(ids, 20), {"archived": False})
+
+
+def reference_search(connection, kind, query):
+    fields = search.SEARCH_FIELDS[kind]
+    documents = {
+        row["id"]: search.tokenize(row[field] for field in fields)
+        for row in rows(connection, f"SELECT * FROM {search.SEARCH_TABLES[kind]}")
+    }
+    frequency = Counter(token for tokens in documents.values() for token in tokens)
+    scores = {}
+    for doc_id, tokens in documents.items():
+        total = 0.0
+        for term in set(search.TOKEN_PATTERN.findall(query.lower())):
+            weights = [
+                math.log(1 + len(documents) / frequency[token])
+                * (2.0 if token == term else 1.0)
+                for token in tokens
+                if token.startswith(term)
+            ]
+            if not weights:
+                break
+            total += max(weights)
+        else:
+            scores[doc_id] = total
+    return scores
+
+
+def test_search_index_matches_a_plain_scan_after_writes(connection):
+    rng = random.Random(11)
+    assert search.search(connection, "units", "quincy", 10) == []
+    index = search._indexes["units"]
+    before = dict(connection.execute("SELECT id, tenant_name FROM units"))
+    edit_units(connection, rng)
+    assert len(reference_search(connection, "units", "quincy")) >= 20
+    queries = ["quincy", "q1", "marsh quincy", "mara", "7", "sunset a"]
+    after = dict(connection.execute("SELECT id, tenant_name FROM units"))
+    replaced = [name for unit_id, name in before.items() if after[unit_id] != name]
+    names = [name.lower() for name in replaced if name][:10]
+    queries += names + [name.split()[-1] for name in names]
+    units = rows(connection, "SELECT unit_number, tenant_name FROM units LIMIT 200")
+    for unit in rng.sample(units, 10):
+        tokens = sorted(search.tokenize([unit["unit_number"], unit["tenant_name"]]))
+        queries.append(" ".join(token[:3] for token in tokens[:2]))
+    for query in queries:
+        found = search.search(connection, "units", query, 10_000)
+        assert search._indexes["units"] is index
+        expected = reference_search(connection, "units", query)
+        assert set(found) == set(expected), query
+        ranked = [expected[doc_id] for doc_id in found]
+        assert all(a >= b - 1e-9 for a, b in itertools.pairwise(ranked)), query
+        top = search.search(connection, "units", query, 10)
+        best = sorted(expected.values(), reverse=True)[:10]
+        assert [expected[doc_id] for doc_id in top] == pytest.approx(best), query
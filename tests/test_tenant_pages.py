@@ -0,0 +1,41 @@
+import pytest
+from reflex.state import State
+
+from app.data import cache, db, lease_expiry, ledger, rent_roll, synthetic
+from app.states import tenants
+from app.states.tenants import TenantsState
+
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    for module in (ledger, rent_roll, lease_expiry):
+        monkeypatch.setattr(module, "_cache", None)
+    monkeypatch.setattr(cache, "_views", cache.ViewCache(cache.LocalStore()))
+    connection = db.connect(str(tmp_path / "tenants.db"))
+    synthetic.load(connection, synthetic.generate(synthetic.Portfolio.of_size(500)))
+    monkeypatch.setattr(db._local, "connection", connection, raising=False)
+    root = State(_reflex_internal_init=True)
+    yield root.get_substate(TenantsState.get_full_name().split(".")[1:])
+    connection.close()
+
+
+def test_tenant_pages_cover_the_table_one_page_at_a_time(state):
+    everything = [
+        row["id"]
+        for row in db.get_connection().execute("SELECT id FROM tenants ORDER BY id")
+    ]
+    TenantsState.load.fn(state)
+    assert state.tenant_total == len(everything)
+    pages = [[tenant["id"] for tenant in state.tenants]]
+    while state.tenant_has_next_page:
+        TenantsState.next_tenant_page.fn(state)
+        pages.append([tenant["id"] for tenant in state.tenants])
+    assert len(pages) > 1
+    assert all(0 < len(page) <= tenants.TENANTS_PAGE_SIZE for page in pages)
+    assert [tenant_id for page in pages for tenant_id in page] == everything
+    assert state.tenant_page == state.tenant_page_count == len(pages)
+
+    for page in reversed(pages[:-1]):
+        TenantsState.prev_tenant_page.fn(state)
+        assert [tenant["id"] for tenant in state.tenants] == page
+    assert state.tenant_page == 1
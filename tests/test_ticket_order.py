@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from app.data import (
+    db,
+    lease_expiry,
+    ledger,
+    rent_roll,
+    repository,
+    search,
+    synthetic,
+    ticket_order,
+)
+
+ORDERS = [
+    (("oldest",), None),
+    (("status", "priority", "oldest"), None),
+    (("status", "priority", "oldest"), "Open"),
+    (("priority", "vendor", "newest"), "In Progress"),
+    (("property", "status", "vendor", "oldest"), None),
+    (("property", "status", "vendor", "oldest"), "Completed"),
+]
+REFERENCE_KEYS = {
+    "status": lambda t: ticket_order.STATUS_RANKS.get(t["status"], 3),
+    "priority": lambda t: ticket_order.PRIORITY_RANKS.get(t["priority"], 3),
+    "property": lambda t: t["property_name"].casefold(),
+    "vendor": lambda t: (t["vendor"] is None, (t["vendor"] or "").casefold()),
+    "newest": lambda t: -t["id"],
+    "oldest": lambda t: t["id"],
+}
+
+
+@pytest.fixture
+def connection(tmp_path, monkeypatch):
+    for module in (ledger, rent_roll, lease_expiry, ticket_order):
+        monkeypatch.setattr(module, "_cache", None)
+    monkeypatch.setattr(search, "_indexes", {})
+    connection = db.connect(str(tmp_path / "tickets.db"))
+    synthetic.load(connection, synthetic.generate(synthetic.Portfolio.of_size(2000)))
+    yield connection
+    connection.close()
+
+
+def rows(connection, query):
+    return [dict(row) for row in connection.execute(query)]
+
+
+def test_ticket_orders_match_a_plain_sort_after_writes(connection):
+    rng = random.Random(5)
+    for keys, status in ORDERS:
+        ticket_order.page(connection, keys, status, 0, 10)
+    orders = ticket_order._cache
+    tickets = repository.MaintenanceRepository(connection)
+    ids = [row["id"] for row in rows(connection, "SELECT id FROM maintenance_requests")]
+    for number in range(15):
+        tickets.add(
+            {
+                "property_name": synthetic.property_name(rng.randrange(1, 4)),
+                "unit": f"Q{number}",
+                "description": "Leaking pipe",
+                "priority": rng.choice(["High", "Medium", "Low"]),
+                "status": "Open",
+                "vendor": rng.choice([None, "QuickFix Plumbing", "ACME HVAC Services"]),
+            }
+        )
+    for request_id in rng.sample(ids, 40):
+        tickets.update(
+            request_id,
+            {
+                "status": rng.choice(["Open", "In Progress", "Completed"]),
+                "priority": rng.choice(["High", "Medium", "Low"]),
+                "vendor": rng.choice([None, "The Paint Squad", "Sparky Electricians"]),
+            },
+        )
+    tickets.update_many(rng.sample(ids, 50), {"status": "Completed"})
+
+    everything = rows(connection, "SELECT * FROM maintenance_requests")
+    assert len(ORDERS) <= ticket_order.MAX_CACHED_ORDERS
+    for keys, status in ORDERS:
+        matching = [t for t in everything if status is None or t["status"] == status]
+        expected = sorted(
+            matching,
+            key=lambda t: (*(REFERENCE_KEYS[key](t) for key in keys), t["id"]),
+        )
+        found = ticket_order.page(connection, keys, status, 0, -1)
+        assert found == [t["id"] for t in expected], (keys, status)
+        assert ticket_order.page(connection, keys, status, 7, 5) == found[7:12]
+    assert ticket_order._cache is orders
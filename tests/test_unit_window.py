@@ -0,0 +1,51 @@
+import pytest
+from reflex.state import State
+
+from app.data import cache, db, lease_expiry, ledger, rent_roll, synthetic
+from app.states import units
+from app.states.units import UnitsState
+
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    for module in (ledger, rent_roll, lease_expiry):
+        monkeypatch.setattr(module, "_cache", None)
+    monkeypatch.setattr(cache, "_views", cache.ViewCache(cache.LocalStore()))
+    connection = db.connect(str(tmp_path / "units.db"))
+    synthetic.load(connection, synthetic.generate(synthetic.Portfolio.of_size(3000)))
+    monkeypatch.setattr(db._local, "connection", connection, raising=False)
+    root = State(_reflex_internal_init=True)
+    state = root.get_substate(UnitsState.get_full_name().split(".")[1:])
+    UnitsState.toggle_unit_infinite_scroll.fn(state)
+    yield state
+    connection.close()
+
+
+def shown_ids(state):
+    return [unit["id"] for unit in state._shown_records("filtered_units")]
+
+
+def test_infinite_scroll_keeps_a_bounded_window(state):
+    everything = [
+        unit["id"]
+        for unit in db.get_connection().execute(
+            "SELECT id FROM units WHERE NOT archived ORDER BY id"
+        )
+    ]
+    for _ in range(10):
+        UnitsState.load_more_units.fn(state)
+        ids = shown_ids(state)
+        assert len(ids) <= units.UNITS_WINDOW_LIMIT
+        offset = state.unit_window_offset
+        assert ids == everything[offset : offset + len(ids)]
+    assert state.unit_has_previous_rows
+    assert len(shown_ids(state)) == units.UNITS_WINDOW_LIMIT
+
+    while state.unit_has_previous_rows:
+        UnitsState.load_previous_units.fn(state)
+        ids = shown_ids(state)
+        assert len(ids) <= units.UNITS_WINDOW_LIMIT
+        offset = state.unit_window_offset
+        assert ids == everything[offset : offset + len(ids)]
+    assert shown_ids(state)[0] == everything[0]
+    assert state.unit_has_next_page